@@ -8,7 +8,7 @@ from typing import Any, Dict, List, Optional
 
 from fastapi import Depends, FastAPI, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, Response
 from pydantic import BaseModel, Field
 
 from ..rag.property_rag_chain import (PropertyAnswer, PropertyRAGChain,
@@ -143,6 +143,7 @@ async def root():
             "search": "/search - Search properties by query",
             "recommend": "/recommend - Get property recommendations",
             "health": "/health - Health check",
+            "livez": "/livez - Liveness probe",
             "docs": "/docs - API documentation"
         }
     }
@@ -166,6 +167,12 @@ async def health_check(chain: PropertyRAGChain = Depends(get_rag_chain)):
         )
 
 
+@app.api_route("/livez", methods=["GET", "HEAD"])
+async def liveness_probe():
+    """Liveness probe that answers without touching the RAG chain."""
+    return Response(status_code=200)
+
+
 @app.post("/ask", response_model=QuestionResponse)
 async def ask_question(
     request: QuestionRequest,
@@ -3,8 +3,9 @@ LangChain RAG chain for property question answering with source citations.
 Supports both OpenAI and local GGUF models via llama.cpp.
 """
 import logging
+from collections import OrderedDict
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 from langchain_community.llms import LlamaCpp
 from langchain_core.documents import Document
@@ -41,7 +42,6 @@ def create_llm_model() -> BaseLanguageModel:
         if settings.use_gpu:
             gpu_params.update({
                 "n_gpu_layers": settings.gpu_layers,  # Offload layers to GPU
-                "n_batch": 256,  # Optimal batch size for RTX 3050
                 "n_ubatch": 128,  # Micro batch size for better memory management
                 "f16_kv": True,  # Use half precision for key-value cache
                 "use_mmap": True,  # Memory map model for faster loading
@@ -55,6 +55,7 @@ def create_llm_model() -> BaseLanguageModel:
             model_path=str(model_path),
             n_ctx=settings.local_llm_n_ctx,
             n_threads=settings.local_llm_n_threads,
+            n_batch=settings.local_llm_n_batch,  # 256 is optimal for RTX 3050
             temperature=0.0,  # Keep deterministic for speed
             max_tokens=400,  # Allow URLs but not too long
             verbose=False,
@@ -97,17 +98,26 @@ class PropertyRAGChain:
     def __init__(self, 
                  vector_store: PropertyVectorStore,
                  llm: Optional[BaseLanguageModel] = None,
-                 retrieval_k: int = 5):
+                 retrieval_k: int = 5,
+                 answer_cache_size: Optional[int] = None):
         """Initialize the RAG chain.
         
         Args:
             vector_store: FAISS vector store with property embeddings
             llm: Language model (defaults to OpenAI GPT or local GGUF based on config)
             retrieval_k: Number of documents to retrieve for context
+            answer_cache_size: Answers remembered for repeated questions
+                (defaults to settings.answer_cache_size, 0 disables caching)
         """
         self.vector_store = vector_store
         self.retrieval_k = retrieval_k
         
+        # Recently answered questions, most recent last; cleared whenever the
+        # underlying FAISS store is replaced (e.g. after rebuilding the index)
+        self.answer_cache_size = settings.answer_cache_size if answer_cache_size is None else answer_cache_size
+        self._answer_cache: "OrderedDict[Tuple[str, int], PropertyAnswer]" = OrderedDict()
+        self._answer_cache_store = None
+        
         # Initialize LLM (local or OpenAI based on configuration)
         if llm is not None:
             self.llm = llm
@@ -216,42 +226,123 @@ PROPIEDAD {i}:
         """
         logger.info(f"Processing property question: {question}")
         
+        cached = self._cached_answer(question)
+        if cached is not None:
+            logger.info("Answered from cache")
+            return cached
+        
         try:
             # Classify the query type
             query_type = self.classification_chain.invoke({"question": question}).strip().lower()
             
             # Retrieve relevant documents
-            relevant_docs = self.retriever.get_relevant_documents(question)
+            relevant_docs = self.retriever.invoke(question)
             
             # Generate answer using RAG chain
             answer = self.rag_chain.invoke(question)
             
-            # Extract sources from retrieved documents
-            sources = self._extract_sources(relevant_docs)
-            
-            # Calculate confidence based on retrieval quality
-            confidence = self._calculate_confidence(relevant_docs, question)
+            result = self._build_answer(question, answer, relevant_docs, query_type)
+            self._cache_answer(question, result)
             
-            result = PropertyAnswer(
-                answer=answer,
-                sources=sources,
-                confidence=confidence,
-                query_type=query_type,
-                property_count=len(relevant_docs)
-            )
-            
-            logger.info(f"Successfully processed question with {len(sources)} sources")
+            logger.info(f"Successfully processed question with {len(result.sources)} sources")
             return result
             
         except Exception as e:
             logger.error(f"Error processing question: {e}")
-            return PropertyAnswer(
-                answer=f"Lo siento, ocurrió un error al procesar tu pregunta: {str(e)}",
-                sources=[],
-                confidence=0.0,
-                query_type="error",
-                property_count=0
-            )
+            return self._error_answer(e)
+    
+    def ask_questions_batch(self, questions: List[str]) -> List[PropertyAnswer]:
+        """Answer several questions with one batched call per chain step.
+        
+        Classification, retrieval and generation each go through the
+        runnable's ``batch``, so the LLM backend receives all prompts at once
+        (concurrent requests for OpenAI, a single generate call for LlamaCpp)
+        instead of one round trip per question.
+        
+        Args:
+            questions: Natural language questions about properties
+            
+        Returns:
+            One PropertyAnswer per question, in the same order. A question
+            that fails gets an error answer without affecting the others.
+            Cached questions are answered without entering the batch.
+        """
+        results: List[Optional[PropertyAnswer]] = [self._cached_answer(q) for q in questions]
+        pending = [i for i, result in enumerate(results) if result is None]
+        if not pending:
+            return results
+        
+        pending_questions = [questions[i] for i in pending]
+        logger.info(f"Processing batch of {len(pending_questions)} property questions "
+                    f"({len(questions) - len(pending)} answered from cache)")
+        
+        query_types = self.classification_chain.batch(
+            [{"question": question} for question in pending_questions], return_exceptions=True
+        )
+        documents = self.retriever.batch(pending_questions, return_exceptions=True)
+        answers = self.rag_chain.batch(pending_questions, return_exceptions=True)
+        
+        for i, query_type, relevant_docs, answer in zip(pending, query_types, documents, answers):
+            question = questions[i]
+            error = next((r for r in (query_type, relevant_docs, answer) if isinstance(r, Exception)), None)
+            if error is not None:
+                logger.error(f"Error processing question '{question}': {error}")
+                results[i] = self._error_answer(error)
+            else:
+                results[i] = self._build_answer(question, answer, relevant_docs, query_type.strip().lower())
+                self._cache_answer(question, results[i])
+        
+        return results
+    
+    def _cached_answer(self, question: str) -> Optional[PropertyAnswer]:
+        """Return a copy of the cached answer for a question, if any.
+        
+        Copies are handed out because callers such as the API trim the
+        sources of the answer they receive.
+        """
+        if self._answer_cache_store is not self.vector_store.vector_store:
+            self._answer_cache.clear()
+            self._answer_cache_store = self.vector_store.vector_store
+        
+        key = (question, self.retrieval_k)
+        answer = self._answer_cache.get(key)
+        if answer is None:
+            return None
+        self._answer_cache.move_to_end(key)
+        return answer.model_copy(deep=True)
+    
+    def _cache_answer(self, question: str, answer: PropertyAnswer) -> None:
+        """Remember a successful answer, evicting the least recently used one when full."""
+        if self.answer_cache_size <= 0:
+            return
+        self._answer_cache[(question, self.retrieval_k)] = answer.model_copy(deep=True)
+        if len(self._answer_cache) > self.answer_cache_size:
+            self._answer_cache.popitem(last=False)
+    
+    def _build_answer(self,
+                      question: str,
+                      answer: str,
+                      relevant_docs: List[Document],
+                      query_type: str) -> PropertyAnswer:
+        """Assemble a PropertyAnswer with sources and confidence from retrieved documents."""
+        return PropertyAnswer(
+            answer=answer,
+            sources=self._extract_sources(relevant_docs),
+            confidence=self._calculate_confidence(relevant_docs, question),
+            query_type=query_type,
+            property_count=len(relevant_docs)
+        )
+    
+    @staticmethod
+    def _error_answer(error: Exception) -> PropertyAnswer:
+        """Answer returned to the user when processing a question fails."""
+        return PropertyAnswer(
+            answer=f"Lo siento, ocurrió un error al procesar tu pregunta: {str(error)}",
+            sources=[],
+            confidence=0.0,
+            query_type="error",
+            property_count=0
+        )
     
     def _extract_sources(self, documents: List[Document]) -> List[Dict[str, Any]]:
         """Extract source information from retrieved documents.
@@ -6,6 +6,7 @@ import logging
 import re
 from datetime import datetime
 from typing import Any, Dict, List, Optional
+from urllib.parse import urljoin
 
 from selenium.common.exceptions import (NoSuchElementException,
                                         StaleElementReferenceException,
@@ -24,6 +25,10 @@ from .data_parser import DataParser
 
 logger = logging.getLogger(__name__)
 
+# Patrones usados por cada elemento/departamento procesado, compilados una sola vez
+_PISO_RE = re.compile(r'Piso\s*(\d+)', re.IGNORECASE)
+_UNIT_NUMBER_RE = re.compile(r'^(\d+)')
+
 
 class AssetPlanExtractorV2:
     """
@@ -62,10 +67,25 @@ class AssetPlanExtractorV2:
         self._click_count = 0
         self._click_start_time = None
         
+        # HTML fetched without the browser, keyed by URL (see preload_html)
+        self._preloaded_html: Dict[str, str] = {}
+        
         # Legacy properties for backward compatibility
         self.wait = self.navigation_manager.wait
         self.fast_wait = self.navigation_manager.fast_wait
     
+    def preload_html(self, html_by_url: Dict[str, str]) -> None:
+        """Provide page HTML fetched outside the browser.
+        
+        Listing pages found here are parsed directly instead of being loaded
+        with ``driver.get``; pages without building cards still go through
+        Selenium.
+        
+        Args:
+            html_by_url: Mapping of URL to HTML body
+        """
+        self._preloaded_html.update(html_by_url)
+    
     def enable_debug_mode(self, enabled: bool = True):
         """Enable or disable debug mode with visual indicators."""
         self.debug_mode = enabled
@@ -558,11 +578,10 @@ class AssetPlanExtractorV2:
         else:
             logger.info(f"⚡ EXTREMO: {max_properties} props{f', {max_typologies} tipologías' if max_typologies else ''}")
         
-        # Paso 1: Navegar a la página de búsqueda
-        self._navigate_to_search_page()
-        
-        # Paso 2: Extraer lista de edificios (tarjetas de edificio)
-        building_cards = self._extract_building_cards()
+        # Paso 1-2: Obtener lista de edificios. El modo multi-tipología vuelve
+        # atrás a la lista, así que requiere que el navegador la haya cargado.
+        multi_typology = bool(max_typologies and max_typologies > 1)
+        building_cards = self.collect_building_cards(use_preloaded=not multi_typology)
         if not self.extreme_mode:
             logger.info(f"🏢 {len(building_cards)} edificios encontrados")
         else:
@@ -573,7 +592,7 @@ class AssetPlanExtractorV2:
             return self._extract_properties_alternative_method(max_properties)
         
         # Paso 3: Procesar edificios para obtener departamentos
-        if max_typologies and max_typologies > 1:
+        if multi_typology:
             # Modo MULTI-TIPOLOGÍA: extraer de múltiples edificios
             properties = self._extract_from_multiple_buildings(
                 building_cards, max_properties, max_typologies
@@ -619,6 +638,59 @@ class AssetPlanExtractorV2:
         else:
             logger.info(f"⚡ FIN: {len(properties)} props")
         
+        return self.build_collection(properties)
+    
+    def collect_building_cards(self, use_preloaded: bool = True) -> List[Dict[str, Any]]:
+        """
+        Obtiene las tarjetas de edificios de la página de búsqueda, desde el
+        HTML precargado si trae tarjetas o navegando con el driver.
+        
+        Args:
+            use_preloaded: Si se permite usar el HTML precargado
+            
+        Returns:
+            Lista de datos de edificios
+        """
+        if use_preloaded:
+            building_cards = self._extract_building_cards_from_html(self._preloaded_html.get(self.search_url))
+            if building_cards:
+                return building_cards
+        
+        # Paso 1: Navegar a la página de búsqueda
+        self._navigate_to_search_page()
+        
+        # Paso 2: Extraer lista de edificios (tarjetas de edificio)
+        return self._extract_building_cards()
+    
+    def process_building(self, building_data: Dict[str, Any], max_props: int) -> List[Property]:
+        """
+        Valida y procesa un edificio con el driver de este extractor.
+        
+        Permite repartir edificios entre varios extractores, cada uno con su
+        propio driver.
+        
+        Args:
+            building_data: Datos de la tarjeta del edificio
+            max_props: Máximo de propiedades a extraer del edificio
+            
+        Returns:
+            Propiedades extraídas (vacío si el edificio no es válido)
+        """
+        if not self._validate_building_data(building_data):
+            logger.debug(f"Edificio {building_data.get('name', 'unknown')} no pasó validación")
+            return []
+        return self._process_building(building_data, max_props)
+    
+    def build_collection(self, properties: List[Property]) -> PropertyCollection:
+        """
+        Crea la colección agrupando propiedades por tipología para compartir imágenes.
+        
+        Args:
+            properties: Propiedades extraídas
+            
+        Returns:
+            Colección con propiedades y tipologías
+        """
         # Crear colección optimizada
         collection = PropertyCollection(
             scraped_at=datetime.now().isoformat(),
@@ -871,6 +943,55 @@ class AssetPlanExtractorV2:
         
         return available_types
     
+    def _extract_building_cards_from_html(self, html: Optional[str]) -> List[Dict[str, Any]]:
+        """
+        Extrae las tarjetas de edificios desde HTML ya descargado, con los
+        mismos campos que _extract_building_card_data.
+        
+        Returns:
+            Lista de edificios; vacía si el HTML no trae tarjetas renderizadas
+        """
+        if not html:
+            return []
+        
+        from bs4 import BeautifulSoup
+        
+        soup = BeautifulSoup(html, "html.parser")
+        building_cards = []
+        
+        for card in soup.select("div.building-card[data-building]"):
+            name_link = (card.select_one("a.text-neutral-800.lg\\:text-base")
+                         or card.select_one("a[href*='/edificio/']"))
+            if not name_link or not name_link.get('href'):
+                continue
+            
+            address_elem = card.select_one("span.text-neutral-500")
+            price_elem = card.select_one("p.text-lg.font-bold")
+            img_elem = card.select_one("li.splide__slide img")
+            
+            building_cards.append({
+                'building_id': card.get('data-building'),
+                'name': name_link.get_text(strip=True),
+                'url': urljoin(self.base_url, name_link['href']),
+                'address': address_elem.get_text(strip=True) if address_elem else None,
+                'price_from': price_elem.get_text(strip=True) if price_elem else None,
+                'image_url': img_elem.get('src') if img_elem else None,
+                'promotions': [
+                    text for text in (span.get_text(strip=True) for span in card.select("div.badge_promos span"))
+                    if text
+                ],
+                'available_types': [
+                    {'url': urljoin(self.base_url, link['href']), 'text': link.get_text(strip=True), 'available': True}
+                    for link in card.select("div.space-y-1\\.5 > a[href]")
+                    if 'grayscale' not in link.get('class', [])
+                ]
+            })
+        
+        if building_cards:
+            logger.info(f"⚡ {len(building_cards)} edificios desde HTML precargado")
+        
+        return building_cards
+    
     def _process_building(self, building_data: Dict[str, Any], max_props: int) -> List[Property]:
         """
         Procesa un edificio completo para extraer sus departamentos.
@@ -1551,7 +1672,7 @@ class AssetPlanExtractorV2:
                 
                 # Extraer piso
                 if 'Piso' in detail:
-                    floor_match = re.search(r'Piso\s*(\d+)', detail, re.IGNORECASE)
+                    floor_match = _PISO_RE.search(detail)
                     if floor_match:
                         try:
                             floor = int(floor_match.group(1))
@@ -1911,14 +2032,13 @@ class AssetPlanExtractorV2:
                 logger.debug("🏢 Demasiados elementos con 'Piso', saltando extracción por rendimiento")
                 return None
             
-            import re
             for element in elements[:5]:  # Máximo 5 elementos para mantener velocidad
                 try:
                     text = element.text.strip()
                     if len(text) > 100:  # Saltar textos muy largos
                         continue
                         
-                    match = re.search(r'Piso\s*(\d+)', text, re.IGNORECASE)
+                    match = _PISO_RE.search(text)
                     if match:
                         floor = int(match.group(1))
                         if 1 <= floor <= 50:
@@ -1946,10 +2066,8 @@ class AssetPlanExtractorV2:
             return None
             
         try:
-            import re
-
             # Buscar patrón de números al inicio (antes de cualquier letra o guión)
-            match = re.match(r'^(\d+)', str(unit_number).strip())
+            match = _UNIT_NUMBER_RE.match(str(unit_number).strip())
             if match:
                 number_part = match.group(1)
                 
@@ -8,7 +8,7 @@ from dataclasses import dataclass
 from datetime import datetime, timedelta
 from enum import Enum
 from functools import wraps
-from typing import Any, Callable, Dict, List, Optional
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple, Type
 
 logger = logging.getLogger(__name__)
 
@@ -155,16 +155,16 @@ class RetryManager:
     def execute_with_retry(self,
                           func: Callable,
                           *args,
-                          retry_on: Optional[List[type]] = None,
-                          no_retry_on: Optional[List[type]] = None,
+                          retry_on: Optional[Sequence[Type[BaseException]]] = None,
+                          no_retry_on: Optional[Sequence[Type[BaseException]]] = None,
                           **kwargs) -> Any:
         """Execute function with retry logic.
         
         Args:
             func: Function to execute
             *args: Function arguments
-            retry_on: Exception types to retry on
-            no_retry_on: Exception types to never retry on
+            retry_on: Exception types to retry on (tuples are used as-is)
+            no_retry_on: Exception types to never retry on (tuples are used as-is)
             **kwargs: Function keyword arguments
             
         Returns:
@@ -176,8 +176,9 @@ class RetryManager:
         if not self.circuit_breaker.can_execute():
             raise Exception("Circuit breaker is OPEN")
         
-        retry_on = retry_on or [Exception]
-        no_retry_on = no_retry_on or [NonRetryableException]
+        # Tuples so each check is a single isinstance() call
+        retry_on: Tuple[Type[BaseException], ...] = tuple(retry_on) if retry_on else (Exception,)
+        no_retry_on: Tuple[Type[BaseException], ...] = tuple(no_retry_on) if no_retry_on else (NonRetryableException,)
         
         last_exception = None
         attempt = 0
@@ -198,14 +199,14 @@ class RetryManager:
                 last_exception = e
                 
                 # Check if this exception should not be retried
-                if any(isinstance(e, exc_type) for exc_type in no_retry_on):
+                if isinstance(e, no_retry_on):
                     logger.info(f"Non-retryable exception: {type(e).__name__}")
                     self.circuit_breaker.record_failure()
                     self._record_retry_failure(func.__name__, attempt, str(e), retryable=False)
                     raise e
                 
                 # Check if this exception should be retried
-                if not any(isinstance(e, exc_type) for exc_type in retry_on):
+                if not isinstance(e, retry_on):
                     logger.info(f"Exception not in retry list: {type(e).__name__}")
                     self.circuit_breaker.record_failure()
                     self._record_retry_failure(func.__name__, attempt, str(e), retryable=False)
@@ -377,8 +378,8 @@ class RetryManager:
 
 
 def retry_on_exception(retry_config: Optional[RetryConfig] = None,
-                      retry_on: Optional[List[type]] = None,
-                      no_retry_on: Optional[List[type]] = None):
+                      retry_on: Optional[Sequence[Type[BaseException]]] = None,
+                      no_retry_on: Optional[Sequence[Type[BaseException]]] = None):
     """Decorator for automatic retry on exceptions.
     
     Args:
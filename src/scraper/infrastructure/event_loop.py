@@ -0,0 +1,61 @@
+"""
+Event loop helper for the scraper's synchronous entry points into asyncio.
+"""
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from typing import Awaitable, Callable, Optional, TypeVar
+
+try:
+    import uvloop
+except ImportError:  # pragma: no cover - uvloop is not available on Windows
+    uvloop = None
+
+T = TypeVar("T")
+
+
+def _loop_factory() -> Optional[Callable[[], asyncio.AbstractEventLoop]]:
+    """uvloop's loop factory if installed, else None (default asyncio loop)."""
+    return uvloop.new_event_loop if uvloop is not None else None
+
+
+def run(coro: Awaitable[T]) -> T:
+    """Run ``coro`` to completion on a fresh event loop, like ``asyncio.run``.
+    
+    Uses uvloop when it is installed. The loop is created per call instead of
+    installing a global event loop policy, so other asyncio users in the same
+    process (FastAPI, test runners) keep their own loops. Called from inside
+    a running loop (an async handler, a notebook), the coroutine gets its own
+    loop on a worker thread instead of failing.
+    
+    Args:
+        coro: Coroutine to run
+        
+    Returns:
+        The coroutine's result
+    """
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return _run_in_new_loop(coro)
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        return executor.submit(_run_in_new_loop, coro).result()
+
+
+def _run_in_new_loop(coro: Awaitable[T]) -> T:
+    """Run ``coro`` on a new loop in the current (loop-free) thread."""
+    factory = _loop_factory()
+    if hasattr(asyncio, "Runner"):
+        with asyncio.Runner(loop_factory=factory) as runner:
+            return runner.run(coro)
+
+    # Python < 3.11: no asyncio.Runner, drive a private loop by hand
+    if factory is None:
+        return asyncio.run(coro)
+    loop = factory()
+    try:
+        return loop.run_until_complete(coro)
+    finally:
+        try:
+            loop.run_until_complete(loop.shutdown_asyncgens())
+        finally:
+            loop.close()
@@ -0,0 +1,75 @@
+"""
+Conditional-GET cache for pages fetched by the HTTP fast path.
+"""
+import logging
+import sqlite3
+import threading
+from pathlib import Path
+from typing import Dict, NamedTuple, Optional, Union
+
+logger = logging.getLogger(__name__)
+
+
+class CachedPage(NamedTuple):
+    """Stored response body and its validators."""
+    body: str
+    etag: Optional[str]
+    last_modified: Optional[str]
+
+
+class HTTPCache:
+    """SQLite store of page bodies keyed by URL, revalidated with ETag/Last-Modified."""
+
+    def __init__(self, path: Union[str, Path]):
+        """Open (or create) the cache database.
+
+        Args:
+            path: SQLite file path; ":memory:" keeps the cache in memory
+        """
+        if str(path) != ":memory:":
+            Path(path).parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(str(path), check_same_thread=False)
+        self._lock = threading.Lock()
+        with self._lock, self._conn:
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS pages ("
+                "url TEXT PRIMARY KEY, etag TEXT, last_modified TEXT, body TEXT NOT NULL)"
+            )
+
+    def get(self, url: str) -> Optional[CachedPage]:
+        """Return the cached page for ``url``, if any."""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT body, etag, last_modified FROM pages WHERE url = ?", (url,)
+            ).fetchone()
+        return CachedPage(*row) if row else None
+
+    def conditional_headers(self, url: str) -> Dict[str, str]:
+        """Build If-None-Match / If-Modified-Since headers for ``url``.
+
+        Returns:
+            Request headers (empty if the page is not cached or has no validators)
+        """
+        page = self.get(url)
+        headers = {}
+        if page:
+            if page.etag:
+                headers["If-None-Match"] = page.etag
+            if page.last_modified:
+                headers["If-Modified-Since"] = page.last_modified
+        return headers
+
+    def store(self, url: str, body: str, etag: Optional[str], last_modified: Optional[str]) -> None:
+        """Store a response; pages without validators can't be revalidated and are skipped."""
+        if not etag and not last_modified:
+            return
+        with self._lock, self._conn:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO pages (url, etag, last_modified, body) VALUES (?, ?, ?, ?)",
+                (url, etag, last_modified, body)
+            )
+
+    def close(self) -> None:
+        """Close the database connection."""
+        with self._lock:
+            self._conn.close()
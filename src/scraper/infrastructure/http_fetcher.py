@@ -0,0 +1,139 @@
+"""
+Lightweight HTTP fetcher for server-rendered pages that do not need a browser.
+"""
+import asyncio
+import logging
+from typing import Dict, Iterable, Optional, Set
+
+from . import event_loop
+from .http_cache import HTTPCache
+
+try:
+    import aiohttp
+except ImportError:  # pragma: no cover - optional fast path
+    aiohttp = None
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_HEADERS = {
+    "User-Agent": (
+        "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 "
+        "(KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
+    ),
+    "Accept": "text/html,application/xhtml+xml",
+    "Accept-Language": "es-CL,es;q=0.9",
+}
+
+
+class HTMLFetcher:
+    """Fetch HTML pages concurrently over a shared keep-alive connection pool."""
+
+    def __init__(self,
+                 timeout: float = 10.0,
+                 max_connections: int = 50,
+                 headers: Optional[Dict[str, str]] = None,
+                 cache: Optional[HTTPCache] = None):
+        """Initialize the fetcher.
+
+        Args:
+            timeout: Total timeout per request in seconds
+            max_connections: Maximum simultaneous connections
+            headers: Request headers (defaults to a desktop browser profile)
+            cache: Conditional-GET cache; unchanged pages are served from it
+        """
+        self.timeout = timeout
+        self.max_connections = max_connections
+        self.headers = headers or DEFAULT_HEADERS
+        self.cache = cache
+        self.not_modified: Set[str] = set()
+        self._session = None
+
+    @staticmethod
+    def is_available() -> bool:
+        """Return True if aiohttp is installed."""
+        return aiohttp is not None
+
+    async def __aenter__(self) -> "HTMLFetcher":
+        connector = aiohttp.TCPConnector(limit=self.max_connections, keepalive_timeout=30)
+        self._session = aiohttp.ClientSession(
+            connector=connector,
+            headers=self.headers,
+            timeout=aiohttp.ClientTimeout(total=self.timeout)
+        )
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb) -> None:
+        await self._session.close()
+        self._session = None
+
+    async def fetch(self, url: str) -> Optional[str]:
+        """Fetch a single page.
+
+        Args:
+            url: Page URL
+
+        Returns:
+            Response body (from the cache on 304 Not Modified), or None on
+            HTTP or network errors
+        """
+        request_headers = self.cache.conditional_headers(url) if self.cache else None
+        try:
+            async with self._session.get(url, headers=request_headers) as response:
+                if response.status == 304 and self.cache:
+                    cached = self.cache.get(url)
+                    if cached:
+                        self.not_modified.add(url)
+                        return cached.body
+                if response.status != 200:
+                    logger.debug(f"Fast fetch of {url} returned HTTP {response.status}")
+                    return None
+                body = await response.text()
+                if self.cache:
+                    self.cache.store(
+                        url, body, response.headers.get("ETag"), response.headers.get("Last-Modified")
+                    )
+                return body
+        except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+            logger.debug(f"Fast fetch of {url} failed: {e}")
+            return None
+
+    async def fetch_all(self, urls: Iterable[str]) -> Dict[str, Optional[str]]:
+        """Fetch several pages concurrently.
+
+        Args:
+            urls: Page URLs
+
+        Returns:
+            Mapping of URL to response body (None for failed pages)
+        """
+        urls = list(dict.fromkeys(urls))
+        bodies = await asyncio.gather(*(self.fetch(url) for url in urls))
+        return dict(zip(urls, bodies))
+
+
+def prefetch_html(urls: Iterable[str],
+                  timeout: float = 10.0,
+                  cache: Optional[HTTPCache] = None) -> Dict[str, str]:
+    """Synchronously fetch pages that can be parsed without a browser.
+
+    Args:
+        urls: Page URLs
+        timeout: Total timeout per request in seconds
+        cache: Conditional-GET cache to revalidate against
+
+    Returns:
+        Mapping of URL to HTML for the pages that were fetched successfully;
+        empty if aiohttp is not installed
+    """
+    if not HTMLFetcher.is_available():
+        return {}
+
+    async def _run() -> Dict[str, Optional[str]]:
+        async with HTMLFetcher(timeout=timeout, cache=cache) as fetcher:
+            pages = await fetcher.fetch_all(urls)
+        if fetcher.not_modified:
+            logger.info(f"{len(fetcher.not_modified)} pages not modified, served from cache")
+        return pages
+
+    pages = event_loop.run(_run())
+    return {url: html for url, html in pages.items() if html}
@@ -5,6 +5,7 @@ import logging
 import math
 import random
 import time
+from types import MappingProxyType
 from typing import List, Tuple
 
 from selenium.webdriver.common.action_chains import ActionChains
@@ -286,6 +287,14 @@ class BehaviorConfig:
     SLOW = {"speed_factor": 2.0, "scroll_pause": 2.0, "read_speed": 150}
     VERY_SLOW = {"speed_factor": 3.0, "scroll_pause": 3.0, "read_speed": 100}
     
+    # Mode lookup table, built once with the class
+    _MODES = MappingProxyType({
+        "fast": FAST,
+        "normal": NORMAL,
+        "slow": SLOW,
+        "very_slow": VERY_SLOW
+    })
+    
     @classmethod
     def get_config(cls, mode: str = "normal") -> dict:
         """Get behavior configuration by mode.
@@ -296,10 +305,4 @@ class BehaviorConfig:
         Returns:
             Configuration dictionary
         """
-        configs = {
-            "fast": cls.FAST,
-            "normal": cls.NORMAL,
-            "slow": cls.SLOW,
-            "very_slow": cls.VERY_SLOW
-        }
-        return configs.get(mode, cls.NORMAL)
\ No newline at end of file
+        return cls._MODES.get(mode, cls.NORMAL)
\ No newline at end of file
@@ -180,9 +180,19 @@ class PerformanceMonitor:
     
     def record_property_scraped(self) -> None:
         """Record that a property was successfully scraped."""
+        self.record_properties_scraped(1)
+    
+    def record_properties_scraped(self, count: int) -> None:
+        """Record a batch of successfully scraped properties at once.
+        
+        Args:
+            count: Number of properties scraped
+        """
+        if count <= 0:
+            return
         with self._lock:
-            self.scraping_metrics.total_properties_scraped += 1
-            self.property_timestamps.append(datetime.now())
+            self.scraping_metrics.total_properties_scraped += count
+            self.property_timestamps.extend([datetime.now()] * count)
             self._update_throughput()
     
     def _update_average_response_time(self) -> None:
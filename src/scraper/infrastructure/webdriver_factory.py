@@ -1,17 +1,29 @@
 """
 Professional WebDriver Factory with optimized configurations.
 """
+import asyncio
 import logging
+import os
 import random
-from typing import Any, Dict, Optional
+import shutil
+import tempfile
+from contextlib import asynccontextmanager
+from http.client import HTTPException
+from typing import Any, AsyncIterator, Dict, List, Optional
+from urllib.error import URLError
 
 from selenium import webdriver
+from selenium.common.exceptions import TimeoutException, WebDriverException
 from selenium.webdriver.chrome.options import Options as ChromeOptions
 from selenium.webdriver.chrome.service import Service
 from selenium.webdriver.firefox.options import Options as FirefoxOptions
+from selenium.webdriver.support.ui import WebDriverWait
 
 logger = logging.getLogger(__name__)
 
+# Errors raised when talking to a crashed browser or a dead chromedriver
+DRIVER_CONNECTION_ERRORS = (WebDriverException, URLError, HTTPException, ConnectionError)
+
 
 class WebDriverFactory:
     """Factory for creating optimized WebDriver instances."""
@@ -30,6 +42,44 @@ class WebDriverFactory:
         "1920,1080", "1366,768", "1536,864", "1440,900", "1280,720"
     ]
     
+    # Pre-formatted Chrome arguments so driver restarts don't rebuild them
+    _UA_ARGS = tuple(f"--user-agent={ua}" for ua in USER_AGENTS)
+    _SIZE_ARGS = tuple(f"--window-size={size}" for size in SCREEN_SIZES)
+    
+    # Fixed arguments applied to every Chrome instance (stability + memory)
+    _BASE_CHROME_ARGS = (
+        "--no-sandbox",
+        "--disable-dev-shm-usage",
+        "--disable-gpu",
+        "--disable-extensions",
+        "--disable-plugins",
+        "--memory-pressure-off",
+        "--max_old_space_size=4096",
+    )
+    
+    # Performance optimizations (skipped in debug mode)
+    _PERFORMANCE_CHROME_ARGS = (
+        "--disable-images",
+        "--disable-css",
+        "--no-default-browser-check",
+        "--disable-default-apps",
+        "--disable-background-networking",
+        "--disable-sync",
+        "--metrics-recording-only",
+        "--no-first-run",
+        # Keep headless renderers unthrottled (background tabs/timers)
+        "--no-zygote",
+        "--disable-renderer-backgrounding",
+        "--disable-backgrounding-occluded-windows",
+        "--disable-background-timer-throttling",
+        # No site isolation: one renderer per site instead of per frame/origin
+        "--disable-features=TranslateUI,BlinkGenPropertyTrees,IsolateOrigins,site-per-process",
+        "--process-per-site",
+        "--disable-ipc-flooding-protection",
+        "--mute-audio",
+        "--hide-scrollbars",
+    )
+    
     @classmethod
     def create_chrome_driver(
         cls,
@@ -37,7 +87,11 @@ class WebDriverFactory:
         stealth_mode: bool = True,
         performance_optimized: bool = True,
         debug_mode: bool = False,
-        custom_options: Optional[Dict[str, Any]] = None
+        custom_options: Optional[Dict[str, Any]] = None,
+        user_data_dir: Optional[str] = None,
+        single_process: bool = False,
+        disable_js: bool = False,
+        connection_pool_size: Optional[int] = None
     ) -> webdriver.Chrome:
         """Create an optimized Chrome WebDriver instance.
         
@@ -46,34 +100,36 @@ class WebDriverFactory:
             stealth_mode: Apply anti-detection measures
             performance_optimized: Apply performance optimizations
             custom_options: Additional custom options
+            user_data_dir: Profile directory (made absolute; relative paths
+                slow headless Chrome down dramatically)
+            single_process: Run browser and renderer in one process to cut
+                memory on constrained hosts (unstable on some sites)
+            disable_js: Disable JavaScript with the performance options
+                (breaks JS-rendered detail pages)
+            connection_pool_size: Max HTTP connections to chromedriver
+                (None keeps Selenium's default of one)
             
         Returns:
             Configured Chrome WebDriver
         """
         options = ChromeOptions()
+        # Return from get() once the DOM is parsed, not after every image/font
+        options.page_load_strategy = "eager"
         
         # Basic configuration
         if headless:
             options.add_argument("--headless=new")  # Use new headless mode
         
-        # Essential stability options
-        options.add_argument("--no-sandbox")
-        options.add_argument("--disable-dev-shm-usage")
-        options.add_argument("--disable-gpu")
-        options.add_argument("--disable-extensions")
-        options.add_argument("--disable-plugins")
+        # Fixed stability/memory options, built once at class load
+        options.arguments.extend(cls._BASE_CHROME_ARGS)
         
         # Performance optimizations (disabled in debug mode)
         if performance_optimized and not debug_mode:
-            options.add_argument("--disable-images")
-            options.add_argument("--disable-javascript")  # We'll enable if needed
-            options.add_argument("--disable-css")
-            options.add_argument("--no-default-browser-check")
-            options.add_argument("--disable-default-apps")
-            options.add_argument("--disable-background-networking")
-            options.add_argument("--disable-sync")
-            options.add_argument("--metrics-recording-only")
-            options.add_argument("--no-first-run")
+            options.arguments.extend(cls._PERFORMANCE_CHROME_ARGS)
+            if single_process:
+                options.add_argument("--single-process")
+            if disable_js:
+                options.add_argument("--disable-javascript")
         
         # Debug mode configuration
         if debug_mode:
@@ -94,29 +150,28 @@ class WebDriverFactory:
             options.add_experimental_option("excludeSwitches", ["enable-automation"])
             options.add_experimental_option('useAutomationExtension', False)
             
-            # Random user agent
-            user_agent = random.choice(cls.USER_AGENTS)
-            options.add_argument(f"--user-agent={user_agent}")
+            # Random user agent and screen size
+            options.add_argument(random.choice(cls._UA_ARGS))
+            options.add_argument(random.choice(cls._SIZE_ARGS))
             
-            # Random screen size
-            screen_size = random.choice(cls.SCREEN_SIZES)
-            options.add_argument(f"--window-size={screen_size}")
-            
-        # Memory optimizations
-        options.add_argument("--memory-pressure-off")
-        options.add_argument("--max_old_space_size=4096")
+        # Persistent profile so HTTP/disk cache survives driver restarts
+        if user_data_dir:
+            user_data_dir = os.path.abspath(user_data_dir)
+            options.add_argument(f"--user-data-dir={user_data_dir}")
+            options.add_argument(f"--disk-cache-dir={os.path.join(user_data_dir, 'cache')}")
+            options.add_argument("--disk-cache-size=52428800")  # 50 MB
         
-        # Custom options
-        if custom_options:
-            for key, value in custom_options.items():
-                if isinstance(value, bool) and value:
-                    options.add_argument(f"--{key}")
-                elif value:
-                    options.add_argument(f"--{key}={value}")
+        # Custom options (falsy values are skipped, True becomes a bare flag)
+        for key, value in (custom_options or {}).items():
+            if not value:
+                continue
+            options.add_argument(f"--{key}" if value is True else f"--{key}={value}")
         
         try:
             service = Service()
             driver = webdriver.Chrome(service=service, options=options)
+            if connection_pool_size:
+                cls._resize_connection_pool(driver, connection_pool_size)
             
             # Additional stealth measures
             if stealth_mode:
@@ -124,7 +179,7 @@ class WebDriverFactory:
                 
             # Set timeouts (más generosos para debug y scraping)
             driver.implicitly_wait(15)  # Aumentado de 10 a 15
-            driver.set_page_load_timeout(60)  # Aumentado de 30 a 60
+            driver.set_page_load_timeout(20)  # Eager strategy returns at DOMContentLoaded
             driver.set_script_timeout(45)  # Aumentado de 30 a 45
             
             logger.info(f"Chrome WebDriver created successfully (headless={headless}, stealth={stealth_mode})")
@@ -139,7 +194,8 @@ class WebDriverFactory:
         cls,
         headless: bool = True,
         stealth_mode: bool = True,
-        performance_optimized: bool = True
+        performance_optimized: bool = True,
+        connection_pool_size: Optional[int] = None
     ) -> webdriver.Firefox:
         """Create an optimized Firefox WebDriver instance.
         
@@ -147,6 +203,8 @@ class WebDriverFactory:
             headless: Run in headless mode
             stealth_mode: Apply anti-detection measures
             performance_optimized: Apply performance optimizations
+            connection_pool_size: Max HTTP connections to geckodriver
+                (None keeps Selenium's default of one)
             
         Returns:
             Configured Firefox WebDriver
@@ -179,6 +237,8 @@ class WebDriverFactory:
             
         try:
             driver = webdriver.Firefox(options=options)
+            if connection_pool_size:
+                cls._resize_connection_pool(driver, connection_pool_size)
             driver.implicitly_wait(10)
             driver.set_page_load_timeout(30)
             driver.set_script_timeout(30)
@@ -190,6 +250,51 @@ class WebDriverFactory:
             logger.error(f"Failed to create Firefox WebDriver: {e}")
             raise
     
+    @staticmethod
+    def _resize_connection_pool(driver: webdriver.Remote, pool_size: int) -> None:
+        """Rebuild the driver's urllib3 pool so concurrent commands don't queue.
+        
+        Local drivers create their RemoteConnection internally with a pool of
+        one connection; commands issued from several threads then wait on it
+        and log "Connection pool is full" warnings.
+        
+        Args:
+            driver: WebDriver instance
+            pool_size: Maximum connections kept to the driver service
+        """
+        executor = driver.command_executor
+        client_config = getattr(executor, "_client_config", None)
+        if client_config is None or not client_config.keep_alive:
+            return
+        
+        client_config.init_args_for_pool_manager = {"init_args_for_pool_manager": {"maxsize": pool_size}}
+        previous_pool = executor._conn
+        executor._conn = executor._get_connection_manager()
+        previous_pool.clear()
+    
+    @staticmethod
+    def wait_for_dom_content(driver: webdriver.Remote, timeout: float = 20.0) -> bool:
+        """Wait until the current document has been parsed.
+        
+        Complements the eager page load strategy for navigations that don't go
+        through ``driver.get`` (clicks, history navigation).
+        
+        Args:
+            driver: WebDriver instance
+            timeout: Maximum seconds to wait
+            
+        Returns:
+            True if DOMContentLoaded fired before the timeout
+        """
+        try:
+            WebDriverWait(driver, timeout, poll_frequency=0.1).until(
+                lambda d: d.execute_script("return document.readyState") in ("interactive", "complete")
+            )
+            return True
+        except TimeoutException:
+            logger.warning(f"DOM content not ready after {timeout}s")
+            return False
+    
     @classmethod
     def get_random_user_agent(cls) -> str:
         """Get a random user agent string."""
@@ -209,13 +314,24 @@ class DriverManager:
         
         Args:
             driver_type: Type of driver to create ("chrome" or "firefox")
-            **kwargs: Additional options for driver creation
+            **kwargs: Additional options for driver creation. ``max_requests``
+                sets the restart threshold and ``enable_detail_extraction``
+                keeps JavaScript enabled for JS-rendered detail pages.
         """
+        enable_detail_extraction = kwargs.pop('enable_detail_extraction', None)
+        if enable_detail_extraction is not None and driver_type == "chrome":
+            kwargs.setdefault('disable_js', not enable_detail_extraction)
+        
         self.driver_type = driver_type
-        self.driver_options = kwargs
         self.driver: Optional[webdriver.Chrome | webdriver.Firefox] = None
         self.requests_count = 0
-        self.max_requests = kwargs.get('max_requests', 100)  # Restart driver after N requests
+        self.max_requests = kwargs.pop('max_requests', 100)  # Restart driver after N requests
+        self.driver_options = kwargs
+        # Only hit chromedriver with a liveness probe every N health checks
+        self._probe_interval = max(10, self.max_requests // 10)
+        self._checks_since_probe = 0
+        # One absolute profile directory per manager, reused across restarts
+        self._user_data_dir = tempfile.mkdtemp(prefix="scrapper_udd_") if driver_type == "chrome" else None
         
     def get_driver(self) -> webdriver.Chrome | webdriver.Firefox:
         """Get or create a WebDriver instance."""
@@ -229,11 +345,21 @@ class DriverManager:
             logger.info(f"Restarting driver after {self.requests_count} requests")
             return True
         
-        # Check if driver is still alive
+        # A quit/crashed session drops its id locally, no round-trip needed
+        if self.driver.session_id is None:
+            logger.warning("Driver session is gone, restarting")
+            return True
+        
+        self._checks_since_probe += 1
+        if self._checks_since_probe < self._probe_interval:
+            return False
+        self._checks_since_probe = 0
+        
+        # Periodic liveness probe against chromedriver
         try:
-            self.driver.current_url
+            self.driver.title
             return False
-        except:
+        except DRIVER_CONNECTION_ERRORS:
             logger.warning("Driver appears to be dead, restarting")
             return True
     
@@ -242,22 +368,46 @@ class DriverManager:
         if self.driver:
             try:
                 self.driver.quit()
-            except:
+            except DRIVER_CONNECTION_ERRORS:
                 pass
         
         if self.driver_type == "chrome":
-            self.driver = WebDriverFactory.create_chrome_driver(**self.driver_options)
+            self.driver = WebDriverFactory.create_chrome_driver(
+                user_data_dir=self._user_data_dir, **self.driver_options
+            )
         elif self.driver_type == "firefox":
             self.driver = WebDriverFactory.create_firefox_driver(**self.driver_options)
         else:
             raise ValueError(f"Unsupported driver type: {self.driver_type}")
         
         self.requests_count = 0
+        self._checks_since_probe = 0
     
     def increment_request_count(self) -> None:
         """Increment the request counter."""
         self.requests_count += 1
     
+    def reset_session(self) -> None:
+        """Clear cookies and HTTP cache so a live driver can be reused for a new job.
+        
+        A driver that fails to reset is closed and recreated on the next
+        ``get_driver`` call.
+        """
+        if not self.driver:
+            return
+        
+        try:
+            self.driver.delete_all_cookies()
+            if self.driver_type == "chrome":
+                self.driver.execute_cdp_cmd("Network.clearBrowserCache", {})
+        except DRIVER_CONNECTION_ERRORS as e:
+            logger.warning(f"Could not reset driver session, restarting: {e}")
+            try:
+                self.driver.quit()
+            except DRIVER_CONNECTION_ERRORS:
+                pass
+            self.driver = None
+    
     def close(self) -> None:
         """Close the WebDriver."""
         if self.driver:
@@ -268,4 +418,81 @@ class DriverManager:
                 logger.error(f"Error closing WebDriver: {e}")
             finally:
                 self.driver = None
-    
\ No newline at end of file
+        
+        if self._user_data_dir:
+            shutil.rmtree(self._user_data_dir, ignore_errors=True)
+    
+
+
+class AsyncDriverPool:
+    """Pool of DriverManagers so blocking Selenium work can overlap.
+    
+    Selenium stays synchronous; drivers are created and released through
+    ``asyncio.to_thread`` so several page loads can be in flight at once.
+    Each pooled manager keeps its own profile directory and restart policy.
+    """
+    
+    def __init__(self, size: int = 2, driver_type: str = "chrome", **kwargs):
+        """Initialize the pool. Drivers are only launched on first acquire.
+        
+        Args:
+            size: Number of concurrent drivers
+            driver_type: Type of driver to create ("chrome" or "firefox")
+            **kwargs: Options forwarded to each DriverManager
+        """
+        if size < 1:
+            raise ValueError(f"Pool size must be at least 1, got {size}")
+        
+        self.size = size
+        self._managers: List[DriverManager] = [
+            DriverManager(driver_type=driver_type, **kwargs) for _ in range(size)
+        ]
+        self._available: Optional[asyncio.Queue] = None
+        self._in_use: Dict[int, DriverManager] = {}
+    
+    def _queue(self) -> asyncio.Queue:
+        """Create the availability queue lazily inside the running loop."""
+        if self._available is None:
+            self._available = asyncio.Queue()
+            for manager in self._managers:
+                self._available.put_nowait(manager)
+        return self._available
+    
+    async def acquire(self) -> webdriver.Chrome | webdriver.Firefox:
+        """Wait for a free manager and return its (lazily created) driver."""
+        manager = await self._queue().get()
+        try:
+            driver = await asyncio.to_thread(manager.get_driver)
+        except BaseException:
+            self._queue().put_nowait(manager)
+            raise
+        self._in_use[id(driver)] = manager
+        return driver
+    
+    async def release(self, driver: webdriver.Chrome | webdriver.Firefox) -> None:
+        """Return a driver obtained from ``acquire`` to the pool."""
+        manager = self._in_use.pop(id(driver), None)
+        if manager is None:
+            raise ValueError("Driver was not acquired from this pool")
+        manager.increment_request_count()
+        self._queue().put_nowait(manager)
+    
+    @asynccontextmanager
+    async def driver(self) -> AsyncIterator[webdriver.Chrome | webdriver.Firefox]:
+        """Acquire a driver for the duration of an ``async with`` block."""
+        driver = await self.acquire()
+        try:
+            yield driver
+        finally:
+            await self.release(driver)
+    
+    async def close(self) -> None:
+        """Close every pooled driver."""
+        await asyncio.gather(*(asyncio.to_thread(manager.close) for manager in self._managers))
+        self._in_use.clear()
+    
+    async def __aenter__(self) -> "AsyncDriverPool":
+        return self
+    
+    async def __aexit__(self, exc_type, exc_val, exc_tb) -> None:
+        await self.close()
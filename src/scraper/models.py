@@ -1,6 +1,12 @@
-from typing import Dict, List, Optional
+import logging
+from functools import lru_cache
+from pathlib import Path
+from typing import Dict, List, Optional, Union
 
-from pydantic import BaseModel, Field, HttpUrl
+from pydantic import (BaseModel, ConfigDict, Field, HttpUrl, TypeAdapter,
+                      field_validator)
+
+logger = logging.getLogger(__name__)
 
 
 class PropertyTypology(BaseModel):
@@ -17,6 +23,15 @@ class PropertyTypology(BaseModel):
     building_name: Optional[str] = Field(None, description="Building name")
     building_location: Optional[str] = Field(None, description="Building location/address")
     
+    # Schema is built lazily on first use
+    model_config = ConfigDict(defer_build=True)
+    
+    @field_validator('images', mode='after')
+    @classmethod
+    def _dedup_images(cls, images: List[str]) -> List[str]:
+        """Drop duplicated image URLs while keeping their order."""
+        return list(dict.fromkeys(images))
+
 
 class Property(BaseModel):
     """Data model for a real estate property."""
@@ -37,9 +52,16 @@ class Property(BaseModel):
     images: List[str] = Field(default_factory=list, description="Unit-specific images (if any)")
     description: Optional[str] = Field(None, description="Property description")
     
-    model_config = {
-        "json_encoders": {HttpUrl: str}
-    }
+    model_config = ConfigDict(
+        defer_build=True,
+        json_encoders={HttpUrl: str}
+    )
+
+
+@lru_cache(maxsize=None)
+def _property_adapter() -> TypeAdapter:
+    """TypeAdapter for Property, built on first serialization."""
+    return TypeAdapter(Property)
 
 
 class PropertyCollection(BaseModel):
@@ -65,8 +87,8 @@ class PropertyCollection(BaseModel):
         property_obj.images = []
         
         # Debug log
-        if images_before > 0:
-            print(f"🗑️ Limpiadas {images_before} imágenes duplicadas de propiedad {property_obj.title}")
+        if images_before > 0 and logger.isEnabledFor(logging.DEBUG):
+            logger.debug("🗑️ Limpiadas %d imágenes duplicadas de propiedad %s", images_before, property_obj.title)
         
         self.properties.append(property_obj)
         self.total_count = len(self.properties)
@@ -82,4 +104,25 @@ class PropertyCollection(BaseModel):
         # Add unit-specific images
         images.extend(property_obj.images)
         
-        return images
\ No newline at end of file
+        return images
+    
+    def dump_json(self, indent: Optional[int] = None) -> bytes:
+        """Serialize the collection to UTF-8 JSON bytes.
+        
+        Uses pydantic-core's serializer directly, without building the
+        intermediate ``model_dump`` dict tree.
+        """
+        return self.model_dump_json(indent=indent).encode('utf-8')
+    
+    def dump_ndjson(self, path: Union[str, Path]) -> int:
+        """Write one JSON property per line to ``path``.
+        
+        Returns:
+            Number of properties written
+        """
+        adapter = _property_adapter()
+        with open(path, 'wb') as f:
+            for property_obj in self.properties:
+                f.write(adapter.dump_json(property_obj))
+                f.write(b"\n")
+        return len(self.properties)
@@ -3,12 +3,69 @@ Professional AssetPlan Scraper - Main entry point with full orchestration.
 """
 import argparse
 import sys
+from typing import Callable, Dict
 
-from .domain.data_validator import DataQualityReporter
 from .services.logging_config import setup_logging, setup_selenium_logging
-from .services.scraper_manager import (ScraperManager, ScrapingConfig,
-                                       scrape_properties_comprehensive,
-                                       scrape_properties_quick)
+from .services.scraper_manager import ScraperManager, ScrapingConfig
+
+
+def _preset_quick(args: argparse.Namespace) -> ScrapingConfig:
+    """Quick preset: extreme speed, minimal features."""
+    return ScrapingConfig(
+        max_properties=args.max_properties,
+        enable_detail_page_extraction=False
+    )
+
+
+def _preset_comprehensive(args: argparse.Namespace) -> ScrapingConfig:
+    """Comprehensive preset: human-like behavior, validation and monitoring."""
+    return ScrapingConfig(
+        max_properties=args.max_properties,
+        behavior_mode="normal",
+        retry_strategy="standard",
+        circuit_breaker_mode="standard",
+        enable_detail_page_extraction=True,
+        enable_validation=True,
+        enable_performance_monitoring=True,
+        human_like_behavior=True
+    )
+
+
+def _preset_conservative(args: argparse.Namespace) -> ScrapingConfig:
+    """Conservative preset: slower, more stable, with validation."""
+    return ScrapingConfig(
+        max_properties=args.max_properties,
+        behavior_mode="normal",
+        retry_strategy="standard",
+        circuit_breaker_mode="standard",
+        enable_validation=True,
+        enable_performance_monitoring=True,
+        human_like_behavior=args.human_like,
+        debug_mode=args.debug
+    )
+
+
+def _preset_custom(args: argparse.Namespace) -> ScrapingConfig:
+    """Custom configuration built from CLI flags (defaults to extreme mode)."""
+    return ScrapingConfig(
+        max_properties=args.max_properties,
+        enable_detail_page_extraction=args.enable_detail_extraction,
+        behavior_mode=args.behavior,
+        retry_strategy=args.retry,
+        circuit_breaker_mode=args.circuit_breaker,
+        enable_validation=args.enable_validation,
+        enable_performance_monitoring=args.enable_monitoring,
+        output_file=args.output,
+        debug_mode=args.debug,
+        human_like_behavior=args.human_like
+    )
+
+
+PRESETS: Dict[str, Callable[[argparse.Namespace], ScrapingConfig]] = {
+    "quick": _preset_quick,
+    "comprehensive": _preset_comprehensive,
+    "conservative": _preset_conservative,
+}
 
 
 def main():
@@ -172,72 +229,38 @@ Examples:
         "url": args.url
     })
     
+    mode = ("quick" if args.quick
+            else "comprehensive" if args.comprehensive
+            else "conservative" if args.conservative
+            else "custom")
+    
     try:
-        # Handle preset modes
-        if args.quick:
-            logger.info("Using quick preset mode (extreme speed)")
-            collection = scrape_properties_quick(max_properties=args.max_properties)
-            
-        elif args.comprehensive:
-            logger.info("Using comprehensive preset mode (human-like behavior)")
-            collection = scrape_properties_comprehensive(max_properties=args.max_properties)
-            
-        elif args.conservative:
-            logger.info("Using conservative preset mode")
-            config = ScrapingConfig(
-                max_properties=args.max_properties,
-                behavior_mode="normal",
-                retry_strategy="standard",
-                circuit_breaker_mode="standard",
-                enable_validation=True,
-                enable_performance_monitoring=True,
-                human_like_behavior=args.human_like,
-                debug_mode=args.debug
-            )
-            with ScraperManager(config) as manager:
-                collection = manager.scrape_properties(base_url=args.url)
-            
-        else:
-            # Custom configuration (defaults to extreme mode)
-            behavior_mode = args.behavior if hasattr(args, 'behavior') else "extreme"
-            retry_strategy = args.retry if hasattr(args, 'retry') else "fast"
-            circuit_breaker = args.circuit_breaker if hasattr(args, 'circuit_breaker') else "tolerant"
-            human_like = args.human_like
-            
-            # Custom configuration
-            config = ScrapingConfig(
-                max_properties=args.max_properties,
-                enable_detail_page_extraction=args.enable_detail_extraction,
-                behavior_mode=behavior_mode,
-                retry_strategy=retry_strategy,
-                circuit_breaker_mode=circuit_breaker,
-                enable_validation=args.enable_validation,  # Now defaults to False
-                enable_performance_monitoring=args.enable_monitoring,  # Now defaults to False
-                output_file=args.output,
-                debug_mode=args.debug,
-                human_like_behavior=human_like
-            )
-            
-            # Progress callback for console output
+        config = PRESETS.get(mode, _preset_custom)(args)
+        if mode != "custom":
+            logger.info(f"Using {mode} preset mode")
+        
+        # Progress callback for console output (custom runs only)
+        progress_callback = None
+        if mode == "custom" and not args.quiet:
             def progress_callback(data):
-                if not args.quiet:
-                    print(f"\r{data['message']} ({data['percentage']:.1f}%)", end="", flush=True)
-            
-            with ScraperManager(config, logger) as manager:
-                collection = manager.scrape_properties(
-                    base_url=args.url,
-                    progress_callback=progress_callback
-                )
-            
-            if not args.quiet:
-                print()  # New line after progress
+                print(f"\r{data['message']} ({data['percentage']:.1f}%)", end="", flush=True)
+        
+        with ScraperManager(config, logger) as manager:
+            collection = manager.scrape_properties(
+                base_url=args.url,
+                progress_callback=progress_callback
+            )
+        
+        if progress_callback:
+            print()  # New line after progress
         
         # Generate and display results
         _display_results(collection, logger, args.quiet)
         
         # Generate data quality report if validation was enabled
         if args.enable_validation and collection.properties:
-            from .domain.data_validator import PropertyCollectionValidator
+            from .domain.data_validator import (DataQualityReporter,
+                                                PropertyCollectionValidator)
             validator = PropertyCollectionValidator()
             _, validation_summary = validator.validate_collection(collection.properties)
             
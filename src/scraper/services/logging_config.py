@@ -1,13 +1,67 @@
 """
 Structured logging configuration for the scraper system.
 """
+import atexit
 import json
 import logging
 import logging.handlers
+import queue
 import sys
-from datetime import datetime
+import threading
+import time
 from pathlib import Path
-from typing import Any, Dict, Optional
+from typing import Any, Dict, List, Optional
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - orjson is listed in requirements
+    orjson = None
+
+
+# Attributes every LogRecord carries; anything else came in through ``extra``
+_STD_LOGRECORD_ATTRS = frozenset({
+    'name', 'msg', 'args', 'levelname', 'levelno', 'pathname', 'filename',
+    'module', 'exc_info', 'exc_text', 'stack_info', 'lineno', 'funcName',
+    'created', 'msecs', 'relativeCreated', 'thread', 'threadName',
+    'processName', 'process', 'taskName', 'getMessage', 'message', 'asctime'
+})
+
+
+# Attribute count of a bare LogRecord; more keys means extras may be present
+_BASE_ATTR_COUNT = len(logging.LogRecord("", logging.INFO, "", 0, "", None, None).__dict__)
+
+# Per-thread dict reused by StructuredFormatter.format_bytes
+_format_scratch = threading.local()
+
+# Event messages indexed by success flag (False -> 0, True -> 1)
+_SCRAPING_END_MSG = ("Scraping operation failed", "Scraping operation completed")
+_PROP_EXTRACT_MSG = ("Property extraction failed", "Property extracted")
+
+
+# (second, formatted) pair; replaced as a whole so threads never see a torn update
+_timestamp_cache = (-1, "")
+
+
+def _format_timestamp(created: float, msecs: float) -> str:
+    """Format a record time as ISO-8601 UTC with millisecond precision.
+    
+    The seconds part is cached, so bursts of records within the same second
+    only pay for the millisecond suffix.
+    """
+    global _timestamp_cache
+    second = int(created)
+    cached_second, prefix = _timestamp_cache
+    if cached_second != second:
+        prefix = time.strftime("%Y-%m-%dT%H:%M:%S", time.gmtime(second))
+        _timestamp_cache = (second, prefix)
+    return f"{prefix}.{int(msecs):03d}Z"
+
+
+def _dumps_bytes(obj: Dict[str, Any]) -> bytes:
+    """Serialize a log object to UTF-8 JSON bytes (orjson when available)."""
+    if orjson is not None:
+        return orjson.dumps(obj, default=str, option=orjson.OPT_NON_STR_KEYS)
+    return json.dumps(obj, ensure_ascii=False, default=str).encode('utf-8')
 
 
 class StructuredFormatter(logging.Formatter):
@@ -31,41 +85,241 @@ class StructuredFormatter(logging.Formatter):
         Returns:
             JSON formatted log string
         """
-        # Base log structure
-        log_obj = {
-            "timestamp": datetime.utcfromtimestamp(record.created).isoformat() + "Z",
-            "level": record.levelname,
-            "service": self.service_name,
-            "logger": record.name,
-            "message": record.getMessage(),
-            "module": record.module,
-            "function": record.funcName,
-            "line": record.lineno
-        }
+        return self.format_bytes(record).decode('utf-8')
+    
+    def format_bytes(self, record: logging.LogRecord) -> bytes:
+        """Format log record as structured JSON encoded in UTF-8.
+        
+        Args:
+            record: Log record to format
+            
+        Returns:
+            JSON formatted log bytes
+        """
+        # Base log structure, reusing this thread's scratch dict (it is
+        # serialized before returning, so nothing keeps a reference to it)
+        log_obj = getattr(_format_scratch, 'log_obj', None)
+        if log_obj is None:
+            log_obj = _format_scratch.log_obj = {}
+        log_obj.clear()
+        log_obj["timestamp"] = _format_timestamp(record.created, record.msecs)
+        log_obj["level"] = record.levelname
+        log_obj["service"] = self.service_name
+        log_obj["logger"] = record.name
+        log_obj["message"] = record.getMessage()
+        log_obj["module"] = record.module
+        log_obj["function"] = record.funcName
+        log_obj["line"] = record.lineno
         
         # Add exception information if present
-        if record.exc_info:
+        exc_info = record.exc_info
+        if exc_info:
+            etype, evalue, _ = exc_info
             log_obj["exception"] = {
-                "type": record.exc_info[0].__name__ if record.exc_info[0] else None,
-                "message": str(record.exc_info[1]) if record.exc_info[1] else None,
-                "traceback": self.formatException(record.exc_info) if record.exc_info else None
+                "type": etype.__name__ if etype else None,
+                "message": str(evalue) if evalue else None,
+                "traceback": self._exception_text(record)
             }
         
-        # Add extra fields from the log record
-        extra_fields = {}
-        for key, value in record.__dict__.items():
-            if key not in {
-                'name', 'msg', 'args', 'levelname', 'levelno', 'pathname', 'filename',
-                'module', 'exc_info', 'exc_text', 'stack_info', 'lineno', 'funcName',
-                'created', 'msecs', 'relativeCreated', 'thread', 'threadName',
-                'processName', 'process', 'getMessage'
-            }:
-                extra_fields[key] = value
+        # Add extra fields from the log record in insertion order, skipped
+        # entirely when the record carries only standard attributes
+        record_dict = record.__dict__
+        if len(record_dict) > _BASE_ATTR_COUNT:
+            extra_fields = {key: value for key, value in record_dict.items()
+                            if key not in _STD_LOGRECORD_ATTRS}
+            if extra_fields:
+                log_obj["extra"] = extra_fields
         
-        if extra_fields:
-            log_obj["extra"] = extra_fields
+        return _dumps_bytes(log_obj)
+    
+    def _exception_text(self, record: logging.LogRecord) -> str:
+        """Format the traceback once and cache it on the record (like stdlib)."""
+        if not record.exc_text:
+            record.exc_text = self.formatException(record.exc_info)
+        return record.exc_text
+
+
+class RecordQueueHandler(logging.handlers.QueueHandler):
+    """QueueHandler that hands the original record to the listener thread.
+    
+    The stdlib ``prepare`` pre-formats the record and drops ``exc_info``,
+    which would flatten the structured exception data before
+    ``StructuredFormatter`` sees it. Only the message is rendered up front,
+    so arguments the caller mutates after the log call are logged with the
+    values they had at call time.
+    """
+    
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        record.msg = record.getMessage()
+        record.args = None
+        return record
+
+
+def _encode_records(handler: logging.Handler, records: List[logging.LogRecord]) -> bytes:
+    """Encode records as newline-terminated UTF-8 lines for a single write.
+    
+    Records that fail to format are reported through ``handleError`` and
+    skipped, so one bad record doesn't drop the rest of the batch.
+    """
+    formatter = handler.formatter
+    structured = isinstance(formatter, StructuredFormatter)
+    lines = []
+    for record in records:
+        try:
+            lines.append(formatter.format_bytes(record) if structured else handler.format(record).encode('utf-8'))
+        except Exception:
+            handler.handleError(record)
+    if not lines:
+        return b""
+    lines.append(b"")
+    return b"\n".join(lines)
+
+
+class BytesStreamHandler(logging.StreamHandler):
+    """Stream handler that writes structured JSON bytes to the binary layer.
+    
+    Skips the str decode/encode round trip through ``TextIOWrapper`` by
+    writing ``StructuredFormatter.format_bytes`` output to ``stream.buffer``.
+    Streams without a binary buffer fall back to regular text writes.
+    """
+    
+    def emit(self, record: logging.LogRecord) -> None:
+        self.emit_batch([record])
+    
+    def emit_batch(self, records: List[logging.LogRecord]) -> None:
+        """Write several records with one write() and one flush()."""
+        buffer = getattr(self.stream, 'buffer', None)
+        if buffer is None or not isinstance(self.formatter, StructuredFormatter):
+            for record in records:
+                super().emit(record)
+            return
+        data = _encode_records(self, records)
+        if not data:
+            return
+        try:
+            buffer.write(data)
+            buffer.flush()
+        except Exception:
+            self.handleError(records[-1])
+
+
+class BufferedRotatingFileHandler(logging.handlers.RotatingFileHandler):
+    """Rotating file handler that writes through a user-space buffer.
+    
+    Records are not flushed one by one; the buffer is flushed by a background
+    thread every ``flush_interval`` seconds, on rollover and on close, so a
+    burst of records costs a handful of ``write()`` syscalls instead of one
+    per record.
+    """
+    
+    def __init__(self, filename: str, maxBytes: int = 0, backupCount: int = 0,
+                 buffer_size: int = 64 * 1024, flush_interval: float = 1.0):
+        """Initialize the handler.
         
-        return json.dumps(log_obj, ensure_ascii=False)
+        Args:
+            filename: Log file path
+            maxBytes: Rollover size in bytes (0 disables rollover)
+            backupCount: Number of rotated files to keep
+            buffer_size: Write buffer size in bytes
+            flush_interval: Seconds between periodic flushes
+        """
+        self.buffer_size = buffer_size
+        self.flush_interval = flush_interval
+        self._stop_flush = threading.Event()
+        super().__init__(filename, maxBytes=maxBytes, backupCount=backupCount)
+        self._flush_thread = threading.Thread(target=self._flush_loop, name="log-flush", daemon=True)
+        self._flush_thread.start()
+    
+    def _open(self):
+        # Always binary append; records are encoded by emit_batch()
+        return open(self.baseFilename, 'ab', buffering=self.buffer_size)
+    
+    def _flush_loop(self) -> None:
+        # One thread per handler; wakes every flush_interval until close()
+        while not self._stop_flush.wait(self.flush_interval):
+            self.flush()
+    
+    def emit(self, record: logging.LogRecord) -> None:
+        self.emit_batch([record])
+    
+    def emit_batch(self, records: List[logging.LogRecord]) -> None:
+        """Write records as UTF-8 bytes, rolling over when size is reached."""
+        data = _encode_records(self, records)
+        if not data:
+            return
+        try:
+            if self.stream is None:
+                self.stream = self._open()
+            # tell() includes buffered bytes without forcing a flush
+            if self.maxBytes > 0 and self.stream.tell() + len(data) >= self.maxBytes:
+                self.doRollover()
+            self.stream.write(data)
+        except Exception:
+            self.handleError(records[-1])
+    
+    def close(self) -> None:
+        self._stop_flush.set()
+        if self._flush_thread is not threading.current_thread():
+            self._flush_thread.join()
+        super().close()
+
+
+class BatchingQueueListener(logging.handlers.QueueListener):
+    """QueueListener that drains pending records in batches.
+    
+    Handlers exposing ``emit_batch`` receive the whole batch under a single
+    lock acquisition (one ``write()`` for a burst of records); other
+    handlers get the records one by one as usual.
+    """
+    
+    def __init__(self, queue, *handlers, respect_handler_level: bool = False, batch_size: int = 128):
+        super().__init__(queue, *handlers, respect_handler_level=respect_handler_level)
+        self.batch_size = batch_size
+    
+    def _drain(self) -> List[Any]:
+        """Block for one item, then take whatever else is already queued."""
+        batch = [self.dequeue(True)]
+        try:
+            while len(batch) < self.batch_size:
+                batch.append(self.dequeue(False))
+        except queue.Empty:
+            pass
+        return batch
+    
+    def _monitor(self) -> None:
+        q = self.queue
+        has_task_done = hasattr(q, 'task_done')
+        while True:
+            batch = self._drain()
+            stop = any(item is self._sentinel for item in batch)
+            records = [self.prepare(item) for item in batch if item is not self._sentinel]
+            if records:
+                self.handle_batch(records)
+            if has_task_done:
+                for _ in batch:
+                    q.task_done()
+            if stop:
+                break
+    
+    def handle_batch(self, records: List[logging.LogRecord]) -> None:
+        """Dispatch a batch of records to every handler."""
+        for handler in self.handlers:
+            accepted = [
+                record for record in records
+                if (not self.respect_handler_level or record.levelno >= handler.level) and handler.filter(record)
+            ]
+            if not accepted:
+                continue
+            emit_batch = getattr(handler, 'emit_batch', None)
+            if emit_batch is None:
+                for record in accepted:
+                    handler.handle(record)
+                continue
+            handler.acquire()
+            try:
+                emit_batch(accepted)
+            finally:
+                handler.release()
 
 
 class ScraperLoggerAdapter(logging.LoggerAdapter):
@@ -79,6 +333,9 @@ class ScraperLoggerAdapter(logging.LoggerAdapter):
             extra: Extra context to add to all log messages
         """
         super().__init__(logger, extra or {})
+        # Context is fixed per adapter, so the merge template is built once
+        self._extra_template = dict(self.extra)
+        self._has_extra = bool(self._extra_template)
     
     def process(self, msg: str, kwargs: Dict[str, Any]) -> tuple:
         """Process log message and add context.
@@ -90,10 +347,12 @@ class ScraperLoggerAdapter(logging.LoggerAdapter):
         Returns:
             Processed message and kwargs
         """
-        # Merge extra context
-        extra = kwargs.get('extra', {})
-        extra.update(self.extra)
-        kwargs['extra'] = extra
+        if not self._has_extra:
+            return msg, kwargs
+        
+        # Merge extra context (adapter context wins, caller dict is not mutated)
+        caller_extra = kwargs.get('extra')
+        kwargs['extra'] = {**caller_extra, **self._extra_template} if caller_extra else self._extra_template.copy()
         
         return msg, kwargs
     
@@ -123,7 +382,7 @@ class ScraperLoggerAdapter(logging.LoggerAdapter):
             success: Whether operation was successful
         """
         self.info(
-            f"Scraping operation {'completed' if success else 'failed'}",
+            _SCRAPING_END_MSG[success],
             extra={
                 "event_type": "scraping_end",
                 "url": url,
@@ -141,12 +400,9 @@ class ScraperLoggerAdapter(logging.LoggerAdapter):
             extraction_time: Time taken to extract
             success: Whether extraction was successful
         """
-        level = logging.DEBUG if success else logging.WARNING
-        message = f"Property {'extracted' if success else 'extraction failed'}"
-        
         self.log(
-            level,
-            message,
+            logging.DEBUG if success else logging.WARNING,
+            _PROP_EXTRACT_MSG[success],
             extra={
                 "event_type": "property_extraction",
                 "property_url": property_url,
@@ -208,6 +464,25 @@ class ScraperLoggerAdapter(logging.LoggerAdapter):
         self.error(message, exc_info=error, extra=extra)
 
 
+# Active listeners started by setup_logging
+_queue_listeners: list = []
+
+# Log directories already created by setup_logging
+_ensured_log_dirs: set = set()
+
+
+def shutdown_logging() -> None:
+    """Stop background log listeners, flushing queued records."""
+    while _queue_listeners:
+        listener = _queue_listeners.pop()
+        listener.stop()
+        for handler in listener.handlers:
+            handler.close()
+
+
+atexit.register(shutdown_logging)
+
+
 def setup_logging(
     log_level: str = "INFO",
     log_file: Optional[str] = None,
@@ -226,14 +501,23 @@ def setup_logging(
         
     Returns:
         Configured logger adapter
+        
+    Raises:
+        ValueError: If log_level is not a valid logging level name
     """
+    # Resolve the level once, before touching any handler
+    level = getattr(logging, log_level.upper(), None)
+    if not isinstance(level, int):
+        raise ValueError(f"Invalid log level: {log_level}")
+    
     # Create root logger
     root_logger = logging.getLogger()
-    root_logger.setLevel(getattr(logging, log_level.upper()))
+    root_logger.setLevel(level)
     
-    # Clear existing handlers
+    # Clear existing handlers (and flush any previous listener)
     for handler in root_logger.handlers[:]:
         root_logger.removeHandler(handler)
+    shutdown_logging()
     
     # Set up formatters
     if enable_structured:
@@ -243,29 +527,42 @@ def setup_logging(
             '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
         )
     
+    # Output handlers run on a background listener thread
+    output_handlers = []
+    
     # Console handler
     if enable_console:
-        console_handler = logging.StreamHandler(sys.stdout)
-        console_handler.setLevel(getattr(logging, log_level.upper()))
+        handler_class = BytesStreamHandler if enable_structured else logging.StreamHandler
+        console_handler = handler_class(sys.stdout)
+        console_handler.setLevel(level)
         console_handler.setFormatter(formatter)
-        root_logger.addHandler(console_handler)
+        output_handlers.append(console_handler)
     
     # File handler
     if log_file:
-        # Ensure log directory exists
-        log_path = Path(log_file)
-        log_path.parent.mkdir(parents=True, exist_ok=True)
+        # Ensure log directory exists (once per process)
+        log_dir = Path(log_file).parent
+        if log_dir not in _ensured_log_dirs:
+            log_dir.mkdir(parents=True, exist_ok=True)
+            _ensured_log_dirs.add(log_dir)
         
-        # Rotating file handler (max 10MB per file, keep 5 files)
-        file_handler = logging.handlers.RotatingFileHandler(
+        # Buffered rotating file handler (max 10MB per file, keep 5 files)
+        file_handler = BufferedRotatingFileHandler(
             log_file,
             maxBytes=10 * 1024 * 1024,  # 10MB
-            backupCount=5,
-            encoding='utf-8'
+            backupCount=5
         )
-        file_handler.setLevel(getattr(logging, log_level.upper()))
+        file_handler.setLevel(level)
         file_handler.setFormatter(formatter)
-        root_logger.addHandler(file_handler)
+        output_handlers.append(file_handler)
+    
+    # Logging calls only enqueue; formatting and I/O happen off the scraping thread
+    if output_handlers:
+        log_queue = queue.SimpleQueue()
+        root_logger.addHandler(RecordQueueHandler(log_queue))
+        listener = BatchingQueueListener(log_queue, *output_handlers, respect_handler_level=True)
+        listener.start()
+        _queue_listeners.append(listener)
     
     # Create service-specific logger
     service_logger = logging.getLogger(service_name)
@@ -276,22 +573,35 @@ def setup_logging(
     return adapter
 
 
+# Noisy third-party loggers quieted by setup_selenium_logging
+_SELENIUM_LOGGERS = (
+    'selenium.webdriver.remote.remote_connection',
+    'selenium.webdriver.common.service',
+    'urllib3.connectionpool',
+    'requests.packages.urllib3.connectionpool'
+)
+
+# Level last applied by setup_selenium_logging (None until first call)
+_selenium_log_level: Optional[int] = None
+
+
 def setup_selenium_logging(log_level: str = "WARNING") -> None:
     """Configure Selenium logging to reduce noise.
     
+    Levels are only applied when they change, since ``setLevel`` clears the
+    logging manager's level caches on every call.
+    
     Args:
         log_level: Log level for Selenium components
     """
-    selenium_loggers = [
-        'selenium.webdriver.remote.remote_connection',
-        'selenium.webdriver.common.service',
-        'urllib3.connectionpool',
-        'requests.packages.urllib3.connectionpool'
-    ]
+    global _selenium_log_level
+    level = getattr(logging, log_level.upper())
+    if level == _selenium_log_level:
+        return
     
-    for logger_name in selenium_loggers:
-        logger = logging.getLogger(logger_name)
-        logger.setLevel(getattr(logging, log_level.upper()))
+    for logger_name in _SELENIUM_LOGGERS:
+        logging.getLogger(logger_name).setLevel(level)
+    _selenium_log_level = level
 
 
 def setup_performance_logging() -> ScraperLoggerAdapter:
@@ -352,24 +662,26 @@ class LoggingContext:
         else:
             self.logger.debug("Exiting context", extra=self.context)
     
+# Adapters shared by every instance of a LoggingMixin class
+_adapter_cache: Dict[str, ScraperLoggerAdapter] = {}
+
+
 class LoggingMixin:
     """Mixin class for adding logging capabilities."""
     
-    def __init__(self, *args, **kwargs):
-        super().__init__(*args, **kwargs)
-        self._logger = None
-    
     @property
     def logger(self) -> ScraperLoggerAdapter:
-        """Get logger for this class."""
-        if self._logger is None:
-            class_name = self.__class__.__name__
+        """Get logger for this class (one adapter per class, not per instance)."""
+        class_name = type(self).__name__
+        adapter = _adapter_cache.get(class_name)
+        if adapter is None:
             base_logger = logging.getLogger(f"scraper.{class_name}")
-            self._logger = ScraperLoggerAdapter(
+            adapter = ScraperLoggerAdapter(
                 base_logger, 
                 {"component": class_name}
             )
-        return self._logger
+            _adapter_cache[class_name] = adapter
+        return adapter
 
 
 # Global logger instance
@@ -1,31 +1,111 @@
 """
 Professional Scraper Manager that orchestrates all scraping operations.
 """
+import asyncio
+import atexit
 import json
+import multiprocessing
+import os
+import queue
+import threading
 import time
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Callable, Dict, Optional
+from types import MappingProxyType
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
 from ...utils.config import settings
 from ..domain.assetplan_extractor_v2 import AssetPlanExtractorV2
-from ..domain.data_validator import (PropertyCollectionValidator,
-                                     PropertyDataValidator)
 from ..domain.retry_manager import (CommonCircuitConfigs, CommonRetryConfigs,
                                     RetryManager)
+from ..infrastructure import event_loop
 from ..infrastructure.human_behavior import (BehaviorConfig,
                                              HumanBehaviorSimulator)
-from ..infrastructure.performance_monitor import (PerformanceAlerts,
-                                                  PerformanceMonitor)
-from ..infrastructure.webdriver_factory import DriverManager
-from ..models import PropertyCollection
+from ..infrastructure.webdriver_factory import AsyncDriverPool, DriverManager
+from ..models import Property, PropertyCollection
 from .logging_config import LoggingContext, ScraperLoggerAdapter, get_logger
 
+try:
+    import msgpack
+except ImportError:  # pragma: no cover - optional binary output
+    msgpack = None
 
-@dataclass
+try:
+    import orjson
+except ImportError:  # pragma: no cover - orjson is listed in requirements
+    orjson = None
+
+
+# Config name -> preset tables, shared by every ScraperManager
+_RETRY_CONFIGS = MappingProxyType({
+    "fast": CommonRetryConfigs.FAST,
+    "standard": CommonRetryConfigs.STANDARD,
+    "aggressive": CommonRetryConfigs.AGGRESSIVE,
+    "patient": CommonRetryConfigs.PATIENT
+})
+
+_CIRCUIT_CONFIGS = MappingProxyType({
+    "sensitive": CommonCircuitConfigs.SENSITIVE,
+    "standard": CommonCircuitConfigs.STANDARD,
+    "tolerant": CommonCircuitConfigs.TOLERANT
+})
+
+# Exception filters for the scraping workflow retries
+_RETRY_ON = (Exception,)
+_NO_RETRY_ON = (KeyboardInterrupt,)
+
+# Collections larger than this are saved as msgpack when output_format="auto"
+_MSGPACK_THRESHOLD = 5000
+
+# How long get_status() may reuse performance/retry summaries, in seconds
+_STATUS_CACHE_TTL = 0.25
+
+# DriverManagers kept alive across ScraperManager instances, keyed by driver
+# options. Only used when SCRAPER_KEEP_DRIVER=1.
+_DRIVER_CACHE: Dict[Tuple[Tuple[str, Any], ...], DriverManager] = {}
+
+
+def _keep_driver() -> bool:
+    """Whether browsers should outlive the ScraperManager that started them."""
+    return os.environ.get("SCRAPER_KEEP_DRIVER") == "1"
+
+
+def close_cached_drivers() -> None:
+    """Close every driver kept alive by SCRAPER_KEEP_DRIVER."""
+    while _DRIVER_CACHE:
+        _, manager = _DRIVER_CACHE.popitem()
+        manager.close()
+
+
+atexit.register(close_cached_drivers)
+
+
+def _now_iso() -> str:
+    """Local time as ISO-8601 with second precision, without building a datetime."""
+    return time.strftime("%Y-%m-%dT%H:%M:%S")
+
+
+def _empty_collection(source_url: str) -> PropertyCollection:
+    """Empty result returned when scraping fails."""
+    return PropertyCollection(properties=[], total_count=0, scraped_at=_now_iso(), source_url=source_url)
+
+
+def _encode_json(data: Dict[str, Any]) -> bytes:
+    """Encode a dumped collection as indented UTF-8 JSON."""
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2)
+    return json.dumps(data, ensure_ascii=False, indent=2).encode('utf-8')
+
+
+@dataclass(frozen=True)
 class ScrapingConfig:
-    """Configuration for scraping operations."""
+    """Configuration for scraping operations.
+    
+    Immutable so one config can be shared between managers and worker
+    threads; derive variants with ``dataclasses.replace``.
+    """
     max_properties: int = 50
     max_typologies: Optional[int] = None  # New: limit number of typologies/buildings to scrape
     max_links_per_page: int = 100
@@ -39,6 +119,10 @@ class ScrapingConfig:
     output_file: Optional[str] = None
     debug_mode: bool = False  # Enable visual debugging with browser
     human_like_behavior: bool = False  # Enable human-like behavior simulation (optional)
+    fast_listing_fetch: bool = True  # Fetch server-rendered listing pages over HTTP instead of the browser
+    use_http_cache: bool = True  # Revalidate prefetched pages with ETag/Last-Modified
+    parallel_drivers: Optional[int] = 1  # Drivers for multi-typology runs (1 = sequential, None = cpu_count // 2)
+    output_format: str = "auto"  # json, msgpack, auto (msgpack first for large collections)
 
 
 class ScraperManager:
@@ -62,7 +146,23 @@ class ScraperManager:
         # State tracking
         self.is_running = False
         self.current_operation: Optional[str] = None
-        self.start_time: Optional[datetime] = None
+        self.start_time: Optional[datetime] = None  # Wall clock, for reporting
+        self._start_monotonic: Optional[float] = None  # For elapsed time
+        
+        # Progress callbacks run on a worker thread so a slow callback can't
+        # stall extraction (see _report_progress)
+        self._progress_queue: queue.Queue = queue.Queue(maxsize=1024)
+        self._progress_thread: Optional[threading.Thread] = None
+        
+        # Output location is resolved once; its directory is created on the first save
+        self._output_path = Path(self.config.output_file or settings.properties_json_path)
+        self._output_dir_ready = False
+        
+        # Summary name -> (monotonic timestamp, value), see _cached_summary
+        self._summary_cache: Dict[str, Tuple[float, Dict[str, Any]]] = {}
+        
+        # Background JSON write started by _save_collection, joined in stop()
+        self._json_writer: Optional[threading.Thread] = None
 
     def __enter__(self):
         """Enter context: return self."""
@@ -75,19 +175,27 @@ class ScraperManager:
     def _setup_components(self) -> None:
         """Set up all scraper components."""
         # Driver management
-        debug_mode = getattr(self.config, 'debug_mode', False)
+        debug_mode = self.config.debug_mode
         extreme_mode = (self.config.behavior_mode == "extreme")
         
-        self.driver_manager = DriverManager(
-            driver_type="chrome",
+        # Shared by the main driver and any parallel driver pool
+        self._driver_options = dict(
             headless=settings.headless_browser and not debug_mode,  # Force visible in debug mode (even in extreme)
             stealth_mode=not debug_mode and not extreme_mode,  # Disable stealth in debug/extreme mode
             performance_optimized=not debug_mode and not extreme_mode,  # Disable optimizations in debug/extreme mode
-            debug_mode=debug_mode
+            debug_mode=debug_mode,
+            enable_detail_extraction=self.config.enable_detail_page_extraction,  # Detail pages need JavaScript
+            connection_pool_size=settings.webdriver_pool_size
         )
+        self.driver_manager = self._get_driver_manager()
+        
+        # Optional components are imported only when enabled (psutil,
+        # validators) to keep the quick path's import time down
         
         # Performance monitoring
         if self.config.enable_performance_monitoring:
+            from ..infrastructure.performance_monitor import (
+                PerformanceAlerts, PerformanceMonitor)
             self.performance_monitor = PerformanceMonitor()
             self.performance_alerts = PerformanceAlerts(self.performance_monitor)
         else:
@@ -95,32 +203,39 @@ class ScraperManager:
             self.performance_alerts = None
         
         # Retry management
-        retry_configs = {
-            "fast": CommonRetryConfigs.FAST,
-            "standard": CommonRetryConfigs.STANDARD,
-            "aggressive": CommonRetryConfigs.AGGRESSIVE,
-            "patient": CommonRetryConfigs.PATIENT
-        }
-        
-        circuit_configs = {
-            "sensitive": CommonCircuitConfigs.SENSITIVE,
-            "standard": CommonCircuitConfigs.STANDARD,
-            "tolerant": CommonCircuitConfigs.TOLERANT
-        }
-        
         self.retry_manager = RetryManager(
-            retry_config=retry_configs.get(self.config.retry_strategy, CommonRetryConfigs.STANDARD),
-            circuit_config=circuit_configs.get(self.config.circuit_breaker_mode, CommonCircuitConfigs.STANDARD)
+            retry_config=_RETRY_CONFIGS.get(self.config.retry_strategy, CommonRetryConfigs.STANDARD),
+            circuit_config=_CIRCUIT_CONFIGS.get(self.config.circuit_breaker_mode, CommonCircuitConfigs.STANDARD)
         )
         
         # Validators
         if self.config.enable_validation:
+            from ..domain.data_validator import (PropertyCollectionValidator,
+                                                 PropertyDataValidator)
             self.property_validator = PropertyDataValidator()
             self.collection_validator = PropertyCollectionValidator()
         else:
             self.property_validator = None
             self.collection_validator = None
     
+    def _get_driver_manager(self) -> DriverManager:
+        """Create the driver manager, or reuse a cached one with a clean session.
+        
+        Returns:
+            DriverManager for this scraper
+        """
+        if not _keep_driver():
+            return DriverManager(driver_type="chrome", **self._driver_options)
+        
+        cache_key = tuple(sorted(self._driver_options.items()))
+        driver_manager = _DRIVER_CACHE.get(cache_key)
+        if driver_manager is None:
+            driver_manager = _DRIVER_CACHE[cache_key] = DriverManager(driver_type="chrome", **self._driver_options)
+        else:
+            self.logger.debug("Reusing cached WebDriver")
+            driver_manager.reset_session()
+        return driver_manager
+    
     def scrape_properties(self, 
                          base_url: str = "https://www.assetplan.cl/propiedades",
                          progress_callback: Optional[Callable[[Dict[str, Any]], None]] = None) -> PropertyCollection:
@@ -135,6 +250,7 @@ class ScraperManager:
         """
         self.is_running = True
         self.start_time = datetime.now()
+        self._start_monotonic = time.monotonic()
         self.current_operation = "initializing"
         
         try:
@@ -150,8 +266,8 @@ class ScraperManager:
                     self._execute_scraping_workflow,
                     base_url,
                     progress_callback,
-                    retry_on=[Exception],
-                    no_retry_on=[KeyboardInterrupt]
+                    retry_on=_RETRY_ON,
+                    no_retry_on=_NO_RETRY_ON
                 )
                 
                 self.logger.scraping_end(
@@ -171,17 +287,16 @@ class ScraperManager:
             )
             
             # Return empty collection with error info
-            return PropertyCollection(
-                properties=[],
-                total_count=0,
-                scraped_at=datetime.now().isoformat(),
-                source_url=base_url
-            )
+            return _empty_collection(base_url)
         
         finally:
             self.is_running = False
             self.current_operation = None
             
+            # Deliver pending progress updates before returning
+            if self._progress_thread:
+                self._progress_queue.join()
+            
             # Stop monitoring and generate reports
             if self.performance_monitor:
                 self.performance_monitor.stop_monitoring()
@@ -210,36 +325,40 @@ class ScraperManager:
             speed_factor=behavior_config.get("speed_factor", 1.0)
         )
         # Use the updated extractor that follows the guide specifications
-        extractor_v2 = AssetPlanExtractorV2(driver, base_url="https://www.assetplan.cl")
+        extractor_v2 = self._create_extractor(driver)
         
-        # Configure extractor modes
-        if self.config.debug_mode:
-            extractor_v2.enable_debug_mode(True)
+        # Scrape the given listing (e.g. another commune or property type)
+        # instead of the extractor's default search page
+        if base_url.startswith(f"{extractor_v2.base_url}/arriendo/"):
+            extractor_v2.search_url = base_url
         
-        # Configure human-like behavior and extreme mode
-        extractor_v2.configure_behavior_mode(
-            human_like=self.config.human_like_behavior,
-            behavior_mode=self.config.behavior_mode
-        )
+        # Listing pages are server-rendered: fetch them over HTTP and let the
+        # extractor skip the browser when they already contain building cards
+        if self.config.fast_listing_fetch and not self.config.debug_mode:
+            extractor_v2.preload_html(self._prefetch_listing_pages([extractor_v2.search_url]))
         
         # Phase 2: Extract Properties using V2 Extractor (follows guide flow)
         self.current_operation = "extraction"
         self._report_progress("Extracting properties using guide methodology", 20, progress_callback)
         
         request_id = self.performance_monitor.record_request_start() if self.performance_monitor else None
-        start_time = time.time()
+        start_time = time.monotonic()
         
         try:
-            # Use the new V2 extractor that follows the complete guide flow
-            collection = extractor_v2.start_scraping(
-                max_properties=self.config.max_properties,
-                max_typologies=self.config.max_typologies
-            )
+            pool_size = self._parallel_driver_count()
+            if pool_size > 1:
+                # Spread buildings over a pool of drivers
+                collection = self._extract_buildings_in_parallel(extractor_v2, pool_size)
+            else:
+                # Use the new V2 extractor that follows the complete guide flow
+                collection = extractor_v2.start_scraping(
+                    max_properties=self.config.max_properties,
+                    max_typologies=self.config.max_typologies
+                )
             
             if self.performance_monitor:
-                self.performance_monitor.record_request_success(request_id, time.time() - start_time)
-                for _ in collection.properties:
-                    self.performance_monitor.record_property_scraped()
+                self.performance_monitor.record_request_success(request_id, time.monotonic() - start_time)
+                self.performance_monitor.record_properties_scraped(len(collection.properties))
             
             self.logger.info(
                 f"Successfully extracted {collection.total_count} properties using V2 extractor",
@@ -251,12 +370,7 @@ class ScraperManager:
                 self.performance_monitor.record_request_failure(request_id, type(e).__name__, str(e))
             
             self.logger.error_with_context("V2 extractor failed", e)
-            collection = PropertyCollection(
-                properties=[],
-                total_count=0,
-                scraped_at=datetime.now().isoformat(),
-                source_url=base_url
-            )
+            collection = _empty_collection(base_url)
         
         # Phase 5: Validation and Cleaning
         if self.config.enable_validation and collection.properties:
@@ -288,27 +402,210 @@ class ScraperManager:
         return collection
     
     
+    def _create_extractor(self, driver) -> AssetPlanExtractorV2:
+        """Create an extractor on ``driver`` configured from the scraping config.
+        
+        Args:
+            driver: WebDriver instance the extractor will own
+            
+        Returns:
+            Configured extractor
+        """
+        extractor = AssetPlanExtractorV2(driver, base_url="https://www.assetplan.cl")
+        
+        # Configure extractor modes
+        if self.config.debug_mode:
+            extractor.enable_debug_mode(True)
+        
+        # Configure human-like behavior and extreme mode
+        extractor.configure_behavior_mode(
+            human_like=self.config.human_like_behavior,
+            behavior_mode=self.config.behavior_mode
+        )
+        return extractor
+    
+    def _parallel_driver_count(self) -> int:
+        """Number of drivers to use for the building extraction phase.
+        
+        Returns:
+            1 for the sequential single-driver path
+        """
+        max_typologies = self.config.max_typologies or 1
+        if max_typologies <= 1 or self.config.debug_mode:
+            return 1
+        
+        requested = self.config.parallel_drivers
+        if requested is None:
+            requested = (os.cpu_count() or 2) // 2
+        return max(1, min(requested, max_typologies))
+    
+    def _extract_buildings_in_parallel(self, extractor: AssetPlanExtractorV2, pool_size: int) -> PropertyCollection:
+        """Process buildings concurrently, one pooled driver per building.
+        
+        Selenium drivers are not thread-safe, so each building gets its own
+        driver from the pool and its own extractor for the duration of the task.
+        
+        Args:
+            extractor: Extractor used for the listing page and the final collection
+            pool_size: Number of drivers in the pool
+            
+        Returns:
+            Collection with the properties of all processed buildings
+        """
+        max_properties = self.config.max_properties
+        max_typologies = self.config.max_typologies
+        buildings = extractor.collect_building_cards()[:max_typologies]
+        
+        # Split max_properties across buildings, giving the remainder to the first ones
+        share, remainder = divmod(max_properties, max(1, len(buildings)))
+        quotas = [max(1, share + (index < remainder)) for index in range(len(buildings))]
+        
+        self.logger.info(
+            f"Processing {len(buildings)} buildings with {pool_size} drivers",
+            extra={"buildings_count": len(buildings), "pool_size": pool_size}
+        )
+        
+        async def extract_building(pool: AsyncDriverPool, building: Dict[str, Any], quota: int) -> List[Property]:
+            async with pool.driver() as driver:
+                worker = self._create_extractor(driver)
+                return await asyncio.to_thread(worker.process_building, building, quota)
+        
+        async def run() -> List[Any]:
+            async with AsyncDriverPool(size=pool_size, driver_type="chrome", **self._driver_options) as pool:
+                return await asyncio.gather(
+                    *(extract_building(pool, building, quota) for building, quota in zip(buildings, quotas)),
+                    return_exceptions=True
+                )
+        
+        properties: List[Property] = []
+        for building, result in zip(buildings, event_loop.run(run())):
+            if isinstance(result, BaseException):
+                self.logger.warning(f"Building {building.get('name', 'unknown')} failed: {result}")
+                continue
+            properties.extend(result)
+        
+        return extractor.build_collection(properties[:max_properties])
+    
+    def _prefetch_listing_pages(self, urls: List[str]) -> Dict[str, str]:
+        """Fetch listing pages without the browser.
+        
+        Args:
+            urls: Listing page URLs
+            
+        Returns:
+            Mapping of URL to HTML; empty if the fast path is unavailable
+        """
+        # aiohttp is only imported when the fast path is used
+        from ..infrastructure.http_cache import HTTPCache
+        from ..infrastructure.http_fetcher import prefetch_html
+        
+        cache = None
+        try:
+            if self.config.use_http_cache:
+                cache = HTTPCache(settings.http_cache_path)
+            pages = prefetch_html(urls, cache=cache)
+        except Exception as e:
+            self.logger.warning(f"Fast listing fetch failed, using browser: {e}")
+            return {}
+        finally:
+            if cache:
+                cache.close()
+        
+        self.logger.debug(
+            f"Prefetched {len(pages)}/{len(urls)} listing pages over HTTP",
+            extra={"prefetched_pages": len(pages)}
+        )
+        return pages
+    
     def _save_collection(self, collection: PropertyCollection) -> None:
         """Save property collection to file.
         
+        Large collections in "auto" mode are written to a sibling ``.msgpack``
+        file first; the JSON file is then encoded and written by a background
+        thread (joined in ``stop``).
+        
         Args:
             collection: Collection to save
         """
-        try:
-            output_file = self.config.output_file or settings.properties_json_path
+        if not self._use_msgpack(collection):
+            # Serialized straight to UTF-8 bytes by pydantic-core, without
+            # building the model_dump() dict tree first
+            self._write_output(self._output_path, lambda: collection.dump_json(indent=2), collection.total_count)
+            return
+        
+        # Dumped once for both formats; the dict shares no state with the
+        # returned collection, so callers can modify it during the JSON write
+        data = collection.model_dump(mode="json")
+        self._write_output(
+            self._output_path.with_suffix(".msgpack"),
+            lambda: msgpack.packb(data, use_bin_type=True),
+            collection.total_count
+        )
+        if self.config.output_format == "auto":
+            self._join_json_writer()
+            self._json_writer = threading.Thread(
+                target=self._write_output,
+                args=(self._output_path, lambda: _encode_json(data), collection.total_count),
+                name="json-writer"
+            )
+            self._json_writer.start()
+    
+    def _join_json_writer(self) -> None:
+        """Wait for a pending background JSON write to finish."""
+        if self._json_writer is not None:
+            self._json_writer.join()
+            self._json_writer = None
+    
+    def _use_msgpack(self, collection: PropertyCollection) -> bool:
+        """Decide whether a collection is saved as msgpack.
+        
+        Args:
+            collection: Collection to save
             
-            # Ensure output directory exists
-            Path(output_file).parent.mkdir(parents=True, exist_ok=True)
+        Returns:
+            True for output_format="msgpack", or "auto" above _MSGPACK_THRESHOLD
+            properties; False if msgpack is not installed
+        """
+        output_format = self.config.output_format
+        if output_format == "json":
+            return False
+        if output_format == "auto" and len(collection.properties) <= _MSGPACK_THRESHOLD:
+            return False
+        if msgpack is None:
+            self.logger.warning("msgpack is not installed, saving properties as JSON")
+            return False
+        return True
+    
+    def _write_output(self,
+                      output_file: Path,
+                      serialize: Callable[[], bytes],
+                      properties_count: int) -> None:
+        """Atomically write a serialized collection.
+        
+        Args:
+            output_file: Target file
+            serialize: Produces the file contents
+            properties_count: Number of properties saved (for logging)
+        """
+        # Written next to the target and swapped in with os.replace, so readers
+        # never see a half-written file
+        tmp_file = output_file.with_name(f".{output_file.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+        try:
+            if not self._output_dir_ready:
+                output_file.parent.mkdir(parents=True, exist_ok=True)
+                self._output_dir_ready = True
             
-            with open(output_file, 'w', encoding='utf-8') as f:
-                json.dump(collection.model_dump(mode='json'), f, ensure_ascii=False, indent=2)
+            with open(tmp_file, 'wb') as f:
+                f.write(serialize())
+            os.replace(tmp_file, output_file)
             
             self.logger.info(
                 f"Properties saved to {output_file}",
-                extra={"output_file": output_file, "properties_count": collection.total_count}
+                extra={"output_file": str(output_file), "properties_count": properties_count}
             )
             
         except Exception as e:
+            tmp_file.unlink(missing_ok=True)
             self.logger.error_with_context("Failed to save properties", e)
     
     def _report_progress(self, 
@@ -332,10 +629,37 @@ class ScraperManager:
         self.logger.debug(f"Progress: {message} ({percentage:.1f}%)", extra=progress_data)
         
         if callback:
+            if self._progress_thread is None:
+                self._progress_thread = threading.Thread(
+                    target=self._dispatch_progress, name="scraper-progress", daemon=True
+                )
+                self._progress_thread.start()
+            
+            item = (callback, progress_data)
             try:
+                self._progress_queue.put_nowait(item)
+            except queue.Full:
+                # Drop the oldest update in favour of the latest one
+                try:
+                    self._progress_queue.get_nowait()
+                    self._progress_queue.task_done()
+                except queue.Empty:
+                    pass
+                self._progress_queue.put_nowait(item)
+    
+    def _dispatch_progress(self) -> None:
+        """Invoke queued progress callbacks until the stop sentinel arrives."""
+        while True:
+            item = self._progress_queue.get()
+            try:
+                if item is None:
+                    return
+                callback, progress_data = item
                 callback(progress_data)
             except Exception as e:
                 self.logger.warning(f"Progress callback failed: {e}")
+            finally:
+                self._progress_queue.task_done()
     
     def _get_elapsed_time(self) -> float:
         """Get elapsed time since operation start.
@@ -343,8 +667,8 @@ class ScraperManager:
         Returns:
             Elapsed time in seconds
         """
-        if self.start_time:
-            return (datetime.now() - self.start_time).total_seconds()
+        if self._start_monotonic is not None:
+            return time.monotonic() - self._start_monotonic
         return 0.0
     
     def _log_final_performance_report(self) -> None:
@@ -407,13 +731,32 @@ class ScraperManager:
         }
         
         if self.performance_monitor:
-            status["performance"] = self.performance_monitor.get_performance_summary()
+            status["performance"] = self._cached_summary("performance", self.performance_monitor.get_performance_summary)
         
         if self.retry_manager:
-            status["retry_stats"] = self.retry_manager.get_retry_statistics()
+            status["retry_stats"] = self._cached_summary("retry", self.retry_manager.get_retry_statistics)
         
         return status
     
+    def _cached_summary(self, name: str, compute: Callable[[], Dict[str, Any]]) -> Dict[str, Any]:
+        """Return a summary computed at most once per _STATUS_CACHE_TTL.
+        
+        Args:
+            name: Cache slot name
+            compute: Function that builds the summary
+            
+        Returns:
+            Cached or freshly computed summary
+        """
+        now = time.monotonic()
+        cached = self._summary_cache.get(name)
+        if cached and now - cached[0] < _STATUS_CACHE_TTL:
+            return cached[1]
+        
+        value = compute()
+        self._summary_cache[name] = (now, value)
+        return value
+    
     def stop(self) -> None:
         """Stop the scraper gracefully."""
         self.logger.info("Stopping scraper...")
@@ -422,7 +765,16 @@ class ScraperManager:
         if self.performance_monitor:
             self.performance_monitor.stop_monitoring()
         
-        self.driver_manager.close()
+        self._join_json_writer()
+        
+        if self._progress_thread:
+            self._progress_queue.put(None)
+            self._progress_thread.join(timeout=5)
+            self._progress_thread = None
+        
+        # Cached drivers stay open for the next run (see close_cached_drivers)
+        if not _keep_driver():
+            self.driver_manager.close()
     
 def scrape_properties_quick(max_properties: int = 10, max_typologies: Optional[int] = None) -> PropertyCollection:
     """Quick scraping with default extreme mode.
@@ -495,4 +847,43 @@ def scrape_with_progress(max_properties: int = 25,
         progress_callback = default_progress
     
     with ScraperManager(config) as manager:
-        return manager.scrape_properties(progress_callback=progress_callback)
\ No newline at end of file
+        return manager.scrape_properties(progress_callback=progress_callback)
+
+
+def _scrape_url_worker(job: Tuple[str, int]) -> PropertyCollection:
+    """Process-pool entry point: quick-scrape one listing URL without saving."""
+    base_url, max_properties = job
+    config = ScrapingConfig(
+        max_properties=max_properties,
+        enable_detail_page_extraction=False,
+        save_raw_data=False  # Workers would overwrite each other's output file
+    )
+    
+    with ScraperManager(config) as manager:
+        return manager.scrape_properties(base_url=base_url)
+
+
+def scrape_urls_parallel(urls: List[str], 
+                         max_properties: int = 10,
+                         workers: int = 4) -> List[PropertyCollection]:
+    """Quick-scrape several listing URLs in parallel, one browser per process.
+    
+    Selenium drivers must not be shared between threads, so each URL is
+    scraped in its own worker process. Processes are spawned rather than
+    forked to keep Chrome and logging threads out of the children.
+    
+    Args:
+        urls: Listing URLs (e.g. https://www.assetplan.cl/arriendo/departamento/...)
+        max_properties: Maximum properties to scrape per URL
+        workers: Maximum number of worker processes
+        
+    Returns:
+        One PropertyCollection per URL, in the same order
+    """
+    if not urls:
+        return []
+    
+    jobs = [(url, max_properties) for url in urls]
+    with ProcessPoolExecutor(max_workers=max(1, min(workers, len(urls))),
+                             mp_context=multiprocessing.get_context("spawn")) as executor:
+        return list(executor.map(_scrape_url_worker, jobs))
@@ -1,5 +1,6 @@
-import os
+from functools import lru_cache
 
+from pydantic import model_validator
 from pydantic_settings import BaseSettings
 
 
@@ -7,10 +8,10 @@ class Settings(BaseSettings):
     """Application configuration settings."""
     
     # Model Configuration - Switch between OpenAI and Local
-    use_local_models: bool = os.getenv("USE_LOCAL_MODELS", "false").lower() == "true"
+    use_local_models: bool = False
     
     # OpenAI Configuration
-    openai_api_key: str = os.getenv("OPENAI_API_KEY", "")
+    openai_api_key: str = ""
     openai_model: str = "gpt-3.5-turbo"
     
     # Local Models Configuration (GGUF files)
@@ -19,18 +20,20 @@ class Settings(BaseSettings):
     local_embedding_hf_model: str = "sentence-transformers/paraphrase-multilingual-MiniLM-L12-v2"  # Fallback embedding model
     local_llm_n_ctx: int = 4096  # Context window size
     local_llm_n_threads: int = 8  # Number of threads
+    local_llm_n_batch: int = 256  # Prompt tokens evaluated per llama.cpp batch
     local_llm_temperature: float = 0.1  # Low temperature for factual responses
     
     # GPU Configuration
-    use_gpu: bool = os.getenv("USE_GPU", "true").lower() == "true"  # Enable GPU by default if available
-    gpu_layers: int = int(os.getenv("GPU_LAYERS", "25"))  # Number of layers to offload to GPU (RTX 3050: 25-30 optimal)
-    gpu_memory_limit: float = float(os.getenv("GPU_MEMORY_LIMIT", "5.5"))  # GPU memory limit in GB (conservative for 8GB)
-    embedding_device: str = "cuda" if use_gpu else "cpu"  # Device for embeddings
+    use_gpu: bool = True  # Enable GPU by default if available
+    gpu_layers: int = 25  # Number of layers to offload to GPU (RTX 3050: 25-30 optimal)
+    gpu_memory_limit: float = 5.5  # GPU memory limit in GB (conservative for 8GB)
+    embedding_device: str = "cuda"  # Device for embeddings (defaults to "cpu" when use_gpu is off)
     
     # Scraping Configuration
     scraping_delay: float = 0.5
     max_properties: int = 50  # Updated for challenge requirement
     headless_browser: bool = True
+    webdriver_pool_size: int = 32  # HTTP connections from each WebDriver client to its driver service
     
     # Vector Store Configuration
     embedding_model: str = "text-embedding-ada-002"  # Will be overridden if using local models
@@ -45,6 +48,7 @@ class Settings(BaseSettings):
     retrieval_k: int = 5
     similarity_threshold: float = 0.7
     max_sources: int = 10
+    answer_cache_size: int = 256  # Answers kept per RAG chain for repeated questions (0 disables)
     
     # Logging Configuration
     log_level: str = "INFO"
@@ -54,8 +58,24 @@ class Settings(BaseSettings):
     properties_json_path: str = "data/properties.json"
     logs_dir: str = "logs"
     data_dir: str = "data"
+    http_cache_path: str = "data/http_cache.sqlite"
     
+    # Environment variables (USE_GPU, OPENAI_API_KEY, ...) and .env are read
+    # by pydantic-settings when the instance is created
     model_config = {"env_file": ".env"}
+    
+    @model_validator(mode="after")
+    def _default_embedding_device(self) -> "Settings":
+        """Fall back to CPU embeddings when the GPU is disabled and no device was set."""
+        if "embedding_device" not in self.model_fields_set and not self.use_gpu:
+            self.embedding_device = "cpu"
+        return self
+
+
+@lru_cache(maxsize=None)
+def get_settings() -> Settings:
+    """Return the process-wide Settings, reading the environment only once."""
+    return Settings()
 
 
-settings = Settings()
\ No newline at end of file
+settings = get_settings()
\ No newline at end of file
@@ -1,12 +1,25 @@
 """
 FAISS Vector Store implementation for property embeddings with LangChain integration.
 """
+import asyncio
+import hashlib
+import json
 import logging
+import os
 import pickle
+import tempfile
+import threading
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Dict, Iterable, List, Optional, Tuple, Union
 
+import faiss
+import numpy as np
+from langchain_community.docstore.in_memory import InMemoryDocstore
 from langchain_community.vectorstores import FAISS
+from langchain_community.vectorstores.utils import DistanceStrategy
 from langchain_openai import OpenAIEmbeddings
 
 try:
@@ -17,43 +30,138 @@ except ImportError:
 from langchain_core.documents import Document
 from langchain_core.embeddings import Embeddings
 
-from ..scraper.models import Property, PropertyCollection
+from ..scraper.models import Property
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - orjson is listed in requirements
+    orjson = None
+
 from ..utils.config import settings
 
 logger = logging.getLogger(__name__)
 
+# File inside the index directory holding previously computed embeddings
+EMBEDDING_CACHE_FILE = "emb_cache.npz"
+
+# Collections at least this large get an approximate HNSW index; smaller
+# ones are scanned in full. Both store unit-length vectors as float16 and
+# search by inner product, so scores are cosine similarities.
+HNSW_MIN_VECTORS = 10_000
+HNSW_NEIGHBORS = 32
+HNSW_EF_CONSTRUCTION = 200
+HNSW_EF_SEARCH = 64
+
+# Saved indexes are memory-mapped read-only on load, so vector codes are paged
+# in from the OS page cache on demand instead of copied into RAM
+# (IO_FLAG_MMAP_IFC needs faiss >= 1.8; older versions map IVF lists only)
+INDEX_IO_FLAGS = getattr(faiss, "IO_FLAG_MMAP_IFC", faiss.IO_FLAG_MMAP) | faiss.IO_FLAG_READ_ONLY
+
+# OpenAI embedding requests kept in flight at once when indexing
+OPENAI_EMBED_CONCURRENCY = 8
+
+# Local GPU embedding batch size; halved on CUDA out-of-memory errors
+GPU_EMBED_BATCH_SIZE = 128
+
+# (label, attribute, template, keep falsy values) in page_content order.
+# Counts keep 0 (e.g. studios with 0 bedrooms); other empty fields are skipped.
+_CONTENT_FIELDS = (
+    ("Título", "title", "{}", True),
+    ("Tipo", "property_type", "{}", False),
+    ("Ubicación", "location", "{}", False),
+    ("Precio", "price", "{}", False),
+    ("Precio UF", "price_uf", "{}", False),
+    ("Superficie", "area_m2", "{} m²", False),
+    ("Dormitorios", "bedrooms", "{}", True),
+    ("Baños", "bathrooms", "{}", True),
+    ("Descripción", "description", "{}", False),
+)
+
+
+class AdaptiveBatchEmbeddings(Embeddings):
+    """Embeddings wrapper that backs off on CUDA out-of-memory errors.
+    
+    Documents are embedded in chunks of ``batch_size``. A chunk that runs out
+    of GPU memory is retried at half the size, and after ``recovery_streak``
+    successful chunks the size doubles again, up to the configured target.
+    """
+    
+    def __init__(self,
+                 embeddings: Embeddings,
+                 batch_size: int,
+                 min_batch_size: int = 1,
+                 recovery_streak: int = 8):
+        """Wrap an embeddings model.
+        
+        Args:
+            embeddings: Model that does the embedding (one chunk per call)
+            batch_size: Target chunk size
+            min_batch_size: Smallest chunk size before giving up on OOM
+            recovery_streak: Successful chunks needed before doubling the size
+        """
+        self.embeddings = embeddings
+        self.target_batch_size = batch_size
+        self.batch_size = batch_size
+        self.min_batch_size = min_batch_size
+        self.recovery_streak = recovery_streak
+    
+    @property
+    def model_name(self) -> Optional[str]:
+        """Name of the wrapped model (used in embedding cache keys)."""
+        return getattr(self.embeddings, "model_name", None)
+    
+    def embed_documents(self, texts: List[str]) -> List[List[float]]:
+        """Embed texts chunk by chunk, adapting the chunk size to GPU memory."""
+        vectors: List[List[float]] = []
+        start = 0
+        streak = 0
+        while start < len(texts):
+            chunk = texts[start:start + self.batch_size]
+            try:
+                vectors.extend(self.embeddings.embed_documents(chunk))
+            except RuntimeError as e:
+                # torch.cuda.OutOfMemoryError is a RuntimeError subclass
+                if "out of memory" not in str(e) or self.batch_size <= self.min_batch_size:
+                    raise
+                _release_cuda_memory()
+                self.batch_size = max(self.batch_size // 2, self.min_batch_size)
+                streak = 0
+                logger.warning(f"Embedding ran out of GPU memory, retrying with batch size {self.batch_size}")
+                continue
+            
+            start += len(chunk)
+            streak += 1
+            if streak >= self.recovery_streak and self.batch_size < self.target_batch_size:
+                self.batch_size = min(self.batch_size * 2, self.target_batch_size)
+                streak = 0
+        return vectors
+    
+    def embed_query(self, text: str) -> List[float]:
+        """Embed a single query with the wrapped model."""
+        return self.embeddings.embed_query(text)
+
+
+def _release_cuda_memory() -> None:
+    """Return cached CUDA blocks to the driver after an out-of-memory error."""
+    try:
+        import torch
+    except ImportError:  # pragma: no cover - OOM errors only come from torch
+        return
+    if torch.cuda.is_available():
+        torch.cuda.empty_cache()
+
 
 def create_embeddings_model() -> Embeddings:
-    """Create and return the appropriate embeddings model based on configuration."""
+    """Create and return the appropriate embeddings model based on configuration.
+    
+    Local models are loaded once per (model, device) and shared by every
+    caller; embedding is stateless, so one instance can serve several
+    PropertyVectorStore objects.
+    """
     if settings.use_local_models:
-        logger.info("🏠 Initializing LOCAL embeddings model with HuggingFace")
-        
         # Use HuggingFace multilingual model for better Spanish support
         device = settings.embedding_device if settings.use_gpu else 'cpu'
-        
-        model_kwargs = {
-            'device': device,
-            'trust_remote_code': True
-        }
-        
-        # Add GPU-specific optimizations
-        if settings.use_gpu and device == 'cuda':
-            logger.info(f"🚀 Embeddings GPU acceleration enabled on {device}")
-            # Note: torch_dtype is not supported in SentenceTransformer constructor
-            # Half precision optimization is handled internally by the model
-        else:
-            logger.info(f"💻 Embeddings using device: {device}")
-        
-        return HuggingFaceEmbeddings(
-            model_name=settings.local_embedding_hf_model,
-            model_kwargs=model_kwargs,
-            encode_kwargs={
-                'normalize_embeddings': True,
-                'batch_size': 32 if settings.use_gpu else 8,  # Larger batch for GPU
-                'convert_to_tensor': True,
-                'device': device
-            }
-        )
+        return _create_local_embeddings(settings.local_embedding_hf_model, device, settings.use_gpu)
     else:
         logger.info("🌐 Initializing OpenAI embeddings model")
         return OpenAIEmbeddings(
@@ -62,6 +170,48 @@ def create_embeddings_model() -> Embeddings:
         )
 
 
+@lru_cache(maxsize=None)
+def _create_local_embeddings(model_name: str, device: str, use_gpu: bool) -> Embeddings:
+    """Load a local HuggingFace embeddings model (cached by arguments).
+    
+    Args:
+        model_name: HuggingFace model name
+        device: Torch device to run on
+        use_gpu: Whether GPU batch sizes apply
+        
+    Returns:
+        Embeddings model
+    """
+    logger.info("🏠 Initializing LOCAL embeddings model with HuggingFace")
+    
+    model_kwargs = {
+        'device': device,
+        'trust_remote_code': True
+    }
+    
+    # Add GPU-specific optimizations
+    if use_gpu and device == 'cuda':
+        logger.info(f"🚀 Embeddings GPU acceleration enabled on {device}")
+        # Note: torch_dtype is not supported in SentenceTransformer constructor
+        # Half precision optimization is handled internally by the model
+    else:
+        logger.info(f"💻 Embeddings using device: {device}")
+    
+    embeddings = HuggingFaceEmbeddings(
+        model_name=model_name,
+        model_kwargs=model_kwargs,
+        # Numpy output (the default) feeds .tolist() without an extra
+        # tensor copy; the device is already set in model_kwargs
+        encode_kwargs={
+            'normalize_embeddings': True,
+            'batch_size': GPU_EMBED_BATCH_SIZE if use_gpu else 32  # Whole collection is embedded in one call
+        }
+    )
+    if device == 'cuda':
+        return AdaptiveBatchEmbeddings(embeddings, batch_size=GPU_EMBED_BATCH_SIZE)
+    return embeddings
+
+
 class PropertyVectorStore:
     """FAISS-based vector store for property documents with LangChain integration."""
     
@@ -78,113 +228,288 @@ class PropertyVectorStore:
         self.embeddings = embeddings or create_embeddings_model()
         self.index_path = index_path or settings.faiss_index_path
         self.vector_store: Optional[FAISS] = None
-        self.property_metadata: List[Dict[str, Any]] = []
+        self._property_metadata: Optional[List[Dict[str, Any]]] = []
+        self._cache_writer: Optional[threading.Thread] = None
         
         # Ensure index directory exists
         Path(self.index_path).parent.mkdir(parents=True, exist_ok=True)
         
-    def create_documents_from_properties(self, properties: List[Property]) -> List[Document]:
+    @property
+    def property_metadata(self) -> List[Dict[str, Any]]:
+        """Per-document metadata, read from the FAISS docstore on first access after a load."""
+        if self._property_metadata is None:
+            self._property_metadata = []
+            if self.vector_store is not None:
+                docstore = self.vector_store.docstore
+                id_map = self.vector_store.index_to_docstore_id
+                self._property_metadata = [
+                    docstore.search(id_map[i]).metadata for i in range(len(id_map))
+                ]
+        return self._property_metadata
+    
+    @property_metadata.setter
+    def property_metadata(self, metadata: Optional[List[Dict[str, Any]]]) -> None:
+        self._property_metadata = metadata
+    
+    def create_documents_from_properties(self, properties: Iterable[Property]) -> List[Document]:
         """Convert Property objects to LangChain Documents.
         
         Args:
-            properties: List of Property objects
+            properties: Property objects (any iterable)
             
         Returns:
             List of LangChain Document objects
         """
-        documents = []
-        
-        for prop in properties:
-            # Create comprehensive text content for embedding
-            content_parts = []
-            
-            # Basic information
-            content_parts.append(f"Título: {prop.title}")
-            
-            if prop.property_type:
-                content_parts.append(f"Tipo: {prop.property_type}")
-            
-            if prop.location:
-                content_parts.append(f"Ubicación: {prop.location}")
-            
-            # Price information
-            if prop.price:
-                content_parts.append(f"Precio: {prop.price}")
-            if prop.price_uf:
-                content_parts.append(f"Precio UF: {prop.price_uf}")
-            
-            # Physical characteristics
-            if prop.area_m2:
-                content_parts.append(f"Superficie: {prop.area_m2} m²")
-            if prop.bedrooms is not None:
-                content_parts.append(f"Dormitorios: {prop.bedrooms}")
-            if prop.bathrooms is not None:
-                content_parts.append(f"Baños: {prop.bathrooms}")
-            
-            # Description
-            if prop.description:
-                content_parts.append(f"Descripción: {prop.description}")
-            
-            # Combine all content
-            page_content = " | ".join(content_parts)
-            
-            # Create metadata for retrieval and citation
-            metadata = {
-                "property_id": prop.id or str(hash(str(prop.url))),
-                "title": prop.title,
-                "property_type": prop.property_type,
-                "location": prop.location,
-                "price": prop.price,
-                "price_uf": prop.price_uf,
-                "area_m2": prop.area_m2,
-                "bedrooms": prop.bedrooms,
-                "bathrooms": prop.bathrooms,
-                "url": str(prop.url),
-                "images": prop.images,
-                "source": "assetplan.cl"
-            }
-            
-            # Create LangChain Document
-            document = Document(
-                page_content=page_content,
-                metadata=metadata
-            )
-            
-            documents.append(document)
+        documents = [
+            Document(page_content=page_content, metadata=metadata)
+            for page_content, metadata in map(self._document_fields, properties)
+        ]
         
         logger.info(f"Created {len(documents)} documents from properties")
         return documents
     
-    def load_properties_and_create_index(self, properties: List[Property]) -> None:
+    @staticmethod
+    def _document_fields(prop: Property) -> Tuple[str, Dict[str, Any]]:
+        """Build the embedding text and citation metadata for one property.
+        
+        Args:
+            prop: Property to describe
+            
+        Returns:
+            (page_content, metadata) tuple
+        """
+        # Create comprehensive text content for embedding
+        page_content = " | ".join([
+            f"{label}: {template.format(value)}"
+            for label, attr, template, keep_falsy in _CONTENT_FIELDS
+            if (value := getattr(prop, attr)) is not None and (keep_falsy or value)
+        ])
+        
+        # Create metadata for retrieval and citation
+        metadata = {
+            "property_id": prop.id or str(hash(str(prop.url))),
+            "title": prop.title,
+            "property_type": prop.property_type,
+            "location": prop.location,
+            "price": prop.price,
+            "price_uf": prop.price_uf,
+            "area_m2": prop.area_m2,
+            "bedrooms": prop.bedrooms,
+            "bathrooms": prop.bathrooms,
+            "url": str(prop.url),
+            # Only the count: image URLs stay in the scraped JSON instead of
+            # being copied into every docstore entry and the metadata file
+            "image_count": len(prop.images),
+            "source": "assetplan.cl"
+        }
+        return page_content, metadata
+    
+    def load_properties_and_create_index(self, properties: Iterable[Property]) -> None:
         """Load properties and create FAISS index.
         
         Args:
-            properties: List of Property objects to index
+            properties: Property objects to index; a generator is consumed
+                one property at a time
         """
-        logger.info(f"Creating FAISS index from {len(properties)} properties")
+        # Texts and metadata are collected directly, without Document objects
+        texts: List[str] = []
+        metadatas: List[Dict[str, Any]] = []
+        for prop in properties:
+            page_content, metadata = self._document_fields(prop)
+            texts.append(page_content)
+            metadatas.append(metadata)
         
-        # Convert properties to documents
-        documents = self.create_documents_from_properties(properties)
+        logger.info(f"Creating FAISS index from {len(texts)} properties")
         
-        if not documents:
+        if not texts:
             logger.warning("No documents to index")
             return
         
-        # Create FAISS vector store from documents
+        # Embed every text in one call so the model batches them itself, then
+        # build the index from the precomputed vectors while the embedding
+        # cache is written in the background
         try:
-            self.vector_store = FAISS.from_documents(
-                documents=documents,
-                embedding=self.embeddings
-            )
+            vectors = self._embed_with_cache(texts)
+            self.vector_store = self._build_faiss_store(texts, vectors, metadatas)
             
             # Store metadata separately for easy access
-            self.property_metadata = [doc.metadata for doc in documents]
+            self.property_metadata = metadatas
             
-            logger.info(f"Successfully created FAISS index with {len(documents)} documents")
+            logger.info(f"Successfully created FAISS index with {len(texts)} documents")
             
         except Exception as e:
             logger.error(f"Failed to create FAISS index: {e}")
             raise
+        finally:
+            self._wait_for_cache_writer()
+    
+    def _build_faiss_store(self,
+                           texts: List[str],
+                           vectors: Union[np.ndarray, List[List[float]]],
+                           metadatas: List[Dict[str, Any]]) -> FAISS:
+        """Build a LangChain FAISS store over precomputed vectors.
+        
+        Args:
+            texts: Document texts
+            vectors: Embedding vectors, aligned with ``texts``
+            metadatas: Document metadata, aligned with ``texts``
+            
+        Returns:
+            Inner-product FAISS store over the normalized vectors, backed by an
+            HNSW index for large collections or a flat scan otherwise, both
+            with float16 vector storage
+        """
+        matrix = np.asarray(vectors, dtype=np.float32)
+        faiss.normalize_L2(matrix)
+        
+        dimension = matrix.shape[1]
+        if len(matrix) >= HNSW_MIN_VECTORS:
+            index = faiss.IndexHNSWSQ(dimension, faiss.ScalarQuantizer.QT_fp16, HNSW_NEIGHBORS,
+                                      faiss.METRIC_INNER_PRODUCT)
+            index.hnsw.efConstruction = HNSW_EF_CONSTRUCTION
+            index.hnsw.efSearch = HNSW_EF_SEARCH
+        else:
+            index = faiss.IndexScalarQuantizer(dimension, faiss.ScalarQuantizer.QT_fp16,
+                                               faiss.METRIC_INNER_PRODUCT)
+        if not index.is_trained:
+            index.train(matrix)
+        
+        store = FAISS(
+            embedding_function=self.embeddings,
+            index=index,
+            docstore=InMemoryDocstore(),
+            index_to_docstore_id={},
+            distance_strategy=DistanceStrategy.MAX_INNER_PRODUCT
+        )
+        store.add_embeddings(zip(texts, matrix), metadatas=metadatas)
+        return store
+    
+    def _embed_with_cache(self, texts: List[str]) -> np.ndarray:
+        """Embed texts, reusing vectors cached from earlier index builds.
+        
+        Only texts missing from ``<index_path>/emb_cache.npz`` reach the
+        embedding model. The updated cache is written on a background thread
+        (see _wait_for_cache_writer) so the caller can build the index
+        meanwhile.
+        
+        Args:
+            texts: Texts to embed
+            
+        Returns:
+            float32 matrix with one row per text, in the same order as ``texts``
+        """
+        cache_path = Path(self.index_path) / EMBEDDING_CACHE_FILE
+        self._wait_for_cache_writer()
+        cache = self._load_embedding_cache(cache_path)
+        
+        # The model is part of the key so switching models never reuses vectors
+        model_id = getattr(self.embeddings, "model_name", None) or getattr(self.embeddings, "model", None) \
+            or type(self.embeddings).__name__
+        keys = [hashlib.sha1(f"{model_id}\0{text}".encode("utf-8")).digest() for text in texts]
+        
+        unique_texts = dict(zip(keys, texts))
+        misses = [key for key in unique_texts if key not in cache]
+        if misses:
+            new_vectors = self._embed_sorted_by_length([unique_texts[key] for key in misses])
+            for key, vector in zip(misses, new_vectors):
+                cache[key] = np.asarray(vector, dtype=np.float16)
+            self._cache_writer = threading.Thread(
+                target=self._save_embedding_cache,
+                args=(cache_path, cache),
+                name="embedding-cache-writer"
+            )
+            self._cache_writer.start()
+        
+        logger.info(f"Embedding cache: {len(unique_texts) - len(misses)} hits, {len(misses)} misses")
+        return np.stack([cache[key] for key in keys]).astype(np.float32)
+    
+    def _wait_for_cache_writer(self) -> None:
+        """Block until the background embedding cache write, if any, is done."""
+        if self._cache_writer is not None:
+            self._cache_writer.join()
+            self._cache_writer = None
+    
+    @staticmethod
+    def _load_embedding_cache(cache_path: Path) -> Dict[bytes, np.ndarray]:
+        """Load the embedding cache, or an empty one if missing or unreadable."""
+        if not cache_path.exists():
+            return {}
+        try:
+            with np.load(cache_path) as data:
+                return dict(zip(data["keys"].tolist(), data["vectors"]))
+        except Exception as e:
+            logger.warning(f"Ignoring unreadable embedding cache {cache_path}: {e}")
+            return {}
+    
+    @staticmethod
+    def _save_embedding_cache(cache_path: Path, cache: Dict[bytes, np.ndarray]) -> None:
+        """Atomically write the embedding cache as float16 vectors."""
+        tmp_path = cache_path.with_name(f".{cache_path.name}.{os.getpid()}.tmp")
+        try:
+            cache_path.parent.mkdir(parents=True, exist_ok=True)
+            with open(tmp_path, "wb") as f:
+                np.savez(
+                    f,
+                    keys=np.array(list(cache), dtype="S20"),
+                    vectors=np.stack(list(cache.values())).astype(np.float16)
+                )
+            os.replace(tmp_path, cache_path)
+        except Exception as e:
+            tmp_path.unlink(missing_ok=True)
+            logger.warning(f"Failed to save embedding cache {cache_path}: {e}")
+    
+    def _embed_sorted_by_length(self, texts: List[str]) -> List[List[float]]:
+        """Embed texts ordered by length so each batch pads to a similar size.
+        
+        Args:
+            texts: Texts to embed
+            
+        Returns:
+            Embedding vectors in the same order as ``texts``
+        """
+        order = sorted(range(len(texts)), key=lambda i: len(texts[i]))
+        sorted_vectors = self._embed_documents([texts[i] for i in order])
+        
+        vectors: List[List[float]] = [None] * len(texts)
+        for position, i in enumerate(order):
+            vectors[i] = sorted_vectors[position]
+        return vectors
+    
+    def _embed_documents(self, texts: List[str]) -> List[List[float]]:
+        """Embed texts, sending OpenAI requests concurrently.
+        
+        Local models embed in a single blocking call. With OpenAI, each
+        ``chunk_size`` slice is one HTTPS request, so they are awaited together.
+        
+        Args:
+            texts: Texts to embed
+            
+        Returns:
+            Embedding vectors in the same order as ``texts``
+        """
+        if not isinstance(self.embeddings, OpenAIEmbeddings) or len(texts) <= self.embeddings.chunk_size:
+            return self.embeddings.embed_documents(texts)
+        return _run_sync(self._aembed_all(texts))
+    
+    async def _aembed_all(self, texts: List[str]) -> List[List[float]]:
+        """Embed ``chunk_size`` slices of ``texts`` concurrently.
+        
+        Args:
+            texts: Texts to embed
+            
+        Returns:
+            Embedding vectors in the same order as ``texts``
+        """
+        chunk_size = self.embeddings.chunk_size
+        semaphore = asyncio.Semaphore(OPENAI_EMBED_CONCURRENCY)
+        
+        async def embed_chunk(chunk: List[str]) -> List[List[float]]:
+            async with semaphore:
+                return await self.embeddings.aembed_documents(chunk)
+        
+        chunks = [texts[i:i + chunk_size] for i in range(0, len(texts), chunk_size)]
+        results = await asyncio.gather(*(embed_chunk(chunk) for chunk in chunks))
+        return [vector for chunk_vectors in results for vector in chunk_vectors]
     
     def load_from_json(self, json_path: str) -> None:
         """Load properties from JSON file and create index.
@@ -192,23 +517,22 @@ class PropertyVectorStore:
         Args:
             json_path: Path to JSON file with property data
         """
-        import json
-        
         logger.info(f"Loading properties from {json_path}")
         
         try:
-            with open(json_path, 'r', encoding='utf-8') as f:
-                data = json.load(f)
+            with open(json_path, 'rb') as f:
+                raw = f.read()
+            data = orjson.loads(raw) if orjson is not None else json.loads(raw)
             
-            # Parse as PropertyCollection
+            # A PropertyCollection dump, or a plain list of properties
             if isinstance(data, dict) and 'properties' in data:
-                collection = PropertyCollection(**data)
-                properties = collection.properties
+                records = data['properties']
             else:
-                # Assume it's a list of properties
-                properties = [Property(**prop_data) for prop_data in data]
+                records = data
             
-            self.load_properties_and_create_index(properties)
+            # Validated one at a time as the index consumes them, instead of
+            # building every Property up front
+            self.load_properties_and_create_index(Property.model_validate(record) for record in records)
             
         except Exception as e:
             logger.error(f"Failed to load properties from JSON: {e}")
@@ -227,13 +551,20 @@ class PropertyVectorStore:
         save_path = path or self.index_path
         
         try:
-            # Save FAISS index
-            self.vector_store.save_local(save_path)
-            
-            # Save metadata separately
-            metadata_path = Path(save_path) / "metadata.pkl"
-            with open(metadata_path, 'wb') as f:
-                pickle.dump(self.property_metadata, f)
+            # Save FAISS index to a scratch directory and move the files into
+            # place, so processes that have the old index.faiss memory-mapped
+            # keep reading a complete file
+            save_dir = Path(save_path)
+            save_dir.mkdir(parents=True, exist_ok=True)
+            with tempfile.TemporaryDirectory(dir=save_dir, prefix=".saving-") as tmp_dir:
+                self.vector_store.save_local(tmp_dir)
+                for saved_file in Path(tmp_dir).iterdir():
+                    os.replace(saved_file, save_dir / saved_file.name)
+            
+            # Metadata lives in the docstore saved above; drop the separate
+            # metadata files older versions wrote next to the index
+            for stale_file in ("metadata.pkl", "metadata.parquet"):
+                (save_dir / stale_file).unlink(missing_ok=True)
             
             logger.info(f"FAISS index saved to {save_path}")
             
@@ -257,18 +588,23 @@ class PropertyVectorStore:
                 logger.info(f"Index path {load_path} does not exist")
                 return False
             
-            # Load FAISS index
-            self.vector_store = FAISS.load_local(
-                load_path, 
-                self.embeddings,
-                allow_dangerous_deserialization=True  # Required for FAISS loading
+            # Read the files FAISS.save_local wrote ourselves: load_local only
+            # accepts io_flags from langchain-community 0.4.2 on
+            index = faiss.read_index(str(Path(load_path) / "index.faiss"), INDEX_IO_FLAGS)
+            with open(Path(load_path) / "index.pkl", "rb") as f:
+                docstore, index_to_docstore_id = pickle.load(f)
+            self.vector_store = FAISS(
+                embedding_function=self.embeddings,
+                index=index,
+                docstore=docstore,
+                index_to_docstore_id=index_to_docstore_id
             )
+            # Indexes saved before the switch to inner product still use L2
+            if self.vector_store.index.metric_type == faiss.METRIC_INNER_PRODUCT:
+                self.vector_store.distance_strategy = DistanceStrategy.MAX_INNER_PRODUCT
             
-            # Load metadata
-            metadata_path = Path(load_path) / "metadata.pkl"
-            if metadata_path.exists():
-                with open(metadata_path, 'rb') as f:
-                    self.property_metadata = pickle.load(f)
+            # Metadata is read from the docstore on first access
+            self.property_metadata = None
             
             logger.info(f"FAISS index loaded from {load_path}")
             return True
@@ -286,7 +622,8 @@ class PropertyVectorStore:
         Args:
             query: Search query
             k: Number of results to return
-            score_threshold: Minimum similarity score
+            score_threshold: Minimum cosine similarity (1/(1+distance) for
+                indexes built with L2)
             
         Returns:
             List of (Document, score) tuples
@@ -296,19 +633,24 @@ class PropertyVectorStore:
             return []
         
         try:
-            # Perform similarity search with scores
-            results = self.vector_store.similarity_search_with_score(
-                query=query,
-                k=k
-            )
+            if self.vector_store.distance_strategy == DistanceStrategy.MAX_INNER_PRODUCT:
+                # Unit-length query against unit-length vectors: the inner
+                # product is already the cosine similarity
+                query_vector = np.asarray([self.embeddings.embed_query(query)], dtype=np.float32)
+                faiss.normalize_L2(query_vector)
+                results = self.vector_store.similarity_search_with_score_by_vector(
+                    embedding=query_vector[0].tolist(),
+                    k=k
+                )
+            else:
+                # Legacy L2 index (FAISS returns distance, lower is better)
+                # Convert distance to similarity: similarity = 1 / (1 + distance)
+                results = [
+                    (doc, 1 / (1 + distance))
+                    for doc, distance in self.vector_store.similarity_search_with_score(query=query, k=k)
+                ]
             
-            # Filter by score threshold (FAISS returns distance, lower is better)
-            # Convert distance to similarity: similarity = 1 / (1 + distance)
-            filtered_results = []
-            for doc, distance in results:
-                similarity = 1 / (1 + distance)
-                if similarity >= score_threshold:
-                    filtered_results.append((doc, similarity))
+            filtered_results = [(doc, similarity) for doc, similarity in results if similarity >= score_threshold]
             
             logger.info(f"Found {len(filtered_results)} properties matching query: {query}")
             return filtered_results
@@ -317,6 +659,55 @@ class PropertyVectorStore:
             logger.error(f"Error during property search: {e}")
             return []
     
+    def search_properties_batch(self,
+                                queries: List[str],
+                                k: int = 5,
+                                score_threshold: float = 0.7) -> List[List[Tuple[Document, float]]]:
+        """Search for several queries with one embedding call and one FAISS search.
+        
+        FAISS spreads a multi-query search across cores, so this is faster
+        than calling search_properties in a loop.
+        
+        Args:
+            queries: Search queries
+            k: Number of results to return per query
+            score_threshold: Minimum similarity score (same scale as search_properties)
+            
+        Returns:
+            One list of (Document, score) tuples per query
+        """
+        if not self.vector_store:
+            logger.warning("No vector store available for search")
+            return [[] for _ in queries]
+        if not queries:
+            return []
+        
+        try:
+            query_vectors = np.asarray(self.embeddings.embed_documents(queries), dtype=np.float32)
+            inner_product = self.vector_store.distance_strategy == DistanceStrategy.MAX_INNER_PRODUCT
+            if inner_product:
+                faiss.normalize_L2(query_vectors)
+            scores, positions = self.vector_store.index.search(query_vectors, k)
+            
+            results = []
+            for row_scores, row_positions in zip(scores, positions):
+                matches = []
+                for score, position in zip(row_scores.tolist(), row_positions.tolist()):
+                    if position == -1:
+                        continue
+                    similarity = score if inner_product else 1 / (1 + score)
+                    if similarity >= score_threshold:
+                        doc_id = self.vector_store.index_to_docstore_id[position]
+                        matches.append((self.vector_store.docstore.search(doc_id), similarity))
+                results.append(matches)
+            
+            logger.info(f"Batch search of {len(queries)} queries found {sum(map(len, results))} properties")
+            return results
+            
+        except Exception as e:
+            logger.error(f"Error during batch property search: {e}")
+            return [[] for _ in queries]
+    
     def get_retriever(self, k: int = 5):
         """Get LangChain retriever for RAG applications.
         
@@ -349,31 +740,14 @@ class PropertyVectorStore:
             document_count = index.ntotal if hasattr(index, 'ntotal') else len(self.property_metadata)
             
             # Analyze property types and locations
-            property_types = {}
-            locations = {}
-            price_ranges = {"with_price": 0, "without_price": 0}
-            
-            for metadata in self.property_metadata:
-                # Property types
-                prop_type = metadata.get('property_type', 'Unknown')
-                property_types[prop_type] = property_types.get(prop_type, 0) + 1
-                
-                # Locations
-                location = metadata.get('location', 'Unknown')
-                locations[location] = locations.get(location, 0) + 1
-                
-                # Price info
-                if metadata.get('price_uf') or metadata.get('price'):
-                    price_ranges["with_price"] += 1
-                else:
-                    price_ranges["without_price"] += 1
+            property_types, locations, price_ranges = self._metadata_stats()
             
             return {
                 "status": "loaded",
                 "document_count": document_count,
                 "embedding_dimension": index.d if hasattr(index, 'd') else "unknown",
                 "property_types": property_types,
-                "top_locations": dict(sorted(locations.items(), key=lambda x: x[1], reverse=True)[:5]),
+                "top_locations": dict(Counter(locations).most_common(5)),
                 "price_coverage": price_ranges,
                 "index_path": self.index_path
             }
@@ -383,6 +757,35 @@ class PropertyVectorStore:
             return {"status": "error", "error": str(e)}
 
 
+    def _metadata_stats(self) -> Tuple[Dict[Any, int], Dict[Any, int], Dict[str, int]]:
+        """Count property types, locations and priced documents.
+        
+        Returns:
+            (property type counts, location counts, price coverage)
+        """
+        metadata = self.property_metadata
+        property_types = Counter(m.get('property_type', 'Unknown') for m in metadata)
+        locations = Counter(m.get('location', 'Unknown') for m in metadata)
+        with_price = sum(1 for m in metadata if m.get('price_uf') or m.get('price'))
+        price_ranges = {"with_price": with_price, "without_price": len(metadata) - with_price}
+        
+        return dict(property_types), dict(locations), price_ranges
+
+
+def _run_sync(coro):
+    """Run a coroutine from synchronous code, even inside a running event loop.
+    
+    The API builds its index from the FastAPI lifespan, where ``asyncio.run``
+    would fail, so the coroutine then gets its own loop on a worker thread.
+    """
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return asyncio.run(coro)
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        return executor.submit(asyncio.run, coro).result()
+
+
 def create_vector_store_from_scraped_data(json_path: Optional[str] = None) -> PropertyVectorStore:
     """Convenience function to create vector store from scraped data.
     
@@ -0,0 +1,61 @@
+"""
+Fixtures compartidas por los tests.
+"""
+import os
+from pathlib import Path
+
+import pytest
+
+from src.utils.config import settings
+
+# Q4_K_M responde bastante más rápido que el Q6_K por defecto; se usa si está descargado
+_Q4_K_M_MODEL = Path("ml-models/DeepSeek-R1-0528-Qwen3-8B-Q4_K_M.gguf")
+
+
+def pytest_addoption(parser):
+    """Opciones de línea de comandos propias de los tests."""
+    parser.addoption(
+        "--results-json",
+        default=None,
+        help="Archivo donde guardar los resultados del test anti-overthinking"
+    )
+
+
+@pytest.fixture(autouse=True)
+def _no_listing_prefetch(monkeypatch, tmp_path):
+    """Sin peticiones HTTP reales desde el fast path ni caché en data/."""
+    from src.scraper.services.scraper_manager import ScraperManager
+
+    monkeypatch.setattr(ScraperManager, "_prefetch_listing_pages", lambda self, urls: {})
+    monkeypatch.setattr(settings, "http_cache_path", str(tmp_path / "http_cache.sqlite"))
+
+
+@pytest.fixture(scope="session")
+def rag_chain():
+    """Cadena RAG con modelos locales, construida una vez para toda la sesión."""
+    if not Path(settings.properties_json_path).exists():
+        pytest.skip(f"No hay datos scrapeados en {settings.properties_json_path}")
+
+    with pytest.MonkeyPatch.context() as mp:
+        # Configuración optimizada anti-overthinking; modelo, batch e hilos
+        # puestos en el entorno o en .env tienen prioridad
+        mp.setattr(settings, "use_local_models", True)
+        mp.setattr(settings, "use_gpu", True)
+        mp.setattr(settings, "gpu_layers", 25)
+        if _Q4_K_M_MODEL.exists() and "local_llm_model_path" not in settings.model_fields_set:
+            mp.setattr(settings, "local_llm_model_path", str(_Q4_K_M_MODEL))
+        if "local_llm_n_batch" not in settings.model_fields_set:
+            mp.setattr(settings, "local_llm_n_batch", 512)
+        if "local_llm_n_threads" not in settings.model_fields_set:
+            mp.setattr(settings, "local_llm_n_threads", os.cpu_count())
+        from src.rag.property_rag_chain import \
+            create_rag_chain_from_scraped_data
+
+        try:
+            chain = create_rag_chain_from_scraped_data()
+        except Exception as e:
+            pytest.skip(f"RAG no disponible: {e}")
+
+    # La cadena ya leyó la configuración; settings vuelve a sus valores para
+    # el resto de la sesión
+    yield chain
@@ -2,117 +2,222 @@
 """
 Test anti-overthinking para verificar que el modelo DeepSeek responda concisamente.
 """
+import argparse
+import logging
 import os
+import re
 import sys
+import textwrap
 import time
+from functools import lru_cache
 from pathlib import Path
 
-# Configuración optimizada anti-overthinking
-os.environ["USE_LOCAL_MODELS"] = "true"
-os.environ["USE_GPU"] = "true"
-os.environ["GPU_LAYERS"] = "25"
+import numpy as np
+import orjson
+import pytest
 
-# Add src to Python path
-sys.path.insert(0, str(Path(__file__).parent / "src"))
+# Q4_K_M responde bastante más rápido que el Q6_K por defecto; se usa si está descargado
+_Q4_K_M_MODEL = Path("ml-models/DeepSeek-R1-0528-Qwen3-8B-Q4_K_M.gguf")
 
-def test_anti_overthinking():
-    """Test para verificar respuestas concisas sin divagación."""
-    print("🎯 TEST ANTI-OVERTHINKING DEEPSEEK")
-    print("=" * 50)
-    print("Objetivo: Respuestas directas y concisas sin divagación")
-    print()
+# Add project root to Python path
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+# Conectores que delatan divagación; se cuenta cada uno una sola vez por respuesta
+_OVERTHINK_RE = re.compile(
+    r"\b(?:además|también|por otro lado|en conclusión|finalmente|cabe mencionar)\b",
+    re.IGNORECASE
+)
+
+# Una fila por pregunta; las columnas contiguas permiten promedios y conteos vectorizados
+RESULT_DTYPE = np.dtype([('words', 'i4'), ('overthinking', 'i2'), ('time', 'f4'), ('status', 'U16')])
+
+# Con BENCH_VERBOSE=0 (o --quiet) la consola muestra solo una línea ASCII por
+# pregunta y el detalle queda en el logger "bench"
+VERBOSE = os.environ.get("BENCH_VERBOSE", "1") == "1"
+bench_logger = logging.getLogger("bench")
+
+# Preguntas diseñadas para provocar overthinking
+TEST_QUESTIONS = [
+    "¿Cuántas propiedades hay disponibles?",
+    "¿Hay departamentos en Independencia?", 
+    "¿Cuál es el precio promedio?",
+    "Muéstrame propiedades de 1 dormitorio",
+    "¿Qué departamentos cuestan menos de 200000 pesos?"
+]
+
+# Pregunta descartada antes de medir; distinta de las de test para no
+# dejarlas respondidas en la caché de la cadena
+WARMUP_QUESTION = "¿Hay propiedades disponibles en Santiago?"
+
+def report(*parts):
+    """Registra una línea de detalle en el logger "bench" y la imprime en modo detallado."""
+    message = " ".join(str(part) for part in parts)
+    bench_logger.info(message)
+    if VERBOSE:
+        print(message)
+
+def evaluate_answer(response_text, response_time):
+    """Mide una respuesta y la clasifica según su concisión y su tiempo."""
+    word_count = len(response_text.split())
+    line_count = response_text.count('\n') + 1
+    
+    # Detectar signos de overthinking
+    overthinking_count = len({m.lower() for m in _OVERTHINK_RE.findall(response_text)})
+    
+    if word_count <= 150 and overthinking_count == 0 and response_time <= 15:
+        status = "✅ EXCELENTE"
+    elif word_count <= 200 and overthinking_count <= 1 and response_time <= 25:
+        status = "🟡 BUENO"
+    else:
+        status = "❌ MEJORAR"
+    
+    return {
+        'words': word_count,
+        'lines': line_count,
+        'overthinking': overthinking_count,
+        'time': response_time,
+        'status': status
+    }
+
+def summarize(results):
+    """Conteo por estado y promedios de un arreglo de resultados (RESULT_DTYPE)."""
+    status_counts = dict(zip(*(a.tolist() for a in np.unique(results['status'], return_counts=True))))
+    return {
+        'questions': len(results),
+        'excellent': status_counts.get("✅ EXCELENTE", 0),
+        'good': status_counts.get("🟡 BUENO", 0),
+        'poor': status_counts.get("❌ MEJORAR", 0),
+        'avg_words': float(results['words'].mean()),
+        'avg_time': float(results['time'].mean()),
+        'total_overthinking': int(results['overthinking'].sum())
+    }
+
+def write_results_json(path, questions, results):
+    """Guarda los resultados por pregunta y su resumen para comparar entre corridas."""
+    rows = [dict(zip(('question',) + RESULT_DTYPE.names, (q,) + row))
+            for q, row in zip(questions, results.tolist())]
+    payload = {'summary': summarize(results), 'results': rows}
+    Path(path).write_bytes(orjson.dumps(payload, option=orjson.OPT_INDENT_2))
+
+@lru_cache(maxsize=1)
+def _get_chain():
+    """Cadena RAG del modo script, construida una sola vez por proceso."""
+    from src.rag.property_rag_chain import create_rag_chain_from_scraped_data
+    return create_rag_chain_from_scraped_data()
+
+@pytest.fixture(scope="module")
+def answer_results(request):
+    """Resultados por pregunta; al terminar el módulo se guardan en --results-json."""
+    rows = {}
+    yield rows
+    path = request.config.getoption("--results-json")
+    if path and rows:
+        questions = [q for q in TEST_QUESTIONS if q in rows]
+        write_results_json(path, questions, np.array([rows[q] for q in questions], dtype=RESULT_DTYPE))
+
+@pytest.mark.integration
+@pytest.mark.slow
+@pytest.mark.parametrize("question", TEST_QUESTIONS)
+def test_answer_is_concise(rag_chain, answer_results, question):
+    """La respuesta no pasa de 200 palabras ni usa más de un conector de divagación."""
+    start_time = time.perf_counter()
+    answer = rag_chain.ask_question(question)
+    result = evaluate_answer(answer.answer, time.perf_counter() - start_time)
+    answer_results[question] = tuple(result[field] for field in RESULT_DTYPE.names)
+    
+    assert result['words'] <= 200, answer.answer
+    assert result['overthinking'] <= 1, answer.answer
+
+def run_anti_overthinking(results_json=None):
+    """Test para verificar respuestas concisas sin divagación.
+    
+    Con results_json, los resultados por pregunta y el resumen se guardan
+    además en ese archivo.
+    """
+    report("🎯 TEST ANTI-OVERTHINKING DEEPSEEK")
+    report("=" * 50)
+    report("Objetivo: Respuestas directas y concisas sin divagación")
+    report()
     
     try:
-        from src.rag.property_rag_chain import create_rag_chain_from_scraped_data
+        report("🤖 Inicializando RAG con configuración anti-overthinking...")
+        start_time = time.perf_counter()
+        rag_chain = _get_chain()
+        init_time = time.perf_counter() - start_time
         
-        print("🤖 Inicializando RAG con configuración anti-overthinking...")
-        start_time = time.time()
-        rag_chain = create_rag_chain_from_scraped_data()
-        init_time = time.time() - start_time
+        report(f"✅ Inicializado en {init_time:.2f}s")
         
-        print(f"✅ Inicializado en {init_time:.2f}s")
+        # Pregunta de calentamiento, fuera de la medición: la primera evaluación
+        # de prompt en llama.cpp arrastra costos fijos que no son de ninguna pregunta
+        start_time = time.perf_counter()
+        rag_chain.ask_question(WARMUP_QUESTION)
+        report(f"🔥 Calentamiento en {time.perf_counter() - start_time:.2f}s (no se evalúa)")
         
-        # Preguntas diseñadas para provocar overthinking
-        test_questions = [
-            "¿Cuántas propiedades hay disponibles?",
-            "¿Hay departamentos en Independencia?", 
-            "¿Cuál es el precio promedio?",
-            "Muéstrame propiedades de 1 dormitorio",
-            "¿Qué departamentos cuestan menos de 200000 pesos?"
-        ]
+        report(f"\n🧪 Probando {len(TEST_QUESTIONS)} preguntas específicas...\n")
         
-        print(f"\n🧪 Probando {len(test_questions)} preguntas específicas...\n")
+        # Todas las preguntas en un solo lote; cada una se evalúa con el
+        # tiempo del lote repartido entre las preguntas
+        start_time = time.perf_counter()
+        answers = rag_chain.ask_questions_batch(TEST_QUESTIONS)
+        batch_time = time.perf_counter() - start_time
+        response_time = batch_time / len(TEST_QUESTIONS)
         
-        results = []
-        for i, question in enumerate(test_questions, 1):
-            print(f"❓ {i}. {question}")
-            
-            start_time = time.time()
-            answer = rag_chain.ask_question(question)
-            response_time = time.time() - start_time
+        results = np.zeros(len(TEST_QUESTIONS), dtype=RESULT_DTYPE)
+        for i, (question, answer) in enumerate(zip(TEST_QUESTIONS, answers), 1):
+            report(f"❓ {i}. {question}")
             
             # Análisis de la respuesta
             response_text = answer.answer
-            word_count = len(response_text.split())
-            line_count = len(response_text.split('\\n'))
-            
-            # Detectar signos de overthinking
-            overthinking_words = ["además", "también", "por otro lado", "en conclusión", "finalmente", "cabe mencionar"]
-            overthinking_count = sum(1 for word in overthinking_words if word.lower() in response_text.lower())
+            result = evaluate_answer(response_text, response_time)
+            status = result['status']
             
             # Mostrar resultado
-            print(f"💬 {response_text[:100]}{'...' if len(response_text) > 100 else ''}")
-            print(f"📊 Palabras: {word_count} | Líneas: {line_count} | Overthinking: {overthinking_count}")
-            print(f"⏱️ {response_time:.2f}s | 🎯 {answer.confidence:.2f}")
+            report("💬", textwrap.shorten(response_text, width=100, placeholder="..."))
+            report(f"📊 Palabras: {result['words']} | Líneas: {result['lines']} | Overthinking: {result['overthinking']}")
+            report(f"⏱️ {response_time:.2f}s (promedio del lote) | 🎯 {answer.confidence:.2f}")
             
-            # Evaluación
-            if word_count <= 150 and overthinking_count == 0 and response_time <= 15:
-                status = "✅ EXCELENTE"
-            elif word_count <= 200 and overthinking_count <= 1 and response_time <= 25:
-                status = "🟡 BUENO"
-            else:
-                status = "❌ MEJORAR"
+            report(f"📋 Estado: {status}")
+            report("-" * 50)
+            if not VERBOSE:
+                print(f"{question[:40]:40s} {result['words']:4d}w {response_time:5.2f}s {status.split()[-1]}")
             
-            print(f"📋 Estado: {status}")
-            print("-" * 50)
-            
-            results.append({
-                'question': question,
-                'words': word_count,
-                'overthinking': overthinking_count,
-                'time': response_time,
-                'status': status
-            })
+            results[i - 1] = tuple(result[field] for field in RESULT_DTYPE.names)
         
         # Resumen final
-        print(f"\n📈 RESUMEN ANTI-OVERTHINKING:")
-        print("=" * 50)
+        report(f"\n📈 RESUMEN ANTI-OVERTHINKING:")
+        report("=" * 50)
         
-        excellent = sum(1 for r in results if "EXCELENTE" in r['status'])
-        good = sum(1 for r in results if "BUENO" in r['status'])
-        poor = sum(1 for r in results if "MEJORAR" in r['status'])
+        summary = summarize(results)
+        excellent = summary['excellent']
+        good = summary['good']
+        total_overthinking = summary['total_overthinking']
         
-        avg_words = sum(r['words'] for r in results) / len(results)
-        avg_time = sum(r['time'] for r in results) / len(results)
-        total_overthinking = sum(r['overthinking'] for r in results)
+        report(f"✅ Excelentes: {excellent}/{len(results)}")
+        report(f"🟡 Buenos: {good}/{len(results)}")  
+        report(f"❌ Mejorables: {summary['poor']}/{len(results)}")
+        report(f"📊 Promedio palabras: {summary['avg_words']:.1f}")
+        report(f"⏱️ Promedio tiempo: {summary['avg_time']:.2f}s")
+        report(f"⏱️ Tiempo total del lote: {batch_time:.2f}s")
+        report(f"🧠 Total overthinking: {total_overthinking}")
+        if not VERBOSE:
+            print(f"excelentes {excellent}/{len(results)} buenos {good} mejorables {summary['poor']} "
+                  f"palabras {summary['avg_words']:.1f} tiempo {summary['avg_time']:.2f}s "
+                  f"lote {batch_time:.2f}s overthinking {total_overthinking}")
         
-        print(f"✅ Excelentes: {excellent}/{len(results)}")
-        print(f"🟡 Buenos: {good}/{len(results)}")  
-        print(f"❌ Mejorables: {poor}/{len(results)}")
-        print(f"📊 Promedio palabras: {avg_words:.1f}")
-        print(f"⏱️ Promedio tiempo: {avg_time:.2f}s")
-        print(f"🧠 Total overthinking: {total_overthinking}")
+        if results_json:
+            write_results_json(results_json, TEST_QUESTIONS, results)
+            report(f"💾 Resultados guardados en {results_json}")
         
         # Evaluación global
         if excellent >= 3 and total_overthinking <= 2:
-            print(f"\n🎉 ¡ANTI-OVERTHINKING EXITOSO!")
-            print("El modelo responde de forma concisa y directa")
+            report(f"\n🎉 ¡ANTI-OVERTHINKING EXITOSO!")
+            report("El modelo responde de forma concisa y directa")
         elif excellent + good >= 4:
-            print(f"\n✅ Anti-overthinking funciona bien")
-            print("Mayormente respuestas directas")
+            report(f"\n✅ Anti-overthinking funciona bien")
+            report("Mayormente respuestas directas")
         else:
-            print(f"\n⚠️ Necesita más optimización")
-            print("Aún hay tendencia a divagar")
+            report(f"\n⚠️ Necesita más optimización")
+            report("Aún hay tendencia a divagar")
         
         return excellent >= 2
         
@@ -123,22 +228,44 @@ def test_anti_overthinking():
         return False
 
 if __name__ == "__main__":
+    # Configuración optimizada anti-overthinking; en pytest la aplica el
+    # fixture rag_chain de conftest.py
+    os.environ["USE_LOCAL_MODELS"] = "true"
+    os.environ["USE_GPU"] = "true"
+    os.environ["GPU_LAYERS"] = "25"
+    if _Q4_K_M_MODEL.exists():
+        os.environ.setdefault("LOCAL_LLM_MODEL_PATH", str(_Q4_K_M_MODEL))
+    os.environ.setdefault("LOCAL_LLM_N_BATCH", "512")
+    os.environ.setdefault("LOCAL_LLM_N_THREADS", str(os.cpu_count()))
+    
+    parser = argparse.ArgumentParser(description="Test anti-overthinking del RAG")
+    parser.add_argument("--results-json", default=None,
+                       help="Archivo JSON donde guardar resultados y resumen de la corrida")
+    parser.add_argument("--quiet", action="store_true",
+                       help="Una línea por pregunta en consola; el detalle se guarda en bench.log")
+    args = parser.parse_args()
+    
     # Configurar logging mínimo
-    import logging
     logging.basicConfig(level=logging.WARNING)
+    if args.quiet:
+        VERBOSE = False
+    if not VERBOSE:
+        bench_logger.addHandler(logging.FileHandler("bench.log", encoding="utf-8"))
+        bench_logger.setLevel(logging.INFO)
+        bench_logger.propagate = False
     
-    success = test_anti_overthinking()
+    success = run_anti_overthinking(results_json=args.results_json)
     
     if success:
-        print(f"\n💡 Configuración optimizada funcionando")
-        print(f"   - Temperature: 0.0 (determinístico)")
-        print(f"   - Max tokens: 300 (conciso)")
-        print(f"   - Stop tokens: agresivos")
-        print(f"   - Prompt: directo y estructurado")
+        report(f"\n💡 Configuración optimizada funcionando")
+        report(f"   - Temperature: 0.0 (determinístico)")
+        report(f"   - Max tokens: 300 (conciso)")
+        report(f"   - Stop tokens: agresivos")
+        report(f"   - Prompt: directo y estructurado")
     else:
-        print(f"\n🔧 Para mejorar aún más:")
-        print(f"   - Considera probar otro modelo GGUF")
-        print(f"   - Reducir más max_tokens")
-        print(f"   - Ajustar stop tokens")
+        report(f"\n🔧 Para mejorar aún más:")
+        report(f"   - Considera probar otro modelo GGUF")
+        report(f"   - Reducir más max_tokens")
+        report(f"   - Ajustar stop tokens")
     
     sys.exit(0 if success else 1)
\ No newline at end of file
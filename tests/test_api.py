@@ -6,20 +6,50 @@ import json
 from unittest.mock import Mock, patch, AsyncMock
 from fastapi.testclient import TestClient
 
-from src.api.property_api import app
-from src.rag.property_rag_chain import PropertyAnswer
+from src.api.property_api import app, get_rag_chain
+from src.rag.property_rag_chain import PropertyAnswer, PropertyRAGChain
+
+
+@pytest.fixture(scope="module")
+def client():
+    """Test client shared by the module; startup and shutdown run only once.
+    
+    The lifespan would build the real RAG chain from scraped data, so startup
+    gets a mock chain instead.
+    """
+    with patch('src.api.property_api.create_rag_chain_from_scraped_data',
+               return_value=Mock(spec=PropertyRAGChain)):
+        with TestClient(app) as c:
+            yield c
+
+
+@pytest.fixture
+def mock_rag_chain():
+    """Mock RAG chain injected through the get_rag_chain dependency for one test."""
+    chain = Mock(spec=PropertyRAGChain)
+    chain.get_chain_stats.return_value = {
+        "status": "ready",
+        "llm_model": "gpt-3.5-turbo",
+        "retrieval_k": 5,
+        "vector_store_stats": {"status": "loaded", "document_count": 3}
+    }
+    app.dependency_overrides[get_rag_chain] = lambda: chain
+    yield chain
+    app.dependency_overrides.clear()
+
+
+@pytest.fixture(scope="module")
+def integration_client():
+    """Test client running the real startup (scraped data and models required)."""
+    with TestClient(app) as c:
+        yield c
 
 
 class TestPropertyAPI:
     """Test FastAPI endpoints."""
     
-    @pytest.fixture
-    @pytest.fixture
-    @patch('src.api.property_api.get_rag_chain')
-    def test_health_endpoint_healthy(self, mock_get_chain, client, mock_rag_chain):
+    def test_health_endpoint_healthy(self, client, mock_rag_chain):
         """Test health endpoint when system is healthy."""
-        mock_get_chain.return_value = mock_rag_chain
-        
         response = client.get("/health")
         assert response.status_code == 200
         
@@ -29,9 +59,16 @@ class TestPropertyAPI:
         assert "system_stats" in data
         assert data["version"] == "1.0.0"
     
-    @patch('src.api.property_api.get_rag_chain')
-    @patch('src.api.property_api.get_rag_chain')
-    def test_ask_question_success(self, mock_get_chain, client, mock_rag_chain):
+    def test_liveness_probe(self, client, mock_rag_chain):
+        """Test liveness probe answers GET and HEAD without querying the chain."""
+        for method in ("GET", "HEAD"):
+            response = client.request(method, "/livez")
+            assert response.status_code == 200
+            assert response.content == b""
+        
+        mock_rag_chain.get_chain_stats.assert_not_called()
+    
+    def test_ask_question_success(self, client, mock_rag_chain):
         """Test successful question asking."""
         # Mock successful answer
         mock_answer = PropertyAnswer(
@@ -53,7 +90,6 @@ class TestPropertyAPI:
         )
         
         mock_rag_chain.ask_question.return_value = mock_answer
-        mock_get_chain.return_value = mock_rag_chain
         
         request_data = {
             "question": "¿Hay departamentos en Providencia bajo 3000 UF?",
@@ -72,8 +108,7 @@ class TestPropertyAPI:
         assert "timestamp" in data
         assert "processing_time_ms" in data
     
-    @patch('src.api.property_api.get_rag_chain')
-    def test_ask_question_invalid_input(self, mock_get_chain, client):
+    def test_ask_question_invalid_input(self, client):
         """Test question asking with invalid input."""
         request_data = {
             "question": "ab",  # Too short
@@ -83,11 +118,9 @@ class TestPropertyAPI:
         response = client.post("/ask", json=request_data)
         assert response.status_code == 422  # Validation error
     
-    @patch('src.api.property_api.get_rag_chain')
-    def test_ask_question_error(self, mock_get_chain, client, mock_rag_chain):
+    def test_ask_question_error(self, client, mock_rag_chain):
         """Test question asking with processing error."""
         mock_rag_chain.ask_question.side_effect = Exception("Processing error")
-        mock_get_chain.return_value = mock_rag_chain
         
         request_data = {
             "question": "¿Hay departamentos disponibles?",
@@ -101,8 +134,7 @@ class TestPropertyAPI:
         assert "error" in data
         assert "Processing error" in data["error"]
     
-    @patch('src.api.property_api.get_rag_chain')
-    def test_search_properties_success(self, mock_get_chain, client, mock_rag_chain):
+    def test_search_properties_success(self, client, mock_rag_chain):
         """Test successful property search."""
         mock_search_results = [
             {
@@ -128,7 +160,6 @@ class TestPropertyAPI:
         ]
         
         mock_rag_chain.search_properties.return_value = mock_search_results
-        mock_get_chain.return_value = mock_rag_chain
         
         request_data = {
             "query": "departamento 2 dormitorios",
@@ -146,9 +177,7 @@ class TestPropertyAPI:
         assert data["properties"][0]["similarity_score"] == 0.92
         assert "timestamp" in data
     
-    @patch('src.api.property_api.get_rag_chain')
-    @patch('src.api.property_api.get_rag_chain')
-    def test_get_recommendations_success(self, mock_get_chain, client, mock_rag_chain):
+    def test_get_recommendations_success(self, client, mock_rag_chain):
         """Test successful recommendation generation."""
         mock_answer = PropertyAnswer(
             answer="Te recomiendo estas propiedades que cumplen tus criterios:",
@@ -169,7 +198,6 @@ class TestPropertyAPI:
         )
         
         mock_rag_chain.get_property_recommendations.return_value = mock_answer
-        mock_get_chain.return_value = mock_rag_chain
         
         request_data = {
             "property_type": "departamento",
@@ -188,12 +216,8 @@ class TestPropertyAPI:
         assert len(data["sources"]) == 1
         assert "processing_time_ms" in data
     
-    @patch('src.api.property_api.get_rag_chain')
-    @patch('src.api.property_api.get_rag_chain')
-    def test_get_stats_endpoint(self, mock_get_chain, client, mock_rag_chain):
+    def test_get_stats_endpoint(self, client, mock_rag_chain):
         """Test system statistics endpoint."""
-        mock_get_chain.return_value = mock_rag_chain
-        
         response = client.get("/stats")
         assert response.status_code == 200
         
@@ -228,10 +252,10 @@ class TestPropertyAPI:
 
 
 @pytest.mark.integration
+@pytest.mark.xdist_group("api_integration")
 class TestAPIIntegration:
     """Integration tests for the API."""
     
-    @pytest.fixture
     @pytest.mark.skipif(
         True,  # Skip by default as it requires full setup
         reason="Requires full system setup with OpenAI API key"
@@ -270,12 +294,8 @@ class TestAPIIntegration:
 class TestAPIErrorHandling:
     """Test API error handling scenarios."""
     
-    @pytest.fixture
-    @patch('src.api.property_api.get_rag_chain')
-    @patch('src.api.property_api.get_rag_chain')
-    def test_api_error_handling(self, mock_get_chain, client, mock_rag_chain):
+    def test_api_error_handling(self, client, mock_rag_chain):
         """Test API error handling scenarios."""
-        mock_get_chain.return_value = mock_rag_chain
 
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
\ No newline at end of file
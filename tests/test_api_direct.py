@@ -2,28 +2,55 @@
 """
 Test directo de la API para verificar que las respuestas anti-overthinking funcionen.
 """
-import requests
-import json
+import argparse
+import asyncio
+import logging
+import os
+import re
+import textwrap
 import time
 
-def test_api():
-    """Test de la API con las optimizaciones anti-overthinking."""
+import httpx
+import numpy as np
+import orjson
+import pytest
+
+# Conectores que delatan divagación; se cuenta cada uno una sola vez por respuesta
+_OVERTHINK_RE = re.compile(
+    r"\b(?:además|también|por otro lado|en conclusión|finalmente|cabe mencionar)\b",
+    re.IGNORECASE
+)
+
+# Una fila por pregunta; las columnas contiguas permiten promedios y conteos vectorizados
+# (las preguntas fallidas quedan con success en False)
+RESULT_DTYPE = np.dtype([('words', 'i4'), ('overthinking', 'i2'), ('time', 'f4'), ('status', 'U16'), ('success', '?')])
+
+# Con BENCH_VERBOSE=0 (o --quiet) la consola muestra solo una línea ASCII por
+# pregunta y el detalle queda en el logger "bench"
+VERBOSE = os.environ.get("BENCH_VERBOSE", "1") == "1"
+bench_logger = logging.getLogger("bench")
+
+
+def report(*parts):
+    """Registra una línea de detalle en el logger "bench" y la imprime en modo detallado."""
+    message = " ".join(str(part) for part in parts)
+    bench_logger.info(message)
+    if VERBOSE:
+        print(message)
+
+
+@pytest.mark.asyncio
+async def test_api(include_health=False):
+    """Test de la API con las optimizaciones anti-overthinking.
+    
+    Por defecto solo se comprueba que la API esté viva con HEAD /livez; el
+    diagnóstico completo de /health (que consulta la cadena RAG) se pide con
+    include_health.
+    """
     base_url = "http://localhost:8000"
     
-    print("🌐 TEST API CON ANTI-OVERTHINKING")
-    print("=" * 50)
-    
-    # Verificar que la API esté corriendo
-    try:
-        response = requests.get(f"{base_url}/health", timeout=10)
-        if response.status_code == 200:
-            print("✅ API está activa y saludable")
-        else:
-            print(f"⚠️ API responde pero con status: {response.status_code}")
-    except requests.exceptions.RequestException as e:
-        print(f"❌ API no disponible: {e}")
-        print("Asegúrate de que la API esté corriendo en puerto 8000")
-        return False
+    report("🌐 TEST API CON ANTI-OVERTHINKING")
+    report("=" * 50)
     
     # Preguntas de test
     test_questions = [
@@ -34,124 +61,171 @@ def test_api():
         "¿Qué departamentos cuestan menos de 160000 pesos?"
     ]
     
-    print(f"\n🧪 Probando {len(test_questions)} preguntas via API...\n")
+    # Un solo cliente para el health check y todas las preguntas: las conexiones
+    # keep-alive del pool se reutilizan en vez de abrir una por petición
+    async with httpx.AsyncClient(
+        base_url=base_url,
+        headers={"Content-Type": "application/json"},
+        limits=httpx.Limits(max_connections=8, max_keepalive_connections=8)
+    ) as client:
+        # Verificar que la API esté corriendo
+        try:
+            response = await client.head("/livez", timeout=2)
+            if response.status_code == 200:
+                report("✅ API está activa")
+            else:
+                report(f"⚠️ API responde pero con status: {response.status_code}")
+            
+            if include_health:
+                response = await client.get("/health", timeout=10)
+                if response.status_code == 200:
+                    report(f"✅ Health: {response.json().get('status')}")
+                else:
+                    report(f"⚠️ /health responde con status: {response.status_code}")
+        except httpx.HTTPError as e:
+            print(f"❌ API no disponible: {e}")
+            print("Asegúrate de que la API esté corriendo en puerto 8000")
+            return False
+        
+        # Cuerpos JSON serializados una sola vez, antes de medir tiempos
+        bodies = [orjson.dumps({"question": q, "max_sources": 3}) for q in test_questions]
+        
+        # No enviar más preguntas a la vez de las que el servidor atiende en
+        # paralelo: las que sobran solo compiten por el mismo modelo
+        parallel = int(os.environ.get("OLLAMA_NUM_PARALLEL", "2"))
+        semaphore = asyncio.Semaphore(parallel)
+        
+        report(f"\n🧪 Probando {len(test_questions)} preguntas via API (hasta {parallel} en paralelo)...\n")
+        
+        async def timed(question, body):
+            """Envía una pregunta ya serializada y mide el tiempo de su respuesta (sin la espera por cupo)."""
+            async with semaphore:
+                start_time = time.perf_counter()
+                response = await client.post("/ask", content=body, timeout=30)
+                return question, time.perf_counter() - start_time, response
+        
+        batch_start = time.perf_counter()
+        responses = await asyncio.gather(*(timed(q, b) for q, b in zip(test_questions, bodies)),
+                                         return_exceptions=True)
+        total_time = time.perf_counter() - batch_start
     
-    results = []
-    for i, question in enumerate(test_questions, 1):
-        print(f"❓ {i}. {question}")
+    results = np.zeros(len(test_questions), dtype=RESULT_DTYPE)
+    for i, (question, outcome) in enumerate(zip(test_questions, responses), 1):
+        report(f"❓ {i}. {question}")
         
-        # Request payload
-        payload = {
-            "question": question,
-            "max_sources": 3
-        }
+        if isinstance(outcome, Exception):
+            if VERBOSE:
+                print(f"❌ Error de conexión: {outcome!r}")
+            else:
+                print(f"{question[:40]:40s} ERROR {outcome!r}")
+            report("-" * 50)
+            continue
         
-        try:
-            start_time = time.time()
-            response = requests.post(
-                f"{base_url}/ask",
-                json=payload,
-                timeout=30
-            )
-            response_time = time.time() - start_time
+        _, response_time, response = outcome
+        if response.status_code == 200:
+            data = orjson.loads(response.content)
+            answer_text = data.get("answer", "")
+            confidence = data.get("confidence", 0)
+            sources_count = len(data.get("sources", []))
             
-            if response.status_code == 200:
-                data = response.json()
-                answer_text = data.get("answer", "")
-                confidence = data.get("confidence", 0)
-                sources_count = len(data.get("sources", []))
-                
-                # Análisis de la respuesta
-                word_count = len(answer_text.split())
-                
-                # Detectar overthinking
-                overthinking_words = ["además", "también", "por otro lado", "en conclusión", "finalmente"]
-                overthinking_count = sum(1 for word in overthinking_words if word.lower() in answer_text.lower())
-                
-                print(f"💬 {answer_text[:100]}{'...' if len(answer_text) > 100 else ''}")
-                print(f"📊 Palabras: {word_count} | Overthinking: {overthinking_count}")
-                print(f"⏱️ {response_time:.2f}s | 🎯 {confidence:.2f} | 📋 {sources_count} fuentes")
-                
-                # Evaluación
-                if word_count <= 150 and overthinking_count == 0 and response_time <= 20:
-                    status = "✅ EXCELENTE"
-                elif word_count <= 200 and overthinking_count <= 1:
-                    status = "🟡 BUENO" 
-                else:
-                    status = "❌ MEJORAR"
-                
-                print(f"📋 Estado: {status}")
-                
-                results.append({
-                    'question': question,
-                    'words': word_count,
-                    'overthinking': overthinking_count,
-                    'time': response_time,
-                    'status': status,
-                    'success': True
-                })
-                
+            # Análisis de la respuesta
+            word_count = len(answer_text.split())
+            
+            # Detectar overthinking
+            overthinking_count = len({m.lower() for m in _OVERTHINK_RE.findall(answer_text)})
+            
+            report("💬", textwrap.shorten(answer_text, width=100, placeholder="..."))
+            report(f"📊 Palabras: {word_count} | Overthinking: {overthinking_count}")
+            report(f"⏱️ {response_time:.2f}s | 🎯 {confidence:.2f} | 📋 {sources_count} fuentes")
+            
+            # Evaluación
+            if word_count <= 150 and overthinking_count == 0 and response_time <= 20:
+                status = "✅ EXCELENTE"
+            elif word_count <= 200 and overthinking_count <= 1:
+                status = "🟡 BUENO" 
             else:
+                status = "❌ MEJORAR"
+            
+            report(f"📋 Estado: {status}")
+            if not VERBOSE:
+                print(f"{question[:40]:40s} {word_count:4d}w {response_time:5.2f}s {status.split()[-1]}")
+            
+            results[i - 1] = (word_count, overthinking_count, response_time, status, True)
+            
+        else:
+            if VERBOSE:
                 print(f"❌ Error HTTP: {response.status_code}")
                 print(f"   {response.text}")
-                results.append({
-                    'question': question,
-                    'success': False,
-                    'error': f"HTTP {response.status_code}"
-                })
-                
-        except requests.exceptions.RequestException as e:
-            print(f"❌ Error de conexión: {e}")
-            results.append({
-                'question': question,
-                'success': False,
-                'error': str(e)
-            })
+            else:
+                print(f"{question[:40]:40s} HTTP {response.status_code}")
+            bench_logger.info("HTTP %s: %s", response.status_code, response.text)
         
-        print("-" * 50)
+        report("-" * 50)
     
     # Resumen
-    print(f"\n📈 RESUMEN API ANTI-OVERTHINKING:")
-    print("=" * 50)
+    report(f"\n📈 RESUMEN API ANTI-OVERTHINKING:")
+    report("=" * 50)
     
-    successful = [r for r in results if r.get('success')]
-    excellent = sum(1 for r in successful if "EXCELENTE" in r.get('status', ''))
-    good = sum(1 for r in successful if "BUENO" in r.get('status', ''))
+    # Conteo por estado y promedios sobre las columnas de las respuestas exitosas
+    ok = results[results['success']]
+    successful = len(ok)
+    status_counts = dict(zip(*(a.tolist() for a in np.unique(ok['status'], return_counts=True))))
+    excellent = status_counts.get("✅ EXCELENTE", 0)
+    good = status_counts.get("🟡 BUENO", 0)
     
     if successful:
-        avg_words = sum(r['words'] for r in successful) / len(successful)
-        avg_time = sum(r['time'] for r in successful) / len(successful)
-        total_overthinking = sum(r['overthinking'] for r in successful)
+        avg_words = ok['words'].mean()
+        avg_time = ok['time'].mean()
+        total_overthinking = int(ok['overthinking'].sum())
         
-        print(f"✅ Exitosos: {len(successful)}/{len(results)}")
-        print(f"✅ Excelentes: {excellent}/{len(successful)}")
-        print(f"🟡 Buenos: {good}/{len(successful)}")
-        print(f"📊 Promedio palabras: {avg_words:.1f}")
-        print(f"⏱️ Promedio tiempo: {avg_time:.2f}s")
-        print(f"🧠 Total overthinking: {total_overthinking}")
+        report(f"✅ Exitosos: {successful}/{len(results)}")
+        report(f"✅ Excelentes: {excellent}/{successful}")
+        report(f"🟡 Buenos: {good}/{successful}")
+        report(f"📊 Promedio palabras: {avg_words:.1f}")
+        report(f"⏱️ Promedio tiempo: {avg_time:.2f}s")
+        report(f"⏱️ Tiempo total (en paralelo): {total_time:.2f}s")
+        report(f"🧠 Total overthinking: {total_overthinking}")
+        if not VERBOSE:
+            print(f"ok {successful}/{len(results)} excelentes {excellent} buenos {good} "
+                  f"palabras {avg_words:.1f} tiempo {avg_time:.2f}s total {total_time:.2f}s "
+                  f"overthinking {total_overthinking}")
         
         if excellent >= 3 and total_overthinking <= 2:
-            print(f"\n🎉 ¡API ANTI-OVERTHINKING PERFECTA!")
-            print("Las optimizaciones funcionan correctamente via API")
+            report(f"\n🎉 ¡API ANTI-OVERTHINKING PERFECTA!")
+            report("Las optimizaciones funcionan correctamente via API")
             return True
         elif excellent + good >= 4:
-            print(f"\n✅ API anti-overthinking funciona bien")
+            report(f"\n✅ API anti-overthinking funciona bien")
             return True
         else:
-            print(f"\n⚠️ API necesita más optimización")
+            report(f"\n⚠️ API necesita más optimización")
             return False
     else:
         print("❌ No se pudieron completar las pruebas")
         return False
 
 if __name__ == "__main__":
-    success = test_api()
+    parser = argparse.ArgumentParser(description="Test directo de la API anti-overthinking")
+    parser.add_argument("--include-health", action="store_true",
+                       help="Consultar también /health (estadísticas del sistema, más lento)")
+    parser.add_argument("--quiet", action="store_true",
+                       help="Una línea por pregunta en consola; el detalle se guarda en bench.log")
+    args = parser.parse_args()
+    
+    if args.quiet:
+        VERBOSE = False
+    if not VERBOSE:
+        bench_logger.addHandler(logging.FileHandler("bench.log", encoding="utf-8"))
+        bench_logger.setLevel(logging.INFO)
+        bench_logger.propagate = False
+    
+    success = asyncio.run(test_api(include_health=args.include_health))
     
     if success:
-        print(f"\n💡 La API está lista para uso:")
-        print(f"   - Endpoint: http://localhost:8000/ask")
-        print(f"   - Docs: http://localhost:8000/docs")
-        print(f"   - Respuestas concisas y directas ✅")
+        report(f"\n💡 La API está lista para uso:")
+        report(f"   - Endpoint: http://localhost:8000/ask")
+        report(f"   - Docs: http://localhost:8000/docs")
+        report(f"   - Respuestas concisas y directas ✅")
     else:
         print(f"\n🔧 Verifica que la API esté ejecutándose")
     
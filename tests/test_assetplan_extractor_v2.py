@@ -465,4 +465,70 @@ class TestPropertyCreation:
             property_obj = extractor._create_property_from_data(unit_data, modal_data, {}, building_data)
         
         # Debe usar el piso parseado del unit_number
-        assert property_obj.floor == 10
\ No newline at end of file
+        assert property_obj.floor == 10
+
+class TestPreloadedListing:
+    """Tests del fast-path con HTML de listado precargado."""
+    
+    LISTING_HTML = """
+    <div class="building-card" data-building="42">
+      <a class="text-neutral-800 lg:text-base" href="/arriendo/departamento/santiago/edificio/sol-42">Edificio Sol</a>
+      <span class="text-neutral-500">Av. Siempre Viva 123</span>
+      <p class="text-lg font-bold">Desde $350.000</p>
+      <ul><li class="splide__slide is-visible"><img src="https://cdn.assetplan.cl/sol.jpg"></li></ul>
+      <div class="badge_promos"><span>50% dcto</span><span> </span></div>
+      <div class="space-y-1.5">
+        <a href="/edificio-sol/42?tipo=1d">1D</a>
+        <a class="grayscale" href="/edificio-sol/42?tipo=2d">2D</a>
+      </div>
+    </div>
+    """
+    
+    @pytest.fixture
+    def extractor(self):
+        """Extractor con mock driver."""
+        return AssetPlanExtractorV2(Mock(spec=WebDriver))
+    
+    def test_building_cards_parsed_from_html(self, extractor):
+        """Las tarjetas se extraen del HTML con URLs absolutas."""
+        cards = extractor._extract_building_cards_from_html(self.LISTING_HTML)
+        
+        assert cards == [{
+            'building_id': '42',
+            'name': 'Edificio Sol',
+            'url': 'https://www.assetplan.cl/arriendo/departamento/santiago/edificio/sol-42',
+            'address': 'Av. Siempre Viva 123',
+            'price_from': 'Desde $350.000',
+            'image_url': 'https://cdn.assetplan.cl/sol.jpg',
+            'promotions': ['50% dcto'],
+            'available_types': [
+                {'url': 'https://www.assetplan.cl/edificio-sol/42?tipo=1d', 'text': '1D', 'available': True}
+            ]
+        }]
+    
+    def test_html_without_cards_returns_empty(self, extractor):
+        """HTML sin tarjetas renderizadas no produce edificios."""
+        assert extractor._extract_building_cards_from_html("<div id='app'></div>") == []
+        assert extractor._extract_building_cards_from_html(None) == []
+    
+    def test_preloaded_listing_skips_search_navigation(self, extractor):
+        """Con HTML precargado no se carga la página de búsqueda en el navegador."""
+        extractor.preload_html({extractor.search_url: self.LISTING_HTML})
+        
+        with patch.object(extractor, '_navigate_to_search_page') as navigate, \
+                patch.object(extractor, '_process_building', return_value=[]) as process:
+            extractor.start_scraping(max_properties=5)
+        
+        navigate.assert_not_called()
+        assert process.call_args.args[0]['building_id'] == '42'
+    
+    def test_multi_typology_uses_browser_listing(self, extractor):
+        """El modo multi-tipología ignora el HTML precargado."""
+        extractor.preload_html({extractor.search_url: self.LISTING_HTML})
+        
+        with patch.object(extractor, '_navigate_to_search_page') as navigate, \
+                patch.object(extractor, '_extract_building_cards', return_value=[]), \
+                patch.object(extractor, '_extract_properties_alternative_method', return_value=[]):
+            extractor.start_scraping(max_properties=5, max_typologies=3)
+        
+        navigate.assert_called_once()
@@ -0,0 +1,34 @@
+"""
+Tests para la configuración de la aplicación.
+"""
+from src.utils.config import Settings, get_settings, settings
+
+
+class TestSettings:
+    """Tests de lectura de configuración desde el entorno."""
+
+    def test_get_settings_is_singleton(self):
+        """get_settings devuelve siempre la misma instancia que el alias del módulo."""
+        assert get_settings() is get_settings() is settings
+
+    def test_environment_variables_are_read(self, monkeypatch):
+        """Las variables de entorno se leen al crear la instancia."""
+        monkeypatch.setenv("USE_LOCAL_MODELS", "true")
+        monkeypatch.setenv("GPU_LAYERS", "30")
+
+        config = Settings(_env_file=None)
+
+        assert config.use_local_models is True
+        assert config.gpu_layers == 30
+
+    def test_embedding_device_follows_use_gpu(self, monkeypatch):
+        """Sin GPU el dispositivo de embeddings es CPU, salvo que se indique otro."""
+        monkeypatch.setenv("USE_GPU", "false")
+        assert Settings(_env_file=None).embedding_device == "cpu"
+
+        monkeypatch.setenv("EMBEDDING_DEVICE", "mps")
+        assert Settings(_env_file=None).embedding_device == "mps"
+
+        monkeypatch.delenv("EMBEDDING_DEVICE")
+        monkeypatch.setenv("USE_GPU", "true")
+        assert Settings(_env_file=None).embedding_device == "cuda"
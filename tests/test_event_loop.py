@@ -0,0 +1,52 @@
+"""
+Tests para el helper de event loop.
+"""
+import asyncio
+from unittest.mock import patch
+
+from src.scraper.infrastructure import event_loop
+
+
+class TestRun:
+    """Tests de ejecución de corutinas."""
+
+    def test_uses_uvloop_when_installed(self):
+        """Con uvloop instalado la corutina corre sobre su loop."""
+        import pytest
+        uvloop = pytest.importorskip("uvloop")
+
+        async def loop_type():
+            return type(asyncio.get_running_loop())
+
+        assert event_loop.run(loop_type()) is uvloop.Loop
+
+    def test_falls_back_to_asyncio_loop(self):
+        """Sin uvloop se usa el loop estándar de asyncio."""
+        async def answer():
+            await asyncio.sleep(0)
+            return 42
+
+        with patch.object(event_loop, "uvloop", None):
+            assert event_loop.run(answer()) == 42
+
+    def test_does_not_change_global_policy(self):
+        """No se instala una política global de event loop."""
+        policy = asyncio.get_event_loop_policy()
+
+        async def noop():
+            return None
+
+        event_loop.run(noop())
+        assert asyncio.get_event_loop_policy() is policy
+
+    def test_runs_inside_running_loop(self):
+        """Desde código async la corutina corre en otro hilo sin fallar."""
+        import threading
+
+        async def thread_id():
+            return threading.get_ident()
+
+        async def caller():
+            return event_loop.run(thread_id())
+
+        assert asyncio.run(caller()) != threading.get_ident()
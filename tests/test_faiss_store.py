@@ -0,0 +1,530 @@
+"""
+Tests para la construcción del índice FAISS (con embeddings deterministas, sin modelo real).
+"""
+import pickle
+from pathlib import Path
+from unittest.mock import patch
+
+import numpy as np
+import pytest
+from langchain_core.embeddings import DeterministicFakeEmbedding
+
+from src.scraper.models import Property
+from src.vectorstore import faiss_store
+from src.vectorstore.faiss_store import (EMBEDDING_CACHE_FILE,
+                                         AdaptiveBatchEmbeddings,
+                                         PropertyVectorStore)
+
+
+@pytest.fixture
+def sample_properties():
+    """Propiedades de ejemplo con distintos campos opcionales."""
+    return [
+        Property(
+            title="Departamento en Providencia",
+            url="https://www.assetplan.cl/arriendo/departamento/providencia/1",
+            property_type="departamento",
+            location="Providencia, Santiago",
+            price_uf=2300.0,
+            area_m2=75.0,
+            bedrooms=2,
+            bathrooms=1
+        ),
+        Property(
+            title="Casa en Las Condes",
+            url="https://www.assetplan.cl/arriendo/casa/las-condes/2",
+            property_type="casa",
+            location="Las Condes, Santiago",
+            price="$1.200.000",
+            description="Casa amplia con jardín"
+        ),
+        Property(
+            title="Estudio en Ñuñoa",
+            url="https://www.assetplan.cl/arriendo/departamento/nunoa/3"
+        ),
+    ]
+
+
+@pytest.fixture
+def vector_store(tmp_path):
+    """Vector store con embeddings deterministas de dimensión 8."""
+    return PropertyVectorStore(
+        embeddings=DeterministicFakeEmbedding(size=8),
+        index_path=str(tmp_path / "faiss_index")
+    )
+
+
+class TestDocumentCreation:
+    """Tests de armado del texto de cada documento."""
+
+    def test_page_content_field_order_and_skipping(self, vector_store, sample_properties):
+        """Los campos siguen el orden fijo, se omiten los vacíos y se conservan los conteos en 0."""
+        studio = Property(
+            title="Estudio",
+            url="https://www.assetplan.cl/arriendo/departamento/nunoa/4",
+            price="",
+            area_m2=0.0,
+            bedrooms=0,
+            bathrooms=1
+        )
+
+        documents = vector_store.create_documents_from_properties(sample_properties[:2] + [studio])
+
+        assert documents[0].page_content == (
+            "Título: Departamento en Providencia | Tipo: departamento | Ubicación: Providencia, Santiago"
+            " | Precio UF: 2300.0 | Superficie: 75.0 m² | Dormitorios: 2 | Baños: 1"
+        )
+        assert documents[1].page_content == (
+            "Título: Casa en Las Condes | Tipo: casa | Ubicación: Las Condes, Santiago"
+            " | Precio: $1.200.000 | Descripción: Casa amplia con jardín"
+        )
+        assert documents[2].page_content == "Título: Estudio | Dormitorios: 0 | Baños: 1"
+
+    def test_metadata_keeps_image_count_not_urls(self, vector_store):
+        """La metadata guarda cuántas imágenes hay, no sus URLs."""
+        prop = Property(
+            title="Depto con fotos",
+            url="https://www.assetplan.cl/arriendo/departamento/nunoa/6",
+            images=["https://img.assetplan.cl/1.jpg", "https://img.assetplan.cl/2.jpg"]
+        )
+
+        metadata = vector_store.create_documents_from_properties([prop])[0].metadata
+
+        assert metadata["image_count"] == 2
+        assert "images" not in metadata
+
+
+class TestLoadFromJson:
+    """Tests de carga desde el JSON del scraper."""
+
+    def test_collection_dump_and_plain_list(self, vector_store, sample_properties, tmp_path):
+        """Se aceptan tanto un PropertyCollection serializado como una lista de propiedades."""
+        import json
+
+        from src.scraper.models import PropertyCollection
+
+        collection = PropertyCollection(properties=sample_properties, total_count=3, scraped_at="2024-01-01T00:00:00")
+        collection_file = tmp_path / "collection.json"
+        collection_file.write_bytes(collection.dump_json())
+        list_file = tmp_path / "list.json"
+        list_file.write_text(json.dumps([p.model_dump(mode="json") for p in sample_properties]), encoding="utf-8")
+
+        for json_file in (collection_file, list_file):
+            vector_store.load_from_json(str(json_file))
+            assert vector_store.vector_store.index.ntotal == 3
+            assert [m["title"] for m in vector_store.property_metadata] == [p.title for p in sample_properties]
+
+    def test_invalid_property_raises(self, vector_store, tmp_path):
+        """Una propiedad inválida sigue haciendo fallar la carga."""
+        json_file = tmp_path / "bad.json"
+        json_file.write_text('[{"title": "Sin URL"}]', encoding="utf-8")
+
+        with pytest.raises(Exception):
+            vector_store.load_from_json(str(json_file))
+
+
+class TestOpenAIEmbedding:
+    """Tests del embebido concurrente con el backend de OpenAI (sin llamadas reales)."""
+
+    @pytest.fixture
+    def openai_store(self, tmp_path):
+        """Vector store con OpenAIEmbeddings de chunk_size=2 y la API parcheada."""
+        from langchain_openai import OpenAIEmbeddings
+
+        fake = DeterministicFakeEmbedding(size=8)
+        state = {"in_flight": 0, "max_in_flight": 0, "chunks": []}
+
+        async def aembed_documents(self, texts, chunk_size=None):
+            import asyncio
+
+            state["in_flight"] += 1
+            state["max_in_flight"] = max(state["max_in_flight"], state["in_flight"])
+            state["chunks"].append(list(texts))
+            await asyncio.sleep(0.01)
+            state["in_flight"] -= 1
+            return fake.embed_documents(texts)
+
+        with patch.object(OpenAIEmbeddings, "aembed_documents", aembed_documents), \
+             patch.object(OpenAIEmbeddings, "embed_documents", side_effect=AssertionError("llamada secuencial")):
+            store = PropertyVectorStore(
+                embeddings=OpenAIEmbeddings(openai_api_key="test", chunk_size=2),
+                index_path=str(tmp_path / "faiss_index")
+            )
+            yield store, state, fake
+
+    def test_chunks_embedded_concurrently_in_order(self, openai_store):
+        """Los trozos se envían en paralelo y los vectores vuelven en el orden original."""
+        store, state, fake = openai_store
+        texts = [f"Título: Depto {i}" for i in range(5)]
+
+        vectors = store._embed_documents(texts)
+
+        assert [len(chunk) for chunk in state["chunks"]] == [2, 2, 1]
+        assert state["max_in_flight"] == 3
+        assert vectors == fake.embed_documents(texts)
+
+    def test_works_inside_running_event_loop(self, openai_store, sample_properties):
+        """Construir el índice desde código async (lifespan de FastAPI) no falla."""
+        import asyncio
+
+        store, state, _ = openai_store
+
+        async def build():
+            store.load_properties_and_create_index(sample_properties)
+
+        asyncio.run(build())
+
+        assert len(state["chunks"]) == 2
+        assert store.vector_store.index.ntotal == 3
+
+
+class TestAdaptiveBatchEmbeddings:
+    """Tests del tamaño de lote adaptativo ante falta de memoria en GPU."""
+
+    class LimitedMemoryEmbedding(DeterministicFakeEmbedding):
+        """Embeddings falsos que fallan como CUDA OOM por encima de un tamaño de lote."""
+        max_batch: int = 2
+        calls: list = []
+
+        def embed_documents(self, texts):
+            self.calls.append(len(texts))
+            if len(texts) > self.max_batch:
+                raise RuntimeError("CUDA out of memory. Tried to allocate 2.00 GiB")
+            return super().embed_documents(texts)
+
+    def test_batch_halves_on_oom_and_keeps_order(self):
+        """Ante OOM el lote se reduce a la mitad y los vectores mantienen el orden."""
+        inner = self.LimitedMemoryEmbedding(size=8, calls=[])
+        embeddings = AdaptiveBatchEmbeddings(inner, batch_size=8, recovery_streak=100)
+        texts = [f"texto {i}" for i in range(5)]
+
+        vectors = embeddings.embed_documents(texts)
+
+        assert inner.calls == [5, 4, 2, 2, 1]
+        assert embeddings.batch_size == 2
+        assert vectors == DeterministicFakeEmbedding(size=8).embed_documents(texts)
+
+    def test_batch_recovers_after_success_streak(self):
+        """Tras varios lotes exitosos el tamaño vuelve a crecer hasta el objetivo."""
+        inner = self.LimitedMemoryEmbedding(size=8, max_batch=100, calls=[])
+        embeddings = AdaptiveBatchEmbeddings(inner, batch_size=4, recovery_streak=2)
+        embeddings.batch_size = 1
+
+        embeddings.embed_documents([f"texto {i}" for i in range(8)])
+
+        assert inner.calls == [1, 1, 2, 2, 2]
+        assert embeddings.batch_size == 4
+
+    def test_other_errors_propagate(self):
+        """Los errores que no son de memoria no se reintentan."""
+        inner = DeterministicFakeEmbedding(size=8)
+        embeddings = AdaptiveBatchEmbeddings(inner, batch_size=4)
+
+        with patch.object(DeterministicFakeEmbedding, "embed_documents", side_effect=RuntimeError("device-side assert")):
+            with pytest.raises(RuntimeError, match="device-side assert"):
+                embeddings.embed_documents(["a", "b"])
+        assert embeddings.batch_size == 4
+
+
+class TestEmbeddingsModel:
+    """Tests de la configuración del modelo de embeddings local."""
+
+    @pytest.fixture(autouse=True)
+    def clear_model_cache(self):
+        """Cada test parte sin modelos cargados."""
+        faiss_store._create_local_embeddings.cache_clear()
+        yield
+        faiss_store._create_local_embeddings.cache_clear()
+
+    @pytest.mark.parametrize("use_gpu, device, wrapped", [(True, "cuda", True), (False, "cpu", False)])
+    def test_local_model_encode_kwargs(self, use_gpu, device, wrapped):
+        """El modelo local normaliza, devuelve numpy y solo se envuelve en GPU."""
+        with patch.object(faiss_store.settings, "use_local_models", True), \
+             patch.object(faiss_store.settings, "use_gpu", use_gpu), \
+             patch.object(faiss_store.settings, "embedding_device", "cuda"), \
+             patch.object(faiss_store, "HuggingFaceEmbeddings") as hf_embeddings:
+            embeddings = faiss_store.create_embeddings_model()
+
+        kwargs = hf_embeddings.call_args.kwargs
+        assert kwargs["model_kwargs"]["device"] == device
+        assert kwargs["encode_kwargs"]["normalize_embeddings"] is True
+        assert "convert_to_tensor" not in kwargs["encode_kwargs"]
+        assert "device" not in kwargs["encode_kwargs"]
+        assert isinstance(embeddings, AdaptiveBatchEmbeddings) is wrapped
+
+    def test_local_model_loaded_once_per_device(self, tmp_path):
+        """Varios vector stores comparten el modelo local; cambiar de dispositivo carga otro."""
+        with patch.object(faiss_store.settings, "use_local_models", True), \
+             patch.object(faiss_store.settings, "use_gpu", False), \
+             patch.object(faiss_store, "HuggingFaceEmbeddings") as hf_embeddings:
+            first = PropertyVectorStore(index_path=str(tmp_path / "a"))
+            second = PropertyVectorStore(index_path=str(tmp_path / "b"))
+            assert first.embeddings is second.embeddings
+            assert hf_embeddings.call_count == 1
+
+            with patch.object(faiss_store.settings, "use_gpu", True), \
+                 patch.object(faiss_store.settings, "embedding_device", "cuda"):
+                faiss_store.create_embeddings_model()
+            assert hf_embeddings.call_count == 2
+
+
+class TestIndexType:
+    """Tests del tipo de índice FAISS según el tamaño de la colección."""
+
+    def test_small_collection_uses_fp16_flat_scan(self, vector_store, sample_properties):
+        """Las colecciones pequeñas se recorren completas sobre vectores float16."""
+        import faiss
+
+        vector_store.load_properties_and_create_index(sample_properties)
+
+        index = vector_store.vector_store.index
+        assert isinstance(index, faiss.IndexScalarQuantizer)
+        assert index.sq.qtype == faiss.ScalarQuantizer.QT_fp16
+        assert index.metric_type == faiss.METRIC_INNER_PRODUCT
+
+    def test_large_collection_uses_hnsw_and_survives_reload(self, vector_store, sample_properties):
+        """Sobre el umbral se usa HNSW, que se conserva (con efSearch) al guardar y cargar."""
+        import faiss
+
+        with patch.object(faiss_store, "HNSW_MIN_VECTORS", 2):
+            vector_store.load_properties_and_create_index(sample_properties)
+        assert isinstance(vector_store.vector_store.index, faiss.IndexHNSWSQ)
+        vector_store.save_index()
+
+        loaded = PropertyVectorStore(embeddings=DeterministicFakeEmbedding(size=8),
+                                     index_path=vector_store.index_path)
+        assert loaded.load_index()
+        index = faiss.downcast_index(loaded.vector_store.index)
+        assert isinstance(index, faiss.IndexHNSWSQ)
+        assert index.hnsw.efSearch == faiss_store.HNSW_EF_SEARCH
+
+        document = loaded.create_documents_from_properties(sample_properties[2:])[0]
+        results = loaded.vector_store.similarity_search(document.page_content, k=1)
+        assert results[0].metadata["title"] == "Estudio en Ñuñoa"
+
+
+class TestSearch:
+    """Tests de búsqueda con similitud coseno."""
+
+    def test_exact_text_scores_cosine_one(self, vector_store, sample_properties):
+        """Buscar el texto exacto de un documento devuelve similitud coseno ~1 como primer resultado."""
+        vector_store.load_properties_and_create_index(sample_properties)
+        document = vector_store.create_documents_from_properties(sample_properties[:1])[0]
+
+        results = vector_store.search_properties(document.page_content, k=3, score_threshold=0.0)
+
+        top_document, similarity = results[0]
+        assert top_document.metadata["title"] == "Departamento en Providencia"
+        assert similarity == pytest.approx(1.0, abs=1e-2)
+        assert all(score <= similarity + 1e-6 for _, score in results)
+
+    def test_batch_search_matches_single_searches(self, vector_store, sample_properties):
+        """La búsqueda por lotes devuelve lo mismo que buscar cada consulta por separado."""
+        vector_store.load_properties_and_create_index(sample_properties)
+        queries = [doc.page_content for doc in vector_store.create_documents_from_properties(sample_properties)]
+
+        batch = vector_store.search_properties_batch(queries, k=2, score_threshold=0.0)
+        single = [vector_store.search_properties(query, k=2, score_threshold=0.0) for query in queries]
+
+        assert len(batch) == 3
+        for batch_results, single_results in zip(batch, single):
+            assert [doc.metadata["title"] for doc, _ in batch_results] == \
+                [doc.metadata["title"] for doc, _ in single_results]
+            assert [score for _, score in batch_results] == \
+                pytest.approx([score for _, score in single_results], abs=1e-5)
+
+    def test_batch_search_without_index(self, vector_store):
+        """Sin índice, cada consulta recibe una lista vacía."""
+        assert vector_store.search_properties_batch(["casa", "depto"]) == [[], []]
+
+    def test_legacy_l2_index_keeps_distance_transform(self, vector_store, sample_properties, tmp_path):
+        """Un índice L2 guardado antes del cambio sigue usando 1/(1+distancia)."""
+        from langchain_community.vectorstores import FAISS
+
+        documents = vector_store.create_documents_from_properties(sample_properties)
+        legacy_path = tmp_path / "legacy_index"
+        FAISS.from_documents(documents, vector_store.embeddings).save_local(str(legacy_path))
+
+        loaded = PropertyVectorStore(embeddings=vector_store.embeddings, index_path=str(legacy_path))
+        assert loaded.load_index()
+
+        results = loaded.search_properties(documents[1].page_content, k=1, score_threshold=0.0)
+        assert results[0][0].metadata["title"] == "Casa en Las Condes"
+        assert results[0][1] == pytest.approx(1.0)
+
+
+class TestEmbeddingCache:
+    """Tests del caché persistente de embeddings."""
+
+    def test_rebuild_only_embeds_new_texts(self, vector_store, sample_properties):
+        """Al reconstruir, solo los textos nuevos pasan por el modelo."""
+        vector_store.load_properties_and_create_index(sample_properties[:2])
+        cache_file = Path(vector_store.index_path) / EMBEDDING_CACHE_FILE
+        assert cache_file.exists()
+
+        with patch.object(DeterministicFakeEmbedding, "embed_documents",
+                          autospec=True,
+                          side_effect=DeterministicFakeEmbedding.embed_documents) as embed_documents:
+            vector_store.load_properties_and_create_index(sample_properties)
+
+        embed_documents.assert_called_once()
+        assert len(embed_documents.call_args.args[1]) == 1
+        assert "Estudio en Ñuñoa" in embed_documents.call_args.args[1][0]
+        assert vector_store.vector_store.index.ntotal == 3
+
+    def test_cache_written_in_background_during_index_build(self, vector_store, sample_properties):
+        """El caché se escribe en otro hilo y está completo al terminar la construcción del índice."""
+        import threading
+
+        writer_threads = []
+        save = PropertyVectorStore._save_embedding_cache
+
+        def recording_save(cache_path, cache):
+            writer_threads.append(threading.current_thread().name)
+            save(cache_path, cache)
+
+        with patch.object(PropertyVectorStore, "_save_embedding_cache", side_effect=recording_save):
+            vector_store.load_properties_and_create_index(sample_properties)
+
+        assert writer_threads == ["embedding-cache-writer"]
+        cache_file = Path(vector_store.index_path) / EMBEDDING_CACHE_FILE
+        assert len(vector_store._load_embedding_cache(cache_file)) == 3
+
+    def test_cached_vectors_match_fresh_ones(self, vector_store):
+        """Los vectores del caché (float16) coinciden con los recién calculados."""
+        texts = ["Título: Casa", "Título: Departamento"]
+        fresh = vector_store._embed_with_cache(texts)
+        cached = vector_store._embed_with_cache(texts)
+
+        assert np.allclose(cached, fresh, atol=1e-2)
+
+    def test_unreadable_cache_is_ignored(self, vector_store):
+        """Un caché corrupto se ignora y se reemplaza."""
+        cache_file = Path(vector_store.index_path) / EMBEDDING_CACHE_FILE
+        cache_file.parent.mkdir(parents=True)
+        cache_file.write_bytes(b"no es un npz")
+
+        vectors = vector_store._embed_with_cache(["Título: Casa"])
+        vector_store._wait_for_cache_writer()
+
+        assert len(vectors) == 1
+        assert len(vector_store._load_embedding_cache(cache_file)) == 1
+
+
+class TestIndexCreation:
+    """Tests de creación del índice."""
+
+    def test_texts_embedded_in_single_call(self, vector_store, sample_properties):
+        """Todos los textos se embeben en una sola llamada y el índice queda alineado con la metadata."""
+        with patch.object(DeterministicFakeEmbedding, "embed_documents",
+                          autospec=True,
+                          side_effect=DeterministicFakeEmbedding.embed_documents) as embed_documents:
+            vector_store.load_properties_and_create_index(sample_properties)
+
+        embed_documents.assert_called_once()
+        texts = embed_documents.call_args.args[1]
+        assert len(texts) == 3
+        assert vector_store.vector_store.index.ntotal == 3
+        assert [m["title"] for m in vector_store.property_metadata] == [p.title for p in sample_properties]
+
+    def test_search_returns_indexed_document(self, vector_store, sample_properties):
+        """Un texto indexado se recupera a sí mismo con su metadata."""
+        vector_store.load_properties_and_create_index(sample_properties)
+        document = vector_store.create_documents_from_properties(sample_properties[1:2])[0]
+
+        results = vector_store.vector_store.similarity_search(document.page_content, k=1)
+
+        assert results[0].page_content == document.page_content
+        assert results[0].metadata["title"] == "Casa en Las Condes"
+
+    def test_texts_embedded_shortest_first_and_unpermuted(self, vector_store):
+        """Los textos se embeben ordenados por largo y cada vector vuelve a su texto original."""
+        texts = ["texto bastante más largo", "corto", "mediano texto"]
+        embeddings = DeterministicFakeEmbedding(size=8)
+
+        with patch.object(DeterministicFakeEmbedding, "embed_documents",
+                          autospec=True,
+                          side_effect=DeterministicFakeEmbedding.embed_documents) as embed_documents:
+            vectors = vector_store._embed_sorted_by_length(texts)
+
+        assert embed_documents.call_args.args[1] == ["corto", "mediano texto", "texto bastante más largo"]
+        assert vectors == embeddings.embed_documents(texts)
+
+
+class TestMetadataStorage:
+    """Tests de la metadata guardada en el docstore de FAISS y sus estadísticas."""
+
+    def test_save_and_load_round_trip_from_docstore(self, vector_store, sample_properties):
+        """La metadata se recupera del docstore al cargar, sin archivos aparte."""
+        vector_store.load_properties_and_create_index(sample_properties)
+        expected = vector_store.property_metadata
+        vector_store.save_index()
+
+        index_dir = Path(vector_store.index_path)
+        assert not (index_dir / "metadata.pkl").exists()
+        assert not (index_dir / "metadata.parquet").exists()
+
+        loaded = PropertyVectorStore(embeddings=DeterministicFakeEmbedding(size=8), index_path=str(index_dir))
+        assert loaded.load_index()
+        assert loaded.property_metadata == expected
+
+    def test_resave_over_loaded_index(self, vector_store, sample_properties):
+        """Guardar sobre un índice cargado (mapeado en memoria) no lo corrompe ni deja temporales."""
+        vector_store.load_properties_and_create_index(sample_properties)
+        vector_store.save_index()
+
+        loaded = PropertyVectorStore(embeddings=DeterministicFakeEmbedding(size=8),
+                                     index_path=vector_store.index_path)
+        assert loaded.load_index()
+        vector_store.load_properties_and_create_index(sample_properties[:2])
+        vector_store.save_index()
+
+        query = vector_store.create_documents_from_properties(sample_properties[2:])[0].page_content
+        assert loaded.search_properties(query, k=1, score_threshold=0.0)[0][0].metadata["title"] == "Estudio en Ñuñoa"
+        index_dir = Path(vector_store.index_path)
+        assert sorted(p.name for p in index_dir.iterdir() if p.name.startswith(".saving-")) == []
+
+        reloaded = PropertyVectorStore(embeddings=DeterministicFakeEmbedding(size=8),
+                                       index_path=vector_store.index_path)
+        assert reloaded.load_index()
+        assert reloaded.vector_store.index.ntotal == 2
+
+    def test_legacy_metadata_files_are_ignored_and_removed(self, vector_store, sample_properties):
+        """Los metadata.pkl/parquet de versiones anteriores no se leen y se borran al guardar."""
+        vector_store.load_properties_and_create_index(sample_properties)
+        vector_store.save_index()
+        index_dir = Path(vector_store.index_path)
+        with open(index_dir / "metadata.pkl", "wb") as f:
+            pickle.dump([{"title": "obsoleto"}], f)
+        (index_dir / "metadata.parquet").write_bytes(b"obsoleto")
+
+        loaded = PropertyVectorStore(embeddings=DeterministicFakeEmbedding(size=8), index_path=str(index_dir))
+        assert loaded.load_index()
+        assert loaded.property_metadata == vector_store.property_metadata
+
+        loaded.save_index()
+        assert not (index_dir / "metadata.pkl").exists()
+        assert not (index_dir / "metadata.parquet").exists()
+
+    def test_stats_after_load(self, vector_store, sample_properties):
+        """Las estadísticas de un índice cargado coinciden con las del índice recién creado."""
+        free = Property(
+            title="Sin precio",
+            url="https://www.assetplan.cl/arriendo/departamento/nunoa/5",
+            location="Providencia, Santiago",
+            price="",
+            price_uf=0.0
+        )
+        vector_store.load_properties_and_create_index(sample_properties + [free])
+        built_stats = vector_store.get_stats()
+        assert built_stats["price_coverage"] == {"with_price": 2, "without_price": 2}
+        assert built_stats["top_locations"]["Providencia, Santiago"] == 2
+
+        vector_store.save_index()
+        loaded = PropertyVectorStore(embeddings=DeterministicFakeEmbedding(size=8),
+                                     index_path=vector_store.index_path)
+        assert loaded.load_index()
+        loaded_stats = loaded.get_stats()
+
+        for key in ("property_types", "top_locations", "price_coverage"):
+            assert loaded_stats[key] == built_stats[key]
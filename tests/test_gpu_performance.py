@@ -8,8 +8,8 @@ import sys
 import time
 from pathlib import Path
 
-# Add src to Python path
-sys.path.insert(0, str(Path(__file__).parent / "src"))
+# Add project root to Python path
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
 
 def test_gpu_performance():
     """Test comparativo de rendimiento GPU vs CPU."""
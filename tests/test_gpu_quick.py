@@ -12,8 +12,8 @@ os.environ["USE_LOCAL_MODELS"] = "true"
 os.environ["USE_GPU"] = "true"
 os.environ["GPU_LAYERS"] = "35"
 
-# Add src to Python path
-sys.path.insert(0, str(Path(__file__).parent / "src"))
+# Add project root to Python path
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
 
 def test_gpu_quick():
     """Test rápido de GPU."""
@@ -0,0 +1,101 @@
+"""
+Tests para el fetcher HTTP de páginas de listado.
+"""
+import asyncio
+from unittest.mock import patch
+
+from aiohttp import web
+
+from src.scraper.infrastructure import http_fetcher
+from src.scraper.infrastructure.http_cache import HTTPCache
+from src.scraper.infrastructure.http_fetcher import HTMLFetcher, prefetch_html
+
+
+class TestHTMLFetcher:
+    """Tests del fetch concurrente con sesión compartida."""
+
+    def test_fetch_all_returns_bodies_and_none_on_errors(self):
+        """Páginas 200 devuelven HTML; errores HTTP devuelven None."""
+        async def listing(request):
+            return web.Response(text="<div data-building='1'></div>", content_type="text/html")
+
+        async def missing(request):
+            return web.Response(status=404)
+
+        async def scenario():
+            app = web.Application()
+            app.router.add_get("/listing", listing)
+            app.router.add_get("/missing", missing)
+            runner = web.AppRunner(app)
+            await runner.setup()
+            site = web.TCPSite(runner, "127.0.0.1", 0)
+            await site.start()
+            port = site._server.sockets[0].getsockname()[1]
+            base = f"http://127.0.0.1:{port}"
+            try:
+                async with HTMLFetcher(timeout=5) as fetcher:
+                    return base, await fetcher.fetch_all([f"{base}/listing", f"{base}/missing", f"{base}/listing"])
+            finally:
+                await runner.cleanup()
+
+        base, pages = asyncio.run(scenario())
+
+        assert pages == {f"{base}/listing": "<div data-building='1'></div>", f"{base}/missing": None}
+
+    def test_prefetch_without_aiohttp_is_empty(self):
+        """Sin aiohttp el fast-path se desactiva sin error."""
+        with patch.object(http_fetcher, "aiohttp", None):
+            assert prefetch_html(["https://www.assetplan.cl/arriendo/departamento"]) == {}
+
+    def test_conditional_get_serves_unchanged_pages_from_cache(self):
+        """Un 304 devuelve el HTML cacheado sin volver a descargarlo."""
+        requests_seen = []
+
+        async def listing(request):
+            requests_seen.append(request.headers.get("If-None-Match"))
+            if request.headers.get("If-None-Match") == '"v1"':
+                return web.Response(status=304)
+            return web.Response(text="<p>listado</p>", content_type="text/html", headers={"ETag": '"v1"'})
+
+        async def scenario(cache):
+            app = web.Application()
+            app.router.add_get("/listing", listing)
+            runner = web.AppRunner(app)
+            await runner.setup()
+            site = web.TCPSite(runner, "127.0.0.1", 0)
+            await site.start()
+            url = f"http://127.0.0.1:{site._server.sockets[0].getsockname()[1]}/listing"
+            try:
+                results = []
+                for _ in range(2):
+                    async with HTMLFetcher(timeout=5, cache=cache) as fetcher:
+                        results.append((await fetcher.fetch(url), set(fetcher.not_modified)))
+                return url, results
+            finally:
+                await runner.cleanup()
+
+        cache = HTTPCache(":memory:")
+        try:
+            url, results = asyncio.run(scenario(cache))
+        finally:
+            cache.close()
+
+        assert requests_seen == [None, '"v1"']
+        assert results == [("<p>listado</p>", set()), ("<p>listado</p>", {url})]
+
+
+class TestHTTPCache:
+    """Tests del almacenamiento de validadores HTTP."""
+
+    def test_pages_without_validators_are_not_stored(self, tmp_path):
+        """Sin ETag ni Last-Modified no hay forma de revalidar, así que no se guarda."""
+        cache = HTTPCache(tmp_path / "cache" / "http.sqlite")
+        try:
+            cache.store("https://a.cl", "<p>a</p>", None, None)
+            cache.store("https://b.cl", "<p>b</p>", None, "Wed, 21 Oct 2015 07:28:00 GMT")
+
+            assert cache.get("https://a.cl") is None
+            assert cache.conditional_headers("https://a.cl") == {}
+            assert cache.conditional_headers("https://b.cl") == {"If-Modified-Since": "Wed, 21 Oct 2015 07:28:00 GMT"}
+        finally:
+            cache.close()
@@ -0,0 +1,356 @@
+"""
+Tests para el logging estructurado del scraper.
+"""
+import json
+import logging
+
+from src.scraper.services.logging_config import StructuredFormatter
+
+
+def _make_record(msg="Mensaje ñandú", level=logging.INFO, exc_info=None, **extra):
+    """Crea un LogRecord con campos extra como lo haría logger.info(extra=...)."""
+    record = logging.LogRecord("scraper.test", level, __file__, 10, msg, None, exc_info, func="test_func")
+    record.__dict__.update(extra)
+    return record
+
+
+class TestStructuredFormatter:
+    """Tests del formateador JSON."""
+
+    def test_format_returns_json_string(self):
+        """format() devuelve str JSON con los campos base y extra."""
+        formatter = StructuredFormatter("test_service")
+        output = formatter.format(_make_record(event_type="scraping_start", url="https://test.com"))
+
+        assert isinstance(output, str)
+        log_obj = json.loads(output)
+        assert log_obj["service"] == "test_service"
+        assert log_obj["level"] == "INFO"
+        assert log_obj["message"] == "Mensaje ñandú"
+        assert log_obj["function"] == "test_func"
+        assert log_obj["extra"] == {"event_type": "scraping_start", "url": "https://test.com"}
+
+    def test_extra_keeps_insertion_order(self):
+        """Los campos extra conservan el orden en que se pasaron."""
+        formatter = StructuredFormatter()
+        keys = ["zeta", "alfa", "medio", "beta"]
+        output = formatter.format(_make_record(**{key: 1 for key in keys}))
+
+        assert list(json.loads(output)["extra"]) == keys
+
+    def test_timestamp_is_iso_utc_with_milliseconds(self):
+        """El timestamp es ISO-8601 UTC con milisegundos."""
+        formatter = StructuredFormatter()
+        record = _make_record()
+        record.created = 1700000000.25
+        record.msecs = 250.0
+
+        log_obj = json.loads(formatter.format(record))
+        assert log_obj["timestamp"] == "2023-11-14T22:13:20.250Z"
+
+    def test_format_bytes_is_utf8(self):
+        """format_bytes() devuelve UTF-8 sin escapar caracteres no ASCII."""
+        formatter = StructuredFormatter()
+        output = formatter.format_bytes(_make_record())
+
+        assert isinstance(output, bytes)
+        assert "ñandú".encode("utf-8") in output
+
+    def test_non_serializable_extra_is_stringified(self):
+        """Valores extra no serializables no rompen el formateo."""
+        formatter = StructuredFormatter()
+        log_obj = json.loads(formatter.format(_make_record(payload=object())))
+
+        assert log_obj["extra"]["payload"].startswith("<object object")
+
+    def test_exception_information(self):
+        """La información de excepción se incluye en el JSON."""
+        formatter = StructuredFormatter()
+        try:
+            raise ValueError("fallo")
+        except ValueError:
+            import sys
+            record = _make_record(level=logging.ERROR, exc_info=sys.exc_info())
+
+        log_obj = json.loads(formatter.format(record))
+        assert log_obj["exception"]["type"] == "ValueError"
+        assert log_obj["exception"]["message"] == "fallo"
+        assert "Traceback" in log_obj["exception"]["traceback"]
+
+
+class TestSetupLogging:
+    """Tests de configuración de handlers."""
+
+    def test_file_logging_goes_through_queue(self, tmp_path):
+        """Los registros se encolan y el listener los escribe al archivo."""
+        from logging.handlers import QueueHandler
+
+        from src.scraper.services.logging_config import (setup_logging,
+                                                         shutdown_logging)
+
+        log_file = tmp_path / "logs" / "scraper.log"
+        root_logger = logging.getLogger()
+        previous_handlers, previous_level = root_logger.handlers[:], root_logger.level
+        try:
+            logger = setup_logging(log_file=str(log_file), service_name="queue_test", enable_console=False)
+            assert any(isinstance(h, QueueHandler) for h in root_logger.handlers)
+
+            try:
+                raise RuntimeError("boom")
+            except RuntimeError as e:
+                logger.error_with_context("Fallo de prueba", e)
+            shutdown_logging()
+
+            log_obj = json.loads(log_file.read_text(encoding="utf-8").strip())
+            assert log_obj["message"] == "Fallo de prueba"
+            assert log_obj["exception"]["type"] == "RuntimeError"
+            assert log_obj["extra"]["service"] == "queue_test"
+        finally:
+            shutdown_logging()
+            root_logger.handlers[:] = previous_handlers
+            root_logger.setLevel(previous_level)
+
+
+    def test_invalid_level_rejected_before_handlers_change(self):
+        """Un nivel inválido falla sin tocar los handlers existentes."""
+        import pytest
+
+        from src.scraper.services.logging_config import setup_logging
+
+        root_logger = logging.getLogger()
+        previous_handlers = root_logger.handlers[:]
+
+        with pytest.raises(ValueError):
+            setup_logging(log_level="VERBOSE", enable_console=False)
+        assert root_logger.handlers == previous_handlers
+
+
+class TestRecordQueueHandler:
+    """Tests del handler que encola registros."""
+
+    def test_prepare_renders_message_at_call_time(self):
+        """El mensaje se formatea al encolar y conserva exc_info."""
+        import queue
+
+        from src.scraper.services.logging_config import RecordQueueHandler
+
+        handler = RecordQueueHandler(queue.Queue())
+        items = ["a"]
+        record = logging.LogRecord("scraper.test", logging.ERROR, __file__, 10, "items=%s", (items,), None)
+        record.exc_info = (ValueError, ValueError("fallo"), None)
+
+        prepared = handler.prepare(record)
+        items.append("b")
+
+        assert prepared.getMessage() == "items=['a']"
+        assert prepared.args is None
+        assert prepared.exc_info[0] is ValueError
+
+
+class TestBatchingQueueListener:
+    """Tests del listener que procesa registros en lotes."""
+
+    def test_drains_queued_records_in_one_batch(self):
+        """Los registros encolados se entregan en un solo lote a emit_batch."""
+        import queue
+
+        from src.scraper.services.logging_config import BatchingQueueListener
+
+        class BatchRecorder(logging.Handler):
+            def __init__(self):
+                super().__init__(logging.INFO)
+                self.batches = []
+
+            def emit(self, record):
+                self.batches.append([record])
+
+            def emit_batch(self, records):
+                self.batches.append(list(records))
+
+        class PlainRecorder(logging.Handler):
+            def __init__(self):
+                super().__init__()
+                self.records = []
+
+            def emit(self, record):
+                self.records.append(record)
+
+        log_queue = queue.SimpleQueue()
+        for i in range(5):
+            log_queue.put(_make_record(msg=f"registro {i}", level=logging.DEBUG if i == 0 else logging.INFO))
+
+        batching, plain = BatchRecorder(), PlainRecorder()
+        listener = BatchingQueueListener(log_queue, batching, plain, respect_handler_level=True)
+        listener.start()
+        listener.stop()
+
+        assert [[r.getMessage() for r in batch] for batch in batching.batches] == [
+            ["registro 1", "registro 2", "registro 3", "registro 4"]
+        ]
+        assert len(plain.records) == 5
+
+
+class TestBufferedRotatingFileHandler:
+    """Tests del handler de archivo con buffer."""
+
+    def test_buffers_until_flush_and_rolls_over(self, tmp_path):
+        """Los registros se acumulan en buffer y el archivo rota por tamaño."""
+        from src.scraper.services.logging_config import \
+            BufferedRotatingFileHandler
+
+        log_file = tmp_path / "scraper.log"
+        handler = BufferedRotatingFileHandler(str(log_file), maxBytes=2000, backupCount=2, flush_interval=60)
+        handler.setFormatter(StructuredFormatter())
+        try:
+            handler.handle(_make_record())
+            assert log_file.read_bytes() == b"", "No debe escribir antes del flush"
+
+            handler.flush()
+            assert json.loads(log_file.read_bytes())["message"] == "Mensaje ñandú"
+
+            for i in range(30):
+                handler.handle(_make_record(msg=f"registro {i}"))
+        finally:
+            handler.close()
+
+        assert (tmp_path / "scraper.log.1").exists()
+        assert log_file.stat().st_size < 2000
+        last_line = log_file.read_text(encoding="utf-8").strip().splitlines()[-1]
+        assert json.loads(last_line)["message"] == "registro 29"
+
+
+class TestScraperLoggerAdapter:
+    """Tests del adaptador con contexto."""
+
+    def test_process_merges_context_without_mutating_caller(self):
+        """El contexto del adaptador se agrega sin modificar el dict del llamador."""
+        from src.scraper.services.logging_config import ScraperLoggerAdapter
+
+        adapter = ScraperLoggerAdapter(logging.getLogger("scraper.test"), {"service": "scraper"})
+        caller_extra = {"event_type": "scraping_start", "service": "other"}
+
+        _, kwargs = adapter.process("msg", {"extra": caller_extra})
+
+        assert kwargs["extra"] == {"event_type": "scraping_start", "service": "scraper"}
+        assert caller_extra == {"event_type": "scraping_start", "service": "other"}
+
+        _, kwargs = adapter.process("msg", {})
+        assert kwargs["extra"] == {"service": "scraper"}
+
+    def test_process_without_context_is_passthrough(self):
+        """Sin contexto, los kwargs se devuelven sin cambios."""
+        from src.scraper.services.logging_config import ScraperLoggerAdapter
+
+        adapter = ScraperLoggerAdapter(logging.getLogger("scraper.test"))
+        kwargs = {"extra": {"a": 1}}
+
+        assert adapter.process("msg", kwargs) == ("msg", {"extra": {"a": 1}})
+
+    def test_event_messages(self, caplog):
+        """Los mensajes de eventos dependen del resultado."""
+        from src.scraper.services.logging_config import ScraperLoggerAdapter
+
+        adapter = ScraperLoggerAdapter(logging.getLogger("scraper.events"))
+        with caplog.at_level(logging.DEBUG, logger="scraper.events"):
+            adapter.scraping_end("https://test.com", 3, 1.5, success=True)
+            adapter.scraping_end("https://test.com", 0, 1.5, success=False)
+            adapter.property_extracted("https://test.com/1", 0.2, success=True)
+            adapter.property_extracted("https://test.com/2", 0.2, success=False)
+
+        assert [(r.levelno, r.getMessage()) for r in caplog.records] == [
+            (logging.INFO, "Scraping operation completed"),
+            (logging.INFO, "Scraping operation failed"),
+            (logging.DEBUG, "Property extracted"),
+            (logging.WARNING, "Property extraction failed"),
+        ]
+
+    def test_performance_metrics_extra(self, caplog):
+        """Las métricas se agregan al registro junto con el tipo de evento."""
+        from src.scraper.services.logging_config import ScraperLoggerAdapter
+
+        adapter = ScraperLoggerAdapter(logging.getLogger("scraper.metrics"), {"service": "scraper"})
+        metrics = {"requests_per_minute": 12.5, "success_rate": 0.9}
+        with caplog.at_level(logging.INFO, logger="scraper.metrics"):
+            adapter.performance_metrics(metrics)
+            adapter.performance_metrics({})
+            adapter.performance_metrics({"event_type": "custom_metrics"})
+
+        first, empty, custom = caplog.records
+        assert first.event_type == "performance_metrics"
+        assert first.requests_per_minute == 12.5
+        assert first.service == "scraper"
+        assert empty.event_type == "performance_metrics"
+        assert custom.event_type == "custom_metrics"
+        assert metrics == {"requests_per_minute": 12.5, "success_rate": 0.9}
+
+
+class TestBytesStreamHandler:
+    """Tests del handler de consola en bytes."""
+
+    def test_writes_bytes_to_binary_buffer(self):
+        """Escribe JSON en bytes directamente al buffer binario."""
+        import io
+
+        from src.scraper.services.logging_config import BytesStreamHandler
+
+        raw = io.BytesIO()
+        stream = io.TextIOWrapper(raw, encoding="utf-8")
+        handler = BytesStreamHandler(stream)
+        handler.setFormatter(StructuredFormatter())
+
+        handler.handle(_make_record())
+
+        assert json.loads(raw.getvalue())["message"] == "Mensaje ñandú"
+
+    def test_text_stream_fallback(self):
+        """Streams sin buffer binario usan la escritura de texto normal."""
+        import io
+
+        from src.scraper.services.logging_config import BytesStreamHandler
+
+        stream = io.StringIO()
+        handler = BytesStreamHandler(stream)
+        handler.setFormatter(StructuredFormatter())
+
+        handler.handle(_make_record())
+
+        assert json.loads(stream.getvalue())["message"] == "Mensaje ñandú"
+
+
+class TestLoggingMixin:
+    """Tests del mixin de logging."""
+
+    def test_instances_share_class_adapter(self):
+        """Todas las instancias de una clase comparten el mismo adaptador."""
+        from src.scraper.services.logging_config import LoggingMixin
+
+        class Component(LoggingMixin):
+            pass
+
+        first, second = Component(), Component()
+
+        assert first.logger is second.logger
+        assert first.logger.extra == {"component": "Component"}
+        assert "_logger" not in vars(first)
+
+
+class TestSeleniumLogging:
+    """Tests de configuración de loggers de Selenium."""
+
+    def test_level_applied_only_when_changed(self):
+        """El nivel se aplica una vez y se actualiza si cambia."""
+        from unittest.mock import patch
+
+        from src.scraper.services import logging_config
+
+        selenium_logger = logging.getLogger(logging_config._SELENIUM_LOGGERS[0])
+        with patch.object(logging_config, "_selenium_log_level", None):
+            logging_config.setup_selenium_logging("ERROR")
+            assert selenium_logger.level == logging.ERROR
+
+            with patch.object(logging.Logger, "setLevel") as set_level:
+                logging_config.setup_selenium_logging("ERROR")
+            set_level.assert_not_called()
+
+            logging_config.setup_selenium_logging("WARNING")
+            assert selenium_logger.level == logging.WARNING
@@ -231,5 +231,67 @@ class TestMultiTypologyPerformance:
         assert max(1, 10 // 3) == 3  # División normal
 
 
+class TestParallelBuildingExtraction:
+    """Tests del procesamiento concurrente de edificios con pool de drivers."""
+    
+    def test_parallel_drivers_spread_buildings(self):
+        """Cada edificio se procesa con un extractor propio y se respeta max_properties."""
+        config = ScrapingConfig(max_properties=4, max_typologies=3, parallel_drivers=2, save_raw_data=False)
+        buildings = [{"name": f"Building {i}"} for i in range(5)]
+        quotas = {}
+        
+        def process_building(building, max_props):
+            quotas[building["name"]] = max_props
+            return [building["name"]] * max_props
+        
+        def make_extractor(driver, base_url):
+            extractor = Mock()
+            extractor.driver = driver
+            extractor.collect_building_cards.return_value = buildings
+            extractor.process_building.side_effect = process_building
+            extractor.build_collection.side_effect = lambda props: PropertyCollection(
+                scraped_at="2023-01-01T00:00:00", total_count=len(props)
+            )
+            return extractor
+        
+        with patch('src.scraper.services.scraper_manager.DriverManager'), \
+                patch('src.scraper.services.scraper_manager.AsyncDriverPool') as pool_class, \
+                patch('src.scraper.infrastructure.http_fetcher.prefetch_html', return_value={}), \
+                patch('src.scraper.services.scraper_manager.AssetPlanExtractorV2', side_effect=make_extractor) as extractor_class:
+            pool = pool_class.return_value
+            pool.__aenter__.return_value = pool
+            pool.driver.side_effect = lambda: _async_driver_context(Mock(spec=WebDriver))
+            
+            manager = ScraperManager(config)
+            collection = manager._execute_scraping_workflow("https://test.com", None)
+        
+        assert pool_class.call_args.kwargs["size"] == 2
+        assert collection.total_count == 4
+        # Extractor principal + uno por edificio procesado (limitado por max_typologies)
+        assert extractor_class.call_count == 1 + 3
+        assert quotas == {"Building 0": 2, "Building 1": 1, "Building 2": 1}
+    
+    def test_single_typology_uses_sequential_path(self):
+        """Con una tipología no se crea pool aunque se pidan varios drivers."""
+        manager = ScraperManager.__new__(ScraperManager)
+        manager.config = ScrapingConfig(max_typologies=1, parallel_drivers=4)
+        
+        assert manager._parallel_driver_count() == 1
+        
+        manager.config = ScrapingConfig(max_typologies=3, parallel_drivers=8)
+        assert manager._parallel_driver_count() == 3
+
+
+def _async_driver_context(driver):
+    """Context manager asíncrono que entrega ``driver`` (simula AsyncDriverPool.driver)."""
+    from contextlib import asynccontextmanager
+    
+    @asynccontextmanager
+    async def context():
+        yield driver
+    
+    return context()
+
+
 if __name__ == "__main__":
-    pytest.main([__file__, "-v"])
\ No newline at end of file
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,18 @@
+"""
+Tests para PerformanceMonitor.
+"""
+from src.scraper.infrastructure.performance_monitor import PerformanceMonitor
+
+
+class TestPropertyRecording:
+    """Tests del registro de propiedades extraídas."""
+
+    def test_batch_recording_matches_single_recording(self):
+        """Registrar un lote equivale a registrar cada propiedad por separado."""
+        monitor = PerformanceMonitor()
+        monitor.record_property_scraped()
+        monitor.record_properties_scraped(4)
+        monitor.record_properties_scraped(0)
+
+        assert monitor.scraping_metrics.total_properties_scraped == 5
+        assert len(monitor.property_timestamps) == 5
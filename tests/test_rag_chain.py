@@ -0,0 +1,173 @@
+"""
+Tests de la cadena RAG con un LLM falso y embeddings deterministas (sin modelos reales).
+"""
+from unittest.mock import patch
+
+import pytest
+from langchain_core.embeddings import DeterministicFakeEmbedding
+from langchain_core.runnables import RunnableLambda
+
+from src.rag import property_rag_chain
+from src.rag.property_rag_chain import PropertyRAGChain, create_llm_model
+from src.scraper.models import Property
+from src.vectorstore.faiss_store import PropertyVectorStore
+
+
+def fake_llm(prompt):
+    """Responde con la última línea del prompt (la pregunta en el prompt RAG)."""
+    text = prompt.to_string()
+    if "falla" in text:
+        raise RuntimeError("LLM caído")
+    return text.splitlines()[-1]
+
+
+def sample_properties(count=3):
+    """Propiedades mínimas con URL, ubicación y precio."""
+    return [
+        Property(
+            title=f"Departamento {i}",
+            url=f"https://www.assetplan.cl/arriendo/departamento/santiago/{i}",
+            location="Santiago",
+            price_uf=2000.0 + i
+        )
+        for i in range(count)
+    ]
+
+
+@pytest.fixture
+def llm_prompts():
+    """Prompts recibidos por el LLM falso, en orden."""
+    return []
+
+
+@pytest.fixture
+def rag_chain(tmp_path, llm_prompts):
+    """Cadena RAG sobre tres propiedades indexadas con embeddings deterministas."""
+    store = PropertyVectorStore(
+        embeddings=DeterministicFakeEmbedding(size=8),
+        index_path=str(tmp_path / "faiss_index")
+    )
+    store.load_properties_and_create_index(sample_properties())
+
+    def llm(prompt):
+        llm_prompts.append(prompt.to_string())
+        return fake_llm(prompt)
+
+    return PropertyRAGChain(vector_store=store, llm=RunnableLambda(llm), retrieval_k=2)
+
+
+class TestAskQuestionsBatch:
+    """Tests de las preguntas en lote."""
+
+    def test_batch_matches_individual_answers(self, rag_chain):
+        """Cada respuesta del lote coincide, en orden, con la de preguntar por separado."""
+        questions = ["¿Hay departamentos?", "¿Cuál es el más barato?", "Muestra 1 departamento"]
+        rag_chain.answer_cache_size = 0
+
+        answers = rag_chain.ask_questions_batch(questions)
+
+        assert [a.model_dump() for a in answers] == [rag_chain.ask_question(q).model_dump() for q in questions]
+        assert answers[1].answer.endswith("¿Cuál es el más barato?")
+        assert answers[1].property_count == 2
+
+    def test_failed_question_does_not_affect_the_rest(self, rag_chain):
+        """Una pregunta que falla recibe una respuesta de error y las demás se responden."""
+        answers = rag_chain.ask_questions_batch(["¿Hay departamentos?", "esta falla"])
+
+        assert answers[0].query_type != "error"
+        assert answers[1].query_type == "error"
+        assert "LLM caído" in answers[1].answer
+
+    def test_empty_batch(self, rag_chain):
+        """Un lote vacío no llama a la cadena."""
+        assert rag_chain.ask_questions_batch([]) == []
+
+
+class TestAnswerCache:
+    """Tests de la caché de respuestas por pregunta."""
+
+    def test_repeated_question_skips_the_llm(self, rag_chain, llm_prompts):
+        """La misma pregunta se responde de la caché sin volver a llamar al LLM."""
+        first = rag_chain.ask_question("¿Hay departamentos?")
+        calls = len(llm_prompts)
+
+        second = rag_chain.ask_question("¿Hay departamentos?")
+
+        assert len(llm_prompts) == calls
+        assert second == first
+
+    def test_cached_answers_are_copies(self, rag_chain):
+        """Modificar una respuesta entregada (como recorta la API sus fuentes) no altera la caché."""
+        first = rag_chain.ask_question("¿Hay departamentos?")
+        first.sources.clear()
+
+        assert rag_chain.ask_question("¿Hay departamentos?").sources
+
+    def test_batch_uses_and_fills_the_cache(self, rag_chain, llm_prompts):
+        """El lote solo envía al LLM las preguntas que no están en caché, y guarda las nuevas."""
+        rag_chain.ask_question("¿Hay departamentos?")
+        llm_prompts.clear()
+
+        answers = rag_chain.ask_questions_batch(["¿Hay departamentos?", "¿Cuál es el más barato?"])
+
+        assert len(answers) == 2
+        assert not any("¿Hay departamentos?" in prompt for prompt in llm_prompts)
+        llm_prompts.clear()
+        rag_chain.ask_question("¿Cuál es el más barato?")
+        assert llm_prompts == []
+
+    def test_errors_are_not_cached(self, rag_chain, llm_prompts):
+        """Las respuestas de error se vuelven a intentar."""
+        rag_chain.ask_question("esta falla")
+        calls = len(llm_prompts)
+
+        rag_chain.ask_question("esta falla")
+
+        assert len(llm_prompts) > calls
+
+    def test_cache_is_cleared_when_index_is_rebuilt(self, rag_chain, llm_prompts):
+        """Reconstruir el índice invalida las respuestas guardadas."""
+        rag_chain.ask_question("¿Hay departamentos?")
+        rag_chain.vector_store.load_properties_and_create_index(sample_properties(2))
+        llm_prompts.clear()
+
+        answer = rag_chain.ask_question("¿Hay departamentos?")
+
+        assert llm_prompts
+        assert answer.property_count == 2
+
+    def test_least_recently_used_answer_is_evicted(self, rag_chain, llm_prompts):
+        """Con la caché llena se descarta la respuesta usada hace más tiempo."""
+        rag_chain.answer_cache_size = 1
+        rag_chain.ask_question("¿Hay departamentos?")
+        rag_chain.ask_question("¿Cuál es el más barato?")
+        llm_prompts.clear()
+
+        rag_chain.ask_question("¿Cuál es el más barato?")
+        assert llm_prompts == []
+        rag_chain.ask_question("¿Hay departamentos?")
+        assert llm_prompts
+
+
+class TestLocalLLM:
+    """Tests de la configuración del modelo GGUF local."""
+
+    @pytest.mark.parametrize("use_gpu", [True, False])
+    def test_llama_cpp_uses_configured_batch_and_threads(self, tmp_path, use_gpu):
+        """n_batch y n_threads vienen de la configuración, con o sin GPU."""
+        model_path = tmp_path / "modelo-Q4_K_M.gguf"
+        model_path.touch()
+        settings = property_rag_chain.settings
+        with patch.object(settings, "use_local_models", True), \
+             patch.object(settings, "use_gpu", use_gpu), \
+             patch.object(settings, "local_llm_model_path", str(model_path)), \
+             patch.object(settings, "local_llm_n_batch", 512), \
+             patch.object(settings, "local_llm_n_threads", 4), \
+             patch.object(property_rag_chain, "LlamaCpp") as llama_cpp:
+            create_llm_model()
+
+        kwargs = llama_cpp.call_args.kwargs
+        assert kwargs["model_path"] == str(model_path)
+        assert kwargs["n_batch"] == 512
+        assert kwargs["n_threads"] == 4
+        assert ("n_gpu_layers" in kwargs) is use_gpu
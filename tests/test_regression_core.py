@@ -202,6 +202,31 @@ class TestPropertyCollectionRegression:
         assert len(all_images) == 2, "Debe obtener imágenes de la tipología"
         assert all_images == ["img1.jpg", "img2.jpg"]
 
+    def test_typology_images_deduplicated(self):
+        """Las imágenes repetidas de una tipología se guardan una sola vez."""
+        typology = PropertyTypology(
+            typology_id="bed1_bath1_area50",
+            name="1 dormitorio 1 baño",
+            images=["img1.jpg", "img2.jpg", "img1.jpg"]
+        )
+        assert typology.images == ["img1.jpg", "img2.jpg"]
+
+    def test_collection_json_and_ndjson_dump(self, tmp_path):
+        """La serialización directa produce el mismo contenido que model_dump."""
+        import json
+        
+        collection = PropertyCollection(scraped_at="2023-01-01T00:00:00", source_url="https://test.com")
+        for i in range(3):
+            collection.properties.append(Property(title=f"Depto ñ {i}", url=f"https://test.com/{i}"))
+        collection.total_count = 3
+        
+        assert json.loads(collection.dump_json()) == collection.model_dump(mode='json')
+        
+        ndjson_path = tmp_path / "properties.ndjson"
+        assert collection.dump_ndjson(ndjson_path) == 3
+        lines = ndjson_path.read_bytes().splitlines()
+        assert [json.loads(line)["title"] for line in lines] == ["Depto ñ 0", "Depto ñ 1", "Depto ñ 2"]
+
 
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
\ No newline at end of file
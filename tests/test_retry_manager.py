@@ -0,0 +1,41 @@
+"""
+Tests para RetryManager.
+"""
+from unittest.mock import Mock
+
+import pytest
+
+from src.scraper.domain.retry_manager import RetryConfig, RetryManager
+
+
+def _fast_manager(max_attempts=3):
+    """RetryManager sin esperas entre intentos."""
+    return RetryManager(RetryConfig(max_attempts=max_attempts, base_delay=0, max_delay=0, jitter=False))
+
+
+class TestExceptionFilters:
+    """Tests de filtros retry_on / no_retry_on."""
+
+    @pytest.mark.parametrize("retry_on", [(ConnectionError,), [ConnectionError]])
+    def test_retryable_exception_is_retried(self, retry_on):
+        """Se reintenta con filtros en tupla o lista."""
+        func = Mock(side_effect=[ConnectionError("caído"), "ok"], __name__="func")
+
+        assert _fast_manager().execute_with_retry(func, retry_on=retry_on) == "ok"
+        assert func.call_count == 2
+
+    def test_no_retry_exception_fails_immediately(self):
+        """Las excepciones en no_retry_on no se reintentan."""
+        func = Mock(side_effect=ValueError("inválido"), __name__="func")
+
+        with pytest.raises(ValueError):
+            _fast_manager().execute_with_retry(func, retry_on=(Exception,), no_retry_on=(ValueError,))
+        assert func.call_count == 1
+
+    def test_exception_outside_retry_on_is_raised(self):
+        """Excepciones fuera de retry_on se propagan sin reintento."""
+        func = Mock(side_effect=KeyError("x"), __name__="func")
+
+        with pytest.raises(KeyError):
+            _fast_manager().execute_with_retry(func, retry_on=(ConnectionError,))
+        assert func.call_count == 1
@@ -0,0 +1,331 @@
+"""
+Tests para ScraperManager (sin lanzar navegador real).
+"""
+from unittest.mock import Mock, patch
+
+import pytest
+
+from src.scraper.services import scraper_manager
+from src.scraper.services.scraper_manager import (ScraperManager,
+                                                  ScrapingConfig,
+                                                  close_cached_drivers)
+
+
+@pytest.fixture
+def mock_driver_manager():
+    """DriverManager parcheado: cada instancia es un Mock distinto."""
+    with patch.object(scraper_manager, "DriverManager", side_effect=lambda **kwargs: Mock()) as driver_manager_class:
+        yield driver_manager_class
+
+
+class TestDriverReuse:
+    """Tests de reutilización del navegador entre ejecuciones."""
+
+    def test_driver_closed_on_stop_by_default(self, mock_driver_manager, monkeypatch):
+        """Sin SCRAPER_KEEP_DRIVER cada manager crea y cierra su driver."""
+        monkeypatch.delenv("SCRAPER_KEEP_DRIVER", raising=False)
+
+        first = ScraperManager(ScrapingConfig())
+        second = ScraperManager(ScrapingConfig())
+        first.stop()
+
+        assert first.driver_manager is not second.driver_manager
+        first.driver_manager.close.assert_called_once_with()
+
+    def test_cached_driver_reused_with_clean_session(self, mock_driver_manager, monkeypatch):
+        """Con SCRAPER_KEEP_DRIVER=1 el driver se reutiliza y se limpia la sesión."""
+        monkeypatch.setenv("SCRAPER_KEEP_DRIVER", "1")
+        try:
+            with ScraperManager(ScrapingConfig()) as first:
+                pass
+            with ScraperManager(ScrapingConfig()) as second:
+                pass
+            other_options = ScraperManager(ScrapingConfig(debug_mode=True))
+
+            assert second.driver_manager is first.driver_manager
+            first.driver_manager.close.assert_not_called()
+            first.driver_manager.reset_session.assert_called_once_with()
+            assert other_options.driver_manager is not first.driver_manager
+        finally:
+            close_cached_drivers()
+
+        first.driver_manager.close.assert_called_once_with()
+        assert scraper_manager._DRIVER_CACHE == {}
+
+
+class TestSaveCollection:
+    """Tests de guardado de la colección."""
+
+    def test_saved_file_matches_model_dump(self, mock_driver_manager, tmp_path):
+        """El JSON guardado es equivalente a model_dump(mode='json') y conserva UTF-8."""
+        import json
+
+        from src.scraper.models import Property, PropertyCollection
+
+        output_file = tmp_path / "out" / "properties.json"
+        collection = PropertyCollection(scraped_at="2024-01-01T00:00:00")
+        collection.properties.append(Property(title="Depto Ñuñoa", url="https://www.assetplan.cl/depto/1"))
+        collection.total_count = 1
+
+        manager = ScraperManager(ScrapingConfig(output_file=str(output_file)))
+        manager._save_collection(collection)
+
+        raw = output_file.read_bytes()
+        assert "Ñuñoa".encode("utf-8") in raw
+        assert json.loads(raw) == collection.model_dump(mode="json")
+
+    def test_failed_save_keeps_previous_file(self, mock_driver_manager, tmp_path):
+        """Si la serialización falla, el archivo anterior queda intacto y sin temporales."""
+        from src.scraper.models import PropertyCollection
+
+        output_file = tmp_path / "properties.json"
+        output_file.write_text('{"previo": true}', encoding="utf-8")
+        collection = PropertyCollection(scraped_at="2024-01-01T00:00:00")
+
+        manager = ScraperManager(ScrapingConfig(output_file=str(output_file)))
+        with patch.object(PropertyCollection, "dump_json", side_effect=RuntimeError("boom")):
+            manager._save_collection(collection)
+
+        assert output_file.read_text(encoding="utf-8") == '{"previo": true}'
+        assert list(tmp_path.iterdir()) == [output_file]
+
+    def test_small_collection_in_auto_mode_saves_json_only(self, mock_driver_manager, tmp_path):
+        """En modo auto, una colección pequeña se guarda solo como JSON."""
+        from src.scraper.models import PropertyCollection
+
+        output_file = tmp_path / "properties.json"
+        packb = Mock(return_value=b"packed")
+        manager = ScraperManager(ScrapingConfig(output_file=str(output_file)))
+        with patch.object(scraper_manager, "msgpack", Mock(packb=packb)):
+            manager._save_collection(PropertyCollection(scraped_at="2024-01-01T00:00:00"))
+
+        packb.assert_not_called()
+        assert list(tmp_path.iterdir()) == [output_file]
+
+    def test_large_collection_in_auto_mode_saves_msgpack_then_json(self, mock_driver_manager, tmp_path):
+        """En modo auto, una colección grande se guarda como msgpack y luego como JSON en segundo plano."""
+        import json
+        import threading
+
+        from src.scraper.models import Property, PropertyCollection
+
+        output_file = tmp_path / "properties.json"
+        collection = PropertyCollection(scraped_at="2024-01-01T00:00:00")
+        collection.properties.extend(
+            Property(title=f"Depto {i}", url=f"https://www.assetplan.cl/depto/{i}") for i in range(3)
+        )
+        collection.total_count = 3
+
+        expected = collection.model_dump(mode="json")
+
+        packb = Mock(return_value=b"packed")
+        manager = ScraperManager(ScrapingConfig(output_file=str(output_file)))
+        with patch.object(scraper_manager, "msgpack", Mock(packb=packb)), \
+             patch.object(scraper_manager, "_MSGPACK_THRESHOLD", 2):
+            manager._save_collection(collection)
+        # Modificar el resultado no afecta al JSON que se escribe en segundo plano
+        collection.properties.clear()
+        manager.stop()
+
+        packb.assert_called_once_with(expected, use_bin_type=True)
+        assert (tmp_path / "properties.msgpack").read_bytes() == b"packed"
+        assert json.loads(output_file.read_bytes()) == expected
+        assert not any(thread.name == "json-writer" for thread in threading.enumerate())
+
+    def test_msgpack_format_falls_back_to_json_without_msgpack(self, mock_driver_manager, tmp_path):
+        """Si msgpack no está instalado, output_format='msgpack' guarda JSON."""
+        from src.scraper.models import PropertyCollection
+
+        output_file = tmp_path / "properties.json"
+        manager = ScraperManager(ScrapingConfig(output_file=str(output_file), output_format="msgpack"))
+        with patch.object(scraper_manager, "msgpack", None):
+            manager._save_collection(PropertyCollection(scraped_at="2024-01-01T00:00:00"))
+
+        assert list(tmp_path.iterdir()) == [output_file]
+
+
+class TestRetryConfiguration:
+    """Tests de selección de estrategias de reintento."""
+
+    def test_named_and_unknown_strategies(self, mock_driver_manager):
+        """Los nombres conocidos usan su preset y los desconocidos caen en STANDARD."""
+        from src.scraper.domain.retry_manager import (CommonCircuitConfigs,
+                                                      CommonRetryConfigs)
+
+        manager = ScraperManager(ScrapingConfig(retry_strategy="patient", circuit_breaker_mode="sensitive"))
+        assert manager.retry_manager.retry_config is CommonRetryConfigs.PATIENT
+        assert manager.retry_manager.circuit_breaker.config is CommonCircuitConfigs.SENSITIVE
+
+        manager = ScraperManager(ScrapingConfig(retry_strategy="unknown", circuit_breaker_mode="unknown"))
+        assert manager.retry_manager.retry_config is CommonRetryConfigs.STANDARD
+        assert manager.retry_manager.circuit_breaker.config is CommonCircuitConfigs.STANDARD
+
+
+class TestProgressReporting:
+    """Tests del despacho de progreso en segundo plano."""
+
+    def test_slow_callback_does_not_block_reporting(self, mock_driver_manager):
+        """El callback corre en otro hilo y recibe todas las actualizaciones en orden."""
+        import threading
+
+        release = threading.Event()
+        received = []
+
+        def slow_callback(data):
+            release.wait(timeout=5)
+            received.append((data["message"], threading.current_thread().name))
+
+        manager = ScraperManager(ScrapingConfig())
+        manager._report_progress("uno", 10, slow_callback)
+        manager._report_progress("dos", 20, slow_callback)
+        assert received == []
+
+        release.set()
+        manager._progress_queue.join()
+        manager.stop()
+
+        assert received == [("uno", "scraper-progress"), ("dos", "scraper-progress")]
+        assert manager._progress_thread is None
+
+    def test_failing_callback_is_logged(self, mock_driver_manager):
+        """Un callback que falla no detiene el despacho de las siguientes actualizaciones."""
+        received = []
+
+        def callback(data):
+            if data["percentage"] == 0:
+                raise RuntimeError("boom")
+            received.append(data["message"])
+
+        manager = ScraperManager(ScrapingConfig())
+        with patch.object(manager.logger, "warning") as warning:
+            manager._report_progress("falla", 0, callback)
+            manager._report_progress("ok", 50, callback)
+            manager._progress_queue.join()
+        manager.stop()
+
+        assert received == ["ok"]
+        warning.assert_called_once_with("Progress callback failed: boom")
+
+
+class TestElapsedTime:
+    """Tests del cálculo de tiempo transcurrido."""
+
+    def test_elapsed_time_uses_monotonic_clock(self, mock_driver_manager):
+        """El tiempo transcurrido no depende del reloj de pared."""
+        manager = ScraperManager(ScrapingConfig())
+        assert manager._get_elapsed_time() == 0.0
+
+        with patch.object(scraper_manager.time, "monotonic", side_effect=[100.0, 102.5]):
+            manager._start_monotonic = scraper_manager.time.monotonic()
+            assert manager._get_elapsed_time() == 2.5
+
+
+class TestStatus:
+    """Tests de consulta de estado."""
+
+    def test_status_summaries_cached_briefly(self, mock_driver_manager):
+        """Consultas seguidas reutilizan los resúmenes hasta que vence el TTL."""
+        manager = ScraperManager(ScrapingConfig())
+
+        with patch.object(manager.retry_manager, "get_retry_statistics", return_value={"total_operations": 0}) as stats, \
+                patch.object(scraper_manager.time, "monotonic", side_effect=[10.0, 10.1, 10.5]):
+            first = manager.get_status()["retry_stats"]
+            second = manager.get_status()["retry_stats"]
+            assert stats.call_count == 1
+            manager.get_status()
+            assert stats.call_count == 2
+
+        assert first is second
+
+    def test_final_report_ignores_status_cache(self, mock_driver_manager):
+        """El reporte final recalcula los resúmenes aunque get_status los tenga en caché."""
+        manager = ScraperManager(ScrapingConfig())
+        manager.performance_monitor = Mock()
+        manager.performance_alerts = Mock(**{"check_alerts.return_value": []})
+
+        with patch.object(manager.retry_manager, "get_retry_statistics", return_value={"total_operations": 0}) as stats:
+            manager.get_status()
+            manager._log_final_performance_report()
+
+        assert stats.call_count == 2
+        assert manager.performance_monitor.get_performance_summary.call_count == 2
+
+
+class TestScrapingConfig:
+    """Tests de la configuración de scraping."""
+
+    def test_config_is_immutable(self):
+        """La configuración es inmutable y se derivan variantes con replace."""
+        import dataclasses
+
+        config = ScrapingConfig(max_properties=5)
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            config.max_properties = 10
+
+        variant = dataclasses.replace(config, debug_mode=True)
+        assert (variant.max_properties, variant.debug_mode) == (5, True)
+
+
+class TestFailureResults:
+    """Tests del resultado vacío ante errores."""
+
+    def test_failed_scrape_returns_empty_collection(self, mock_driver_manager):
+        """Un error en el workflow devuelve una colección vacía con timestamp ISO."""
+        from datetime import datetime
+
+        manager = ScraperManager(ScrapingConfig(save_raw_data=False))
+        with patch.object(manager.retry_manager, "execute_with_retry", side_effect=RuntimeError("boom")):
+            collection = manager.scrape_properties(base_url="https://test.com")
+
+        assert collection.total_count == 0
+        assert collection.source_url == "https://test.com"
+        assert abs((datetime.now() - datetime.fromisoformat(collection.scraped_at)).total_seconds()) < 5
+
+
+class TestParallelUrls:
+    """Tests del scraping de varias URLs en procesos separados."""
+
+    def test_urls_scraped_in_order_with_spawn_pool(self):
+        """Cada URL se procesa en el pool y los resultados mantienen el orden."""
+        from concurrent.futures import ThreadPoolExecutor
+
+        from src.scraper.models import PropertyCollection
+
+        pools = []
+
+        class FakeProcessPool(ThreadPoolExecutor):
+            def __init__(self, max_workers, mp_context):
+                pools.append((max_workers, mp_context.get_start_method()))
+                super().__init__(max_workers=max_workers)
+
+        def fake_worker(job):
+            url, max_properties = job
+            return PropertyCollection(scraped_at="2024-01-01T00:00:00", source_url=url, total_count=max_properties)
+
+        urls = ["https://www.assetplan.cl/arriendo/departamento/a", "https://www.assetplan.cl/arriendo/departamento/b"]
+        with patch.object(scraper_manager, "ProcessPoolExecutor", FakeProcessPool), \
+                patch.object(scraper_manager, "_scrape_url_worker", fake_worker):
+            results = scraper_manager.scrape_urls_parallel(urls, max_properties=3, workers=8)
+
+        assert [(c.source_url, c.total_count) for c in results] == [(urls[0], 3), (urls[1], 3)]
+        assert pools == [(2, "spawn")]
+        assert scraper_manager.scrape_urls_parallel([]) == []
+
+    def test_listing_base_url_reaches_extractor(self, mock_driver_manager):
+        """Una URL de listado de AssetPlan reemplaza la página de búsqueda por defecto."""
+        from src.scraper.models import PropertyCollection
+
+        config = ScrapingConfig(save_raw_data=False, fast_listing_fetch=False)
+        with patch.object(scraper_manager, "AssetPlanExtractorV2") as extractor_class:
+            extractor = extractor_class.return_value
+            extractor.base_url = "https://www.assetplan.cl"
+            extractor.search_url = "https://www.assetplan.cl/arriendo/departamento"
+            extractor.start_scraping.return_value = PropertyCollection(scraped_at="2024-01-01T00:00:00")
+
+            manager = ScraperManager(config)
+            manager._execute_scraping_workflow("https://www.assetplan.cl/arriendo/departamento/nunoa", None)
+            assert extractor.search_url == "https://www.assetplan.cl/arriendo/departamento/nunoa"
+
+            extractor.search_url = "https://www.assetplan.cl/arriendo/departamento"
+            manager._execute_scraping_workflow("https://www.assetplan.cl/propiedades", None)
+            assert extractor.search_url == "https://www.assetplan.cl/arriendo/departamento"
@@ -66,12 +66,12 @@ def main():
     
     test_results = []
     
-    # 1. Quick URL Test (our proven working test)
+    # 1. URL citation tests (one RAG chain shared by every question)
     test_results.append(
         run_command(
-            "python3 quick_url_test.py", 
-            "Test de Citación de URLs (Rápido)",
-            timeout_min=3
+            "python3 -m pytest -q test_url_citation_live.py", 
+            "Test de Citación de URLs",
+            timeout_min=5
         )
     )
     
@@ -84,16 +84,7 @@ def main():
         )
     )
     
-    # 3. Debug URL source test
-    test_results.append(
-        run_command(
-            "python3 debug_url_source.py", 
-            "Debug Origen URLs",
-            timeout_min=3
-        )
-    )
-    
-    # 4. GPU performance test
+    # 3. GPU performance test
     test_results.append(
         run_command(
             "python3 test_gpu_quick.py", 
@@ -113,7 +104,6 @@ def main():
     test_names = [
         "Citación URLs",
         "Anti-Overthinking", 
-        "Debug URLs",
         "GPU Performance"
     ]
     
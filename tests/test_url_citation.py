@@ -17,6 +17,10 @@ os.environ["GPU_LAYERS"] = "25"
 # Add project root to Python path
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
+# URLs de assetplan.cl y patrones de citación, compilados una vez
+URL_RE = re.compile(r'https://www\.assetplan\.cl/[^\s\)]*')
+CITATION_RE = re.compile(r'URL:|https://|assetplan\.cl|Ver propiedad', re.IGNORECASE)
+
 def test_url_citation():
     """Test para verificar que se citen las URLs originales."""
     print("🔗 TEST DE CITACIÓN DE URLs ORIGINALES")
@@ -56,20 +60,8 @@ def test_url_citation():
             response_text = answer.answer
             
             # Analizar URLs en la respuesta
-            # Buscar URLs de assetplan.cl
-            url_pattern = r'https://www\.assetplan\.cl/[^\s\)]*'
-            found_urls = re.findall(url_pattern, response_text)
-            
-            # Buscar patrones de citación
-            citation_patterns = [
-                r'URL:',
-                r'https://',
-                r'assetplan\.cl',
-                r'Ver propiedad'
-            ]
-            
-            citation_found = any(re.search(pattern, response_text, re.IGNORECASE) 
-                               for pattern in citation_patterns)
+            found_urls = URL_RE.findall(response_text)
+            citation_found = CITATION_RE.search(response_text) is not None
             
             # Mostrar respuesta
             print(f"💬 {response_text}")
@@ -0,0 +1,44 @@
+"""
+Tests de citación de URLs contra el RAG real (datos scrapeados + modelos locales).
+
+La cadena RAG (fixture ``rag_chain`` de conftest.py) se construye una sola vez por
+sesión y se comparte entre preguntas y archivos de test.
+"""
+import json
+import re
+
+import pytest
+
+from src.utils.config import settings
+
+pytestmark = [pytest.mark.integration, pytest.mark.slow]
+
+# URLs de propiedades de assetplan.cl dentro de una respuesta
+URL_RE = re.compile(r'https://www\.assetplan\.cl/[^\s)]*')
+
+QUESTIONS = [
+    "Muestra 1 departamento en Independencia con su URL",
+    "Muestra 1 departamento en Independencia",
+    "¿Hay propiedades de 1 dormitorio?",
+    "Dame la propiedad más barata",
+    "Muestra 1 departamento",
+]
+
+
+@pytest.mark.parametrize("question", QUESTIONS)
+def test_answer_cites_property_url(rag_chain, question):
+    """La respuesta cita al menos una URL original de assetplan.cl."""
+    answer = rag_chain.ask_question(question)
+
+    assert URL_RE.search(answer.answer), answer.answer
+
+
+def test_retrieved_documents_keep_scraped_urls(rag_chain):
+    """Los documentos recuperados traen en su metadata las URLs del JSON scrapeado."""
+    with open(settings.properties_json_path, "rb") as f:
+        scraped_urls = {prop["url"] for prop in json.load(f)["properties"]}
+
+    documents = rag_chain.retriever.invoke("departamento Independencia")
+
+    assert documents
+    assert all(doc.metadata["url"] in scraped_urls for doc in documents)
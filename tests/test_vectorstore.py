@@ -88,7 +88,7 @@ class TestPropertyVectorStore:
             "url": "https://test.com",
             "property_id": "123"
         }
-        mock_retriever.get_relevant_documents.return_value = [mock_doc]
+        mock_retriever.invoke.return_value = [mock_doc]
         mock_vector_store.get_retriever.return_value = mock_retriever
         
         # Mock classification chain
@@ -117,7 +117,7 @@ class TestPropertyVectorStore:
         """Test error handling in question answering."""
         # Make retriever raise an exception
         mock_retriever = Mock()
-        mock_retriever.get_relevant_documents.side_effect = Exception("Test error")
+        mock_retriever.invoke.side_effect = Exception("Test error")
         mock_vector_store.get_retriever.return_value = mock_retriever
         
         rag_chain = PropertyRAGChain(
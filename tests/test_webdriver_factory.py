@@ -0,0 +1,221 @@
+"""
+Tests para WebDriverFactory y DriverManager (sin lanzar navegador real).
+"""
+import asyncio
+import os
+from unittest.mock import Mock, patch
+
+import pytest
+from selenium.common.exceptions import WebDriverException
+
+from src.scraper.infrastructure.webdriver_factory import (AsyncDriverPool,
+                                                          DriverManager,
+                                                          WebDriverFactory)
+
+
+def _build_chrome_arguments(**kwargs):
+    """Crea un driver Chrome con webdriver parcheado y devuelve sus argumentos."""
+    with patch("src.scraper.infrastructure.webdriver_factory.webdriver.Chrome") as chrome, \
+            patch("src.scraper.infrastructure.webdriver_factory.Service"):
+        WebDriverFactory.create_chrome_driver(**kwargs)
+    return chrome.call_args.kwargs["options"].arguments
+
+
+class TestWebDriverFactory:
+    """Tests de construcción de argumentos de Chrome."""
+
+    def test_base_and_performance_arguments(self):
+        """Los argumentos fijos y de rendimiento se aplican desde las plantillas."""
+        arguments = _build_chrome_arguments(stealth_mode=False)
+
+        for arg in WebDriverFactory._BASE_CHROME_ARGS + WebDriverFactory._PERFORMANCE_CHROME_ARGS:
+            assert arg in arguments
+
+    def test_debug_mode_skips_performance_arguments(self):
+        """En modo debug no se aplican optimizaciones de rendimiento."""
+        arguments = _build_chrome_arguments(stealth_mode=False, debug_mode=True)
+
+        assert "--disable-images" not in arguments
+        assert "--no-sandbox" in arguments
+
+    def test_single_process_is_opt_in(self):
+        """--single-process solo se agrega cuando se solicita."""
+        assert "--single-process" not in _build_chrome_arguments(stealth_mode=False)
+        assert "--single-process" in _build_chrome_arguments(stealth_mode=False, single_process=True)
+
+    def test_javascript_enabled_unless_requested(self):
+        """--disable-javascript es opt-in y no rompe páginas renderizadas con JS."""
+        assert "--disable-javascript" not in _build_chrome_arguments(stealth_mode=False)
+        assert "--disable-javascript" in _build_chrome_arguments(stealth_mode=False, disable_js=True)
+        assert "--disable-javascript" not in _build_chrome_arguments(
+            stealth_mode=False, disable_js=True, debug_mode=True
+        )
+
+    def test_eager_page_load(self):
+        """El driver usa carga 'eager' sin comandos CDP extra."""
+        with patch("src.scraper.infrastructure.webdriver_factory.webdriver.Chrome") as chrome, \
+                patch("src.scraper.infrastructure.webdriver_factory.Service"):
+            driver = WebDriverFactory.create_chrome_driver(stealth_mode=False)
+
+        assert chrome.call_args.kwargs["options"].page_load_strategy == "eager"
+        driver.execute_cdp_cmd.assert_not_called()
+        driver.set_page_load_timeout.assert_called_once_with(20)
+
+    def test_wait_for_dom_content(self):
+        """Espera hasta que el documento esté parseado."""
+        driver = Mock()
+        driver.execute_script.side_effect = ["loading", "interactive"]
+
+        assert WebDriverFactory.wait_for_dom_content(driver, timeout=2) is True
+        assert driver.execute_script.call_count == 2
+
+    def test_custom_options(self):
+        """True genera un flag, valores falsy se omiten."""
+        arguments = _build_chrome_arguments(
+            stealth_mode=False,
+            custom_options={"lang": "es-CL", "incognito": True, "proxy-server": None, "kiosk": False}
+        )
+
+        assert "--lang=es-CL" in arguments
+        assert "--incognito" in arguments
+        assert not any(arg.startswith(("--proxy-server", "--kiosk")) for arg in arguments)
+
+    def test_connection_pool_resized(self):
+        """El pool HTTP hacia chromedriver se reconstruye con el tamaño pedido."""
+        from selenium.webdriver.remote.client_config import ClientConfig
+        from selenium.webdriver.remote.remote_connection import \
+            RemoteConnection
+        
+        executor = RemoteConnection(client_config=ClientConfig("http://127.0.0.1:9515"))
+        previous_pool = executor._conn
+        driver = Mock(command_executor=executor)
+        
+        WebDriverFactory._resize_connection_pool(driver, 32)
+        
+        assert executor._conn is not previous_pool
+        assert executor._conn.connection_pool_kw["maxsize"] == 32
+    
+    def test_connection_pool_size_is_opt_in(self):
+        """Sin tamaño explícito se mantiene el pool por defecto de Selenium."""
+        with patch.object(WebDriverFactory, "_resize_connection_pool") as resize:
+            _build_chrome_arguments(stealth_mode=False)
+            resize.assert_not_called()
+            _build_chrome_arguments(stealth_mode=False, connection_pool_size=8)
+            assert resize.call_args.args[1] == 8
+
+
+class TestDriverManager:
+    """Tests del ciclo de vida del driver."""
+
+    def test_user_data_dir_is_absolute_and_removed_on_close(self):
+        """El perfil de Chrome debe ser absoluto y limpiarse al cerrar."""
+        manager = DriverManager(driver_type="chrome")
+        user_data_dir = manager._user_data_dir
+
+        assert os.path.isabs(user_data_dir)
+        assert os.path.isdir(user_data_dir)
+
+        manager.close()
+        assert not os.path.exists(user_data_dir)
+
+    def test_restart_passes_user_data_dir(self):
+        """El reinicio del driver debe reutilizar el mismo perfil."""
+        manager = DriverManager(driver_type="chrome", headless=True)
+
+        with patch.object(WebDriverFactory, "create_chrome_driver") as create:
+            manager.get_driver()
+
+        create.assert_called_once_with(user_data_dir=manager._user_data_dir, headless=True)
+        manager.close()
+
+    def test_detail_extraction_keeps_javascript(self):
+        """La extracción de detalle mantiene JavaScript habilitado."""
+        with_details = DriverManager(driver_type="chrome", enable_detail_extraction=True, max_requests=50)
+        without_details = DriverManager(driver_type="chrome", enable_detail_extraction=False)
+
+        assert with_details.driver_options == {"disable_js": False}
+        assert with_details.max_requests == 50
+        assert without_details.driver_options == {"disable_js": True}
+        with_details.close()
+        without_details.close()
+
+    def test_health_check_skips_probe_between_intervals(self):
+        """Con session_id válido no se consulta al chromedriver en cada llamada."""
+        manager = DriverManager(driver_type="chrome")
+        manager.driver = Mock()
+        manager.driver.session_id = "abc"
+        type(manager.driver).title = property(Mock(side_effect=WebDriverException("dead")))
+
+        # Las primeras llamadas no hacen round-trip
+        for _ in range(manager._probe_interval - 1):
+            assert manager._should_restart_driver() is False
+
+        # La llamada N prueba el driver y detecta que está muerto
+        assert manager._should_restart_driver() is True
+        manager.driver = None
+        manager.close()
+
+    def test_health_check_detects_closed_session(self):
+        """Un session_id nulo fuerza el reinicio sin probe de red."""
+        manager = DriverManager(driver_type="chrome")
+        manager.driver = Mock()
+        manager.driver.session_id = None
+
+        assert manager._should_restart_driver() is True
+        manager.driver = None
+        manager.close()
+
+    def test_reset_session_clears_cookies_and_cache(self):
+        """Reutilizar el driver limpia cookies y caché HTTP."""
+        manager = DriverManager(driver_type="chrome")
+        driver = manager.driver = Mock()
+        
+        manager.reset_session()
+        
+        driver.delete_all_cookies.assert_called_once_with()
+        driver.execute_cdp_cmd.assert_called_once_with("Network.clearBrowserCache", {})
+        assert manager.driver is driver
+        manager.driver = None
+        manager.close()
+    
+    def test_reset_session_drops_dead_driver(self):
+        """Si el driver no responde se descarta para recrearlo."""
+        manager = DriverManager(driver_type="chrome")
+        manager.driver = Mock()
+        manager.driver.delete_all_cookies.side_effect = WebDriverException("dead")
+        
+        manager.reset_session()
+        
+        assert manager.driver is None
+        manager.close()
+
+
+class TestAsyncDriverPool:
+    """Tests del pool asíncrono de drivers."""
+
+    def test_pool_hands_out_distinct_drivers_and_reuses_them(self):
+        """Cada adquisición concurrente recibe un driver distinto y se reutilizan."""
+        async def scenario():
+            async with AsyncDriverPool(size=2) as pool:
+                first, second = await asyncio.gather(pool.acquire(), pool.acquire())
+                assert first is not second
+                await pool.release(first)
+                async with pool.driver() as again:
+                    assert again is first
+                await pool.release(second)
+            return pool
+
+        with patch.object(WebDriverFactory, "create_chrome_driver", side_effect=lambda **_: Mock()) as create:
+            pool = asyncio.run(scenario())
+
+        assert create.call_count == 2
+        assert all(manager.driver is None for manager in pool._managers)
+
+    def test_release_unknown_driver_fails(self):
+        """Liberar un driver ajeno al pool es un error."""
+        pool = AsyncDriverPool(size=1)
+        try:
+            with pytest.raises(ValueError):
+                asyncio.run(pool.release(Mock()))
+        finally:
+            asyncio.run(pool.close())